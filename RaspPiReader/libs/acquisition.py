@@ -0,0 +1,269 @@
+from math import nan
+from threading import Event
+from time import perf_counter
+
+from RaspPiReader import pool
+from RaspPiReader.libs.bus_metrics import bus_metrics
+from RaspPiReader.libs.clock import clock
+from RaspPiReader.libs.communication import dataReader, DeviceError
+from RaspPiReader.libs.data_store import SampleStore
+from RaspPiReader.libs.device_health import PORT
+from RaspPiReader.libs.sample_bus import merge_unsampled
+from RaspPiReader.libs.demo_data_reader import data as demo_data
+from RaspPiReader.libs.scheduler import DeadlineScheduler
+
+DEMO_INTERVAL = 0.001
+
+
+def read_groups(reader, groups):
+    """
+    Read groups with reader into {channel: raw_register}.
+    A slave that does not answer only loses its own groups: the rest of them are skipped for this
+    scan, which counts as one failure of the slave, and the slave is skipped while its circuit is
+    open (see DeviceHealth). The connection is only replaced when the port itself fails, at most
+    once per scan.
+    """
+    health = reader.health
+    raw_values = {}
+    if not health.allow(PORT):
+        return raw_values
+    reconnected = False
+    failed = set()
+    for group in groups:
+        if group.dev in failed or not health.allow(group.dev):
+            continue
+        try:
+            raw_values.update(reader.readGroup(group))
+        except DeviceError as e:
+            failed.add(group.dev)
+            backoff = health.failure(group.dev)
+            if backoff is not None:
+                print(f"Device {group.dev} is not responding, skipping it for {backoff:g} s.\n" + str(e))
+            continue
+        except Exception as e:
+            print(f"Failed to read data from device {group.dev}.\n" + str(e))
+            if not reconnected:
+                reconnected = True
+                try:
+                    print("Restarting data reader")
+                    reader.reconnect()
+                    print('Restart successful')
+                    continue
+                except Exception as e:
+                    print(f"Restart failed {group.dev}.\n" + str(e))
+            backoff = health.failure(PORT)
+            if backoff is not None:
+                print(f"Port is down, retrying in {backoff:g} s.")
+            break
+        if health.success(group.dev):
+            print(f"Device {group.dev} is responding again.")
+        health.success(PORT)
+    return raw_values
+
+
+class CycleMetrics:
+    """
+    Cure metrics derived from the sample stream:
+    minutes the core temperature spent at or above its setpoint, and the core temperature
+    right before the pressure started to drop. Unsampled (nan) values leave the metrics as they are.
+    """
+
+    def __init__(self, core_temp_channel=None, pressure_channel=None, core_temp_setpoint=None):
+        self.core_temp_channel = core_temp_channel
+        self.pressure_channel = pressure_channel
+        self.core_temp_setpoint = core_temp_setpoint
+        self.core_temp_above_setpoint_time = 0
+        self.pressure_drop_core_temp = None
+        self.core_temp_above_setpoint_start_time = None
+        self.pressure_drop_flag = False
+        self.last_row = None
+
+    # what update() carries from one row to the next
+    STATE = ('core_temp_above_setpoint_time', 'pressure_drop_core_temp', 'core_temp_above_setpoint_start_time',
+             'pressure_drop_flag', 'last_row')
+
+    @classmethod
+    def from_config(cls):
+        return cls(core_temp_channel=pool.config('core_temp_channel', int),
+                   pressure_channel=pool.config('pressure_channel', int),
+                   core_temp_setpoint=pool.config('core_temp_setpoint', int))
+
+    def state(self):
+        """JSON-able snapshot of the metrics, from which restore() continues them after a restart."""
+        state = {name: getattr(self, name) for name in self.STATE}
+        if state['last_row'] is not None:
+            state['last_row'] = [float(value) for value in state['last_row']]
+        return state
+
+    def restore(self, state):
+        for name in self.STATE:
+            if name in state:
+                setattr(self, name, state[name])
+
+    def update(self, row):
+        """row: [process_time, v1, ... , vN, sampling_time(epoch)]"""
+        if self.core_temp_channel is None:
+            return
+        sampling_time = row[-1]
+        core_temp = row[self.core_temp_channel]
+        if not self.core_temp_above_setpoint_start_time and core_temp >= self.core_temp_setpoint:
+            self.core_temp_above_setpoint_start_time = sampling_time
+        elif self.core_temp_above_setpoint_start_time and core_temp < self.core_temp_setpoint:
+            self.core_temp_above_setpoint_time += round(
+                (sampling_time - self.core_temp_above_setpoint_start_time) / 60, 2)
+            self.core_temp_above_setpoint_start_time = None
+
+        # last_row holds the latest sampled value of every channel
+        last_row = self.last_row
+        pressure = row[self.pressure_channel]
+        if pressure != pressure:
+            pass
+        elif last_row is not None and last_row[self.pressure_channel] > pressure:
+            if not self.pressure_drop_flag:
+                self.pressure_drop_core_temp = last_row[self.core_temp_channel]
+                self.pressure_drop_flag = True
+        else:
+            self.pressure_drop_flag = False
+        self.last_row = row if last_row is None else merge_unsampled(row, last_row)
+
+
+class CycleRecorder:
+    """
+    Sample bus subscriber that records a cycle from a shared producer: data_stack's process time
+    is counted from the cycle's start_time, the row goes to data_stack, the metrics and every
+    sample sink, and on_sample is called, as Acquisition does with the rows it reads itself.
+    With a compressor (see compression.RowCompressor) the metrics still get every row, data_stack
+    and the sinks only the compressed ones; flush() records the rows it still holds. data_stack's
+    latest() values still follow every row, for the live displays.
+    """
+
+    def __init__(self, data_stack, start_time, metrics=None, sample_sinks=(), on_sample=None, compressor=None):
+        self.data_stack = data_stack
+        self.start_time = start_time
+        self.metrics = metrics
+        self.sample_sinks = tuple(sample_sinks)
+        self.on_sample = on_sample
+        self.compressor = compressor
+        if data_stack is not None:
+            data_stack.set_start_time(start_time)
+
+    def __call__(self, row):
+        if self.metrics:
+            self.metrics.update(row)
+        if not self.compressor:
+            self.record((row,))
+            return
+        if self.data_stack is not None:
+            self.data_stack.observe(row)
+        # notified for the live values even when no row is released
+        self.record(self.compressor.push(row), notify=True)
+
+    def record(self, rows, notify=False):
+        for row in rows:
+            if self.data_stack is not None:
+                self.data_stack.append(row)
+            for sink in self.sample_sinks:
+                sink(row)
+        if (rows or notify) and self.on_sample:
+            self.on_sample()
+
+    def flush(self):
+        if self.compressor:
+            self.record(self.compressor.flush())
+
+
+class Acquisition:
+    """
+    Reads one scan of the planned channels per tick and appends it to data_stack as
+    [process_time(minutes), v1, ... , vN, sampling_time(epoch)]. The sampling time comes from the
+    monotonic-anchored clock; the process time is left nan in the row, the store derives it from
+    start_time (and the CSV writer from the cycle start). Each row is then handed to
+    the metrics and to every sample sink; on_sample is called last (e.g. to notify a GUI).
+    Channels with a sampling period longer than the interval are only read on some ticks
+    (see ReadSchedule) and are UNSAMPLED_VALUE (nan) in the other rows.
+    data_stack may be None for a producer that only feeds sinks (e.g. SampleBus.publish).
+    """
+
+    def __init__(self, channel_plan, data_stack, interval, start_time, metrics=None, sample_sinks=(),
+                 on_sample=None, stop_event=None, lock=None, label='cycle'):
+        self.channel_plan = channel_plan
+        self.data_stack = data_stack
+        self.interval = interval
+        self.start_time = start_time
+        self.metrics = metrics
+        self.sample_sinks = tuple(sample_sinks)
+        self.on_sample = on_sample
+        self.stop_event = stop_event or Event()
+        if isinstance(data_stack, SampleStore):
+            data_stack.set_start_time(start_time)
+        self.lock = lock
+        self.label = label  # scan statistics name in bus_metrics
+        self.schedule = channel_plan.read_schedule(interval)
+        self.scans = 0
+        self.demo = pool.get('demo')
+        self.demo_index = 0
+
+    def stop(self):
+        self.stop_event.set()
+
+    def read_scan(self):
+        if self.demo:
+            demo_row = demo_data[self.demo_index]
+            self.demo_index += 1
+            active = set(self.channel_plan.active_channels)
+            # channels beyond the demo file's columns replay its columns again
+            return [float(demo_row[(i - 1) % len(demo_row)]) if i in active else 0.00
+                    for i in range(1, self.channel_plan.channel_count + 1)]
+
+        scan = self.next_scan()
+        groups = self.schedule.due_groups(scan)
+        raw_values = {}
+        if groups:
+            started = perf_counter()
+            if self.lock:
+                self.lock.acquire()
+            try:
+                raw_values = read_groups(dataReader, groups)
+            finally:
+                if self.lock:
+                    self.lock.release()
+            bus_metrics.record_scan(self.label, perf_counter() - started, self.interval)
+        return self.channel_plan.convert_scan(raw_values, self.schedule.due(scan))
+
+    def next_scan(self):
+        scan = self.scans
+        self.scans += 1
+        return scan
+
+    def has_data(self):
+        return not self.demo or self.demo_index < len(demo_data)
+
+    def process(self, values):
+        # the process time is derived from the sampling time where it is needed (SampleStore, CSV)
+        row = [nan] + values + [clock.time()]
+        if self.data_stack is not None:
+            self.data_stack.append(row)
+        self.deliver(row)
+        if self.on_sample:
+            self.on_sample()
+        return row
+
+    def deliver(self, row):
+        if self.metrics:
+            self.metrics.update(row)
+        for sink in self.sample_sinks:
+            sink(row)
+
+    def run(self):
+        scheduler = DeadlineScheduler(DEMO_INTERVAL if self.demo else self.interval, self.stop_event)
+        while not self.stop_event.is_set() and self.has_data():
+            self.process(self.read_scan())
+            scheduler.wait()
+
+        if scheduler.overruns and not self.demo:
+            print(f"Read loop overran its interval {scheduler.overruns} times, "
+                  f"{scheduler.missed_ticks} samples missed.")
+        try:
+            dataReader.stop()
+        except:
+            print('unable to stop data reader')
@@ -0,0 +1,81 @@
+from multiprocessing import get_context
+
+from RaspPiReader import pool
+from RaspPiReader.libs.acquisition import Acquisition
+from RaspPiReader.libs.async_acquisition import reader_class
+from RaspPiReader.libs.communication import dataReader
+from RaspPiReader.libs.shared_ring import SharedRing, RING_CAPACITY
+
+POLL_INTERVAL = 0.05
+
+
+def run_acquisition_process(ring_name, n_columns, capacity, channel_plan, interval, start_time, stop_event, demo):
+    """Entry point of the acquisition process: reads into the shared ring until stop_event is set."""
+    pool.set('demo', demo)
+    ring = SharedRing.attach(ring_name, n_columns, capacity)
+    try:
+        if not demo:
+            dataReader.start()
+        reader_class()(channel_plan, ring, interval, start_time, stop_event=stop_event).run()
+    finally:
+        ring.close()
+
+
+class ProcessAcquisition(Acquisition):
+    """
+    Acquisition that reads the devices in a separate process, so sample timing does not share the GIL
+    with the GUI. The process writes rows into a SharedRing; run() follows the ring from this process and
+    hands new rows to data_stack, metrics, sample sinks and on_sample, like Acquisition does.
+    The process owns the serial port while it runs.
+    """
+
+    def __init__(self, *args, poll_interval=POLL_INTERVAL, capacity=RING_CAPACITY, **kwargs):
+        super(ProcessAcquisition, self).__init__(*args, **kwargs)
+        self.poll_interval = poll_interval
+        self.capacity = capacity
+        self.lost = 0
+
+    def run(self):
+        # spawn: forking a process that runs Qt and other threads is not safe
+        context = get_context('spawn')
+        ring = SharedRing.create(self.channel_plan.channel_count + 2, self.capacity, readonly=True)
+        child_stop = context.Event()
+        process = context.Process(target=run_acquisition_process,
+                                  args=(ring.name, ring.n_columns, ring.capacity, self.channel_plan,
+                                        self.interval, self.start_time, child_stop, bool(self.demo)))
+        process.daemon = True
+        process.start()
+        seq = 0
+        try:
+            while True:
+                stopped = self.stop_event.wait(self.poll_interval)
+                if stopped:
+                    child_stop.set()
+                    process.join()
+                running = process.is_alive()
+                seq = self.drain(ring, seq)
+                if stopped or not running:
+                    break
+        finally:
+            child_stop.set()
+            process.join()
+            ring.close()
+
+        if self.lost:
+            print(f"Acquisition process outran the reader, {self.lost} samples lost.")
+
+    def drain(self, ring, seq):
+        blocks, seq, lost = ring.read(seq)
+        self.lost += lost
+        for block in blocks:
+            if self.data_stack is not None:
+                self.data_stack.extend(block)
+            for row in block.tolist():
+                self.deliver(row)
+        if blocks and self.on_sample:
+            self.on_sample()
+        return seq
+
+
+def acquisition_class():
+    return ProcessAcquisition if pool.config('acquisition_process', bool) else reader_class()
@@ -0,0 +1,107 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from RaspPiReader.libs.acquisition import Acquisition, read_groups, DEMO_INTERVAL
+from RaspPiReader.libs.bus_metrics import bus_metrics
+from RaspPiReader.libs.communication import load_bus_ports, get_bus_reader
+from RaspPiReader.libs.scheduler import DeadlineScheduler
+
+
+class Bus:
+    """
+    One serial line and the read groups polled on it.
+    pymodbus' serial client is blocking, so each bus gets a single worker thread that owns its client:
+    requests on one line stay sequential while the lines are polled concurrently.
+    """
+
+    def __init__(self, reader, groups):
+        self.reader = reader
+        self.groups = groups
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.last_duration = 0.0
+
+    def _start(self):
+        if not self.reader.is_open():
+            self.reader.start()
+
+    def _read(self, groups):
+        started = perf_counter()
+        with self.reader.lock:
+            raw_values = read_groups(self.reader, groups)
+        self.last_duration = perf_counter() - started
+        return raw_values
+
+    async def start(self):
+        try:
+            await asyncio.get_running_loop().run_in_executor(self.executor, self._start)
+        except Exception as e:
+            print(f"Failed to open port {self.reader.name}.\n" + str(e))
+
+    async def scan(self, groups):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, self._read, groups)
+
+    def stop(self):
+        if self.reader.client is not None:
+            try:
+                self.reader.stop()
+            except Exception:
+                print(f"unable to stop data reader on port {self.reader.name}")
+        self.executor.shutdown(wait=False)
+
+
+class AsyncAcquisition(Acquisition):
+    """
+    Acquisition over several serial lines (see the additional ports setting). Each tick all lines are
+    scanned at the same time on an asyncio loop and merged into one row, stamped when the slowest line
+    is done, so a scan takes as long as the busiest line instead of the sum of all of them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(AsyncAcquisition, self).__init__(*args, **kwargs)
+        bus_ports = load_bus_ports()
+        groups_by_port = {}
+        for group in self.channel_plan.read_groups:
+            groups_by_port.setdefault(bus_ports.get(group.dev), []).append(group)
+        self.buses = [Bus(get_bus_reader(port), groups) for port, groups in groups_by_port.items()]
+
+    async def read_scan_async(self):
+        if self.demo:
+            return self.read_scan()
+        scan = self.next_scan()
+        due = [(bus, self.schedule.due_groups(scan, bus.groups)) for bus in self.buses]
+        due = [(bus, groups) for bus, groups in due if groups]
+        raw_values = {}
+        if due:
+            started = perf_counter()
+            for values in await asyncio.gather(*(bus.scan(groups) for bus, groups in due)):
+                raw_values.update(values)
+            bus_metrics.record_scan(self.label, perf_counter() - started, self.interval)
+            for bus, groups in due:
+                bus_metrics.record_scan(f"{self.label} {bus.reader.name}", bus.last_duration, self.interval)
+        return self.channel_plan.convert_scan(raw_values, self.schedule.due(scan))
+
+    def run(self):
+        asyncio.run(self._run())
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        if not self.demo:
+            await asyncio.gather(*(bus.start() for bus in self.buses))
+        scheduler = DeadlineScheduler(DEMO_INTERVAL if self.demo else self.interval, self.stop_event)
+        try:
+            while not self.stop_event.is_set() and self.has_data():
+                self.process(await self.read_scan_async())
+                await loop.run_in_executor(None, scheduler.wait)
+        finally:
+            for bus in self.buses:
+                bus.stop()
+
+        if scheduler.overruns and not self.demo:
+            print(f"Read loop overran its interval {scheduler.overruns} times, "
+                  f"{scheduler.missed_ticks} samples missed.")
+
+
+def reader_class():
+    """Acquisition class for the configured buses: AsyncAcquisition when devices sit on more than one port."""
+    return AsyncAcquisition if load_bus_ports() else Acquisition
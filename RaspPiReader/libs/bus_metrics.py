@@ -0,0 +1,127 @@
+from bisect import bisect_left
+from threading import Lock
+
+# upper bucket edges in milliseconds, the last bucket takes everything above
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+OK = 'ok'
+TIMEOUT = 'timeout'
+INVALID = 'invalid'  # CRC / framing errors
+EXCEPTION = 'exception'  # Modbus exception response
+PORT_ERROR = 'port_error'
+OUTCOMES = (OK, TIMEOUT, INVALID, EXCEPTION, PORT_ERROR)
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of durations in seconds; recording is O(log buckets), no allocation."""
+
+    def __init__(self, buckets_ms=LATENCY_BUCKETS_MS):
+        self.edges = tuple(edge / 1000 for edge in buckets_ms)
+        self.counts = [0] * (len(self.edges) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        self.counts[bisect_left(self.edges, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p):
+        """Upper edge of the bucket holding the p-th percentile (max for the open last bucket)."""
+        if not self.count:
+            return 0.0
+        rank = p / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return min(self.edges[i], self.max) if i < len(self.edges) else self.max
+        return self.max
+
+
+class TransactionStats:
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.outcomes = dict.fromkeys(OUTCOMES, 0)
+
+
+class BusMetrics:
+    """
+    Modbus transaction and scan statistics of this process.
+    Transactions are keyed by (port, slave, register); scans by the acquisition's label, plus
+    "label port" per line of a multi-bus scan.
+    Writers are the acquisition threads, readers (snapshot) the status panel or anything else polling it.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.transactions = dict()
+            self.scans = dict()
+            self.intervals = dict()
+            self.overruns = dict()
+
+    def record_transaction(self, port, dev, addr, seconds, outcome):
+        with self._lock:
+            key = (port, dev, addr)
+            stats = self.transactions.get(key)
+            if stats is None:
+                stats = self.transactions[key] = TransactionStats()
+            stats.latency.record(seconds)
+            stats.outcomes[outcome] += 1
+
+    def record_scan(self, name, seconds, interval):
+        with self._lock:
+            histogram = self.scans.get(name)
+            if histogram is None:
+                histogram = self.scans[name] = LatencyHistogram()
+                self.overruns[name] = 0
+            histogram.record(seconds)
+            self.intervals[name] = interval
+            if interval and seconds > interval:
+                self.overruns[name] += 1
+
+    def snapshot(self):
+        """Plain dict of the current statistics, latencies in milliseconds."""
+        with self._lock:
+            transactions = []
+            for (port, dev, addr), stats in sorted(self.transactions.items(), key=lambda item: str(item[0])):
+                latency = stats.latency
+                transactions.append({
+                    'port': port, 'slave': dev, 'register': addr,
+                    'count': latency.count,
+                    'mean_ms': latency.mean * 1000,
+                    'p50_ms': latency.percentile(50) * 1000,
+                    'p95_ms': latency.percentile(95) * 1000,
+                    'max_ms': latency.max * 1000,
+                    'histogram': list(latency.counts),
+                    **stats.outcomes,
+                })
+            scans = []
+            for name, histogram in sorted(self.scans.items()):
+                interval = self.intervals[name]
+                scans.append({
+                    'name': name,
+                    'count': histogram.count,
+                    'interval_ms': interval * 1000,
+                    'mean_ms': histogram.mean * 1000,
+                    'p95_ms': histogram.percentile(95) * 1000,
+                    'max_ms': histogram.max * 1000,
+                    'utilisation': histogram.mean / interval if interval else 0.0,
+                    'overruns': self.overruns[name],
+                })
+            return {'buckets_ms': list(LATENCY_BUCKETS_MS), 'transactions': transactions, 'scans': scans}
+
+
+bus_metrics = BusMetrics()
@@ -0,0 +1,191 @@
+from collections import namedtuple
+from math import inf, nan
+
+import numpy as np
+
+from RaspPiReader import pool
+from RaspPiReader.libs.communication import plan_reads
+from RaspPiReader.ui.setting_form_handler import CHANNEL_COUNT, MAX_CHANNEL_COUNT
+
+ERROR_VALUE = -1000.00
+INACTIVE_VALUE = 0.00
+
+# Everything needed to turn a raw register into an engineering value, resolved once per cycle.
+# Scaling is folded into value = slope * temp + offset and only applies when temp >= input_low.
+# Converted values are clipped to [clip_low, clip_high], unbounded by default.
+# period: seconds between reads of the channel, 0 for every scan.
+ChannelSpec = namedtuple('ChannelSpec', ['channel', 'dev', 'register', 'decimals', 'divisor', 'signed',
+                                         'scaled', 'input_low', 'slope', 'offset', 'clip_low', 'clip_high',
+                                         'period'],
+                         defaults=(-inf, inf, 0.0))
+# value of a channel that was not read in a scan (see ChannelSpec.period)
+UNSAMPLED_VALUE = nan
+
+
+def load_channel_count():
+    return min(max(pool.config('channel_count', int) or CHANNEL_COUNT, 1), MAX_CHANNEL_COUNT)
+
+
+def load_active_channels(channel_count=None):
+    channel_count = channel_count or load_channel_count()
+    return [i for i in range(1, channel_count + 1) if pool.config('active' + str(i), bool)]
+
+
+def load_channel_labels(channel_count=None):
+    channel_count = channel_count or load_channel_count()
+    return [pool.config('label' + str(i)) for i in range(1, channel_count + 1)]
+
+
+def load_channel_spec(channel):
+    ch = str(channel)
+    decimals = pool.config('decimal_point' + ch, int) or 0
+    scaled = False
+    input_low = slope = offset = 0.0
+    if pool.config('scale' + ch, bool):
+        input_low = pool.config('limit_low' + ch, float)
+        input_high = pool.config('limit_high' + ch, float)
+        if input_high >= input_low + 10:
+            output_low = pool.config('min_scale_range' + ch, float)
+            output_high = pool.config('max_scale_range' + ch, float)
+            scaled = True
+            slope = (output_high - output_low) / (input_high - input_low)
+            offset = output_low - slope * input_low
+    return ChannelSpec(channel=channel,
+                       dev=int(pool.config('address' + ch), 16),
+                       register=int(pool.config('pv' + ch), 16),
+                       decimals=decimals,
+                       divisor=pow(10, decimals) if decimals > 0 else 1,
+                       signed=True,
+                       scaled=scaled,
+                       input_low=input_low,
+                       slope=slope,
+                       offset=offset,
+                       period=max(pool.config('sample_period' + ch, float) or 0.0, 0.0))
+
+
+class ChannelPlan:
+    """
+    Immutable acquisition plan for the active channels of one cycle.
+    The conversion coefficients of all specs are laid out as arrays once, so that a scan is
+    converted with a few numpy operations instead of Python arithmetic per channel.
+    """
+
+    def __init__(self, specs, active_channels=None, channel_count=CHANNEL_COUNT):
+        self.channel_count = channel_count
+        self.specs = tuple(specs)
+        # Active channels whose settings could not be compiled are reported as read errors.
+        if active_channels is None:
+            active_channels = [spec.channel for spec in self.specs]
+        self.active_channels = tuple(active_channels)
+        # channels with different periods are never read in the same request
+        self.read_groups = ()
+        self.group_periods = dict()
+        for period in sorted({spec.period for spec in self.specs}):
+            groups = plan_reads({spec.channel: (spec.dev, spec.register)
+                                 for spec in self.specs if spec.period == period})
+            self.read_groups += tuple(groups)
+            self.group_periods.update((group, period) for group in groups)
+
+        self.channels = tuple(spec.channel for spec in self.specs)
+        self._index = np.array([channel - 1 for channel in self.channels], dtype=np.intp)
+        # (raw ^ 0x8000) - 0x8000 is the two's complement of a 16 bit register, a 0 mask leaves it unsigned
+        self._sign_mask = np.array([0x8000 if spec.signed else 0 for spec in self.specs], dtype=np.int64)
+        self._divisor = np.array([spec.divisor for spec in self.specs], dtype=np.float64)
+        self._scaled = np.array([spec.scaled for spec in self.specs], dtype=bool)
+        self._any_scaled = bool(self._scaled.any())
+        self._input_low = np.where(self._scaled, [spec.input_low for spec in self.specs], inf)
+        self._slope = np.array([spec.slope for spec in self.specs], dtype=np.float64)
+        self._offset = np.array([spec.offset for spec in self.specs], dtype=np.float64)
+        self._round = np.array([pow(10, spec.decimals) for spec in self.specs], dtype=np.float64)
+        self._clip_low = np.array([spec.clip_low for spec in self.specs], dtype=np.float64)
+        self._clip_high = np.array([spec.clip_high for spec in self.specs], dtype=np.float64)
+        self._clipped = bool(np.isfinite(self._clip_low).any() or np.isfinite(self._clip_high).any())
+        # values of a scan where nothing was read
+        self._empty_scan = np.full(channel_count, INACTIVE_VALUE)
+        self._empty_scan[[channel - 1 for channel in self.active_channels]] = ERROR_VALUE
+
+    @classmethod
+    def from_config(cls, active_channels):
+        specs = []
+        for channel in active_channels:
+            try:
+                specs.append(load_channel_spec(channel))
+            except Exception as e:
+                print(f"Invalid settings for channel {channel}, channel will not be read.\n" + str(e))
+        return cls(specs, active_channels, load_channel_count())
+
+    def convert(self, raw):
+        """
+        Convert a vector of raw uint16 registers, one per spec in self.specs order, into values:
+        two's complement, decimal point, linear scaling (rounded to the channel's decimals)
+        and clipping.
+        """
+        raw = np.asarray(raw, dtype=np.int64)
+        temp = ((raw ^ self._sign_mask) - self._sign_mask) / self._divisor
+        if self._any_scaled:
+            # input_low is +inf on unscaled channels
+            scaled = np.round((self._slope * temp + self._offset) * self._round) / self._round
+            temp = np.where(temp >= self._input_low, scaled, temp)
+        if self._clipped:
+            temp = np.clip(temp, self._clip_low, self._clip_high)
+        return temp
+
+    def read_schedule(self, interval):
+        return ReadSchedule(self, interval)
+
+    def convert_scan(self, raw_values, due=None):
+        """
+        Convert a {channel: raw_register} scan into a value per channel (1..channel_count).
+        Active channels missing from raw_values get ERROR_VALUE, or UNSAMPLED_VALUE if they were
+        not due in this scan (due: bool per spec, see ReadSchedule.due).
+        """
+        values = self._empty_scan.copy()
+        if due is not None:
+            values[self._index[~due]] = UNSAMPLED_VALUE
+        if len(raw_values) == len(self.channels):
+            values[self._index] = self.convert([raw_values[channel] for channel in self.channels])
+        elif raw_values:
+            read = np.array([channel in raw_values for channel in self.channels], dtype=bool)
+            raw = [raw_values.get(channel, 0) for channel in self.channels]
+            values[self._index[read]] = self.convert(raw)[read]
+        return values.tolist()
+
+
+class ReadSchedule:
+    """
+    Interleaves channels of different periods on the bus timeline of one acquisition.
+    A group is read every `every` scans, its period rounded to whole scan intervals. Groups with the
+    same `every` are spread over different scans (phases), so slow reads do not all land on the same scan.
+    """
+
+    def __init__(self, channel_plan, interval):
+        self.groups = channel_plan.read_groups
+        self.every = dict()
+        self.phase = dict()
+        counts = dict()
+        for group in self.groups:
+            period = channel_plan.group_periods[group]
+            every = max(1, round(period / interval)) if interval and period > interval else 1
+            self.every[group] = every
+            self.phase[group] = counts.get(every, 0) % every
+            counts[every] = counts.get(every, 0) + 1
+        self.multi_rate = any(every > 1 for every in self.every.values())
+        # per spec, for ChannelPlan.convert_scan
+        group_of = {channel: group for group in self.groups for channel, offset in group.channels}
+        self._every = np.array([self.every[group_of[channel]] for channel in channel_plan.channels], dtype=np.int64)
+        self._phase = np.array([self.phase[group_of[channel]] for channel in channel_plan.channels], dtype=np.int64)
+
+    def is_due(self, group, scan):
+        return (scan - self.phase[group]) % self.every[group] == 0
+
+    def due_groups(self, scan, groups=None):
+        groups = self.groups if groups is None else groups
+        if not self.multi_rate:
+            return list(groups)
+        return [group for group in groups if self.is_due(group, scan)]
+
+    def due(self, scan):
+        """Bool per spec of the plan: is the channel read in this scan. None when every channel always is."""
+        if not self.multi_rate:
+            return None
+        return (scan - self._phase) % self._every == 0
@@ -0,0 +1,26 @@
+from datetime import datetime
+from time import monotonic, time
+
+
+class EpochClock:
+    """
+    Epoch seconds measured on the monotonic clock from one wall-clock reading taken at start,
+    so sample timestamps never step back or jump when the system time is adjusted (NTP, RTC sync
+    after boot on a Pi without a battery). Call anchor() to take a new wall-clock reading.
+    """
+
+    def __init__(self):
+        self.anchor()
+
+    def anchor(self):
+        self._monotonic = monotonic()
+        self._epoch = time()
+
+    def time(self):
+        return self._epoch + (monotonic() - self._monotonic)
+
+    def now(self):
+        return datetime.fromtimestamp(self.time())
+
+
+clock = EpochClock()
@@ -1,42 +1,116 @@
-import serial
-from pymodbus.client.sync import ModbusSerialClient as ModbusClient
+from threading import Lock
+from time import perf_counter
+
+from pymodbus.exceptions import ConnectionException, ModbusIOException
 
 from RaspPiReader import pool
-from RaspPiReader.ui.setting_form_handler import READ_HOLDING_REGISTERS, READ_INPUT_REGISTERS
+from RaspPiReader.libs.bus_metrics import bus_metrics, OK, TIMEOUT, INVALID, EXCEPTION, PORT_ERROR
+from RaspPiReader.libs.device_health import DeviceHealth
+from RaspPiReader.libs.transport import connection_pool, is_tcp
+from RaspPiReader.ui.setting_form_handler import READ_HOLDING_REGISTERS, READ_INPUT_REGISTERS, TRANSPORT_RTU
+
+# Modbus limits a single read request to 125 registers.
+MAX_REGISTERS_PER_READ = 125
+
+
+class DeviceError(Exception):
+    """A read failed at the slave (timeout, garbled or exception response) rather than at the port."""
+
+
+class ReadGroup:
+    """A contiguous register range on one slave, read with a single request."""
+
+    def __init__(self, dev, start_addr):
+        self.dev = dev
+        self.start_addr = start_addr
+        self.count = 0
+        self.channels = []  # [(channel, offset)]
+
+    def add(self, channel, addr):
+        offset = addr - self.start_addr
+        self.channels.append((channel, offset))
+        self.count = max(self.count, offset + 1)
+
+    def accepts(self, addr):
+        return addr <= self.start_addr + self.count \
+               and addr - self.start_addr < MAX_REGISTERS_PER_READ
+
+
+def plan_reads(channel_registers):
+    """
+    Group channels into block reads.
+    channel_registers: {channel: (slave_address, register_address)}
+    """
+    registers_by_dev = {}
+    for channel, (dev, addr) in channel_registers.items():
+        registers_by_dev.setdefault(dev, []).append((addr, channel))
+
+    groups = []
+    for dev in sorted(registers_by_dev):
+        group = None
+        for addr, channel in sorted(registers_by_dev[dev]):
+            if group is None or not group.accepts(addr):
+                group = ReadGroup(dev, addr)
+                groups.append(group)
+            group.add(channel, addr)
+    return groups
+
+
+def parse_bus_ports(text):
+    """
+    Parse the additional ports setting, "port: slave, slave; port: slave" with slave addresses in hex,
+    into {slave_address: port}.
+    """
+    bus_ports = {}
+    for entry in (text or '').split(';'):
+        if not entry.strip():
+            continue
+        port, _, devs = entry.rpartition(':')
+        for dev in devs.split(','):
+            if dev.strip():
+                bus_ports[int(dev, 16)] = port.strip()
+    return bus_ports
+
+
+def load_bus_ports():
+    try:
+        return parse_bus_ports(pool.config('bus_ports'))
+    except ValueError as e:
+        print('Invalid additional ports setting, all devices are read on the main port.\n' + str(e))
+        return {}
 
 
 class DataReader:
 
+    def __init__(self, port=None):
+        self.port = port  # None: the configured main port
+        self.client = None
+        self.lock = Lock()
+        self.health = DeviceHealth()
+
     def start(self):
-        port = pool.config('port')
-        baudrate = pool.config('baudrate', int)
-        bytesize = pool.config('databits', int)
-        parity = [k for k in serial.PARITY_NAMES if serial.PARITY_NAMES[k] == pool.config('parity')][0]
-        stopbits = pool.config('stopbits', float)
-        if stopbits % 1 == 0:
-            stopbits = int(stopbits)
-
-        self.client = ModbusClient(method='rtu',
-                                   port=port,
-                                   baudrate=baudrate,
-                                   bytesize=bytesize,
-                                   parity=parity,
-                                   stopbits=stopbits,
-                                   timeout=0.1
-                                   )
-
-        self.client.connect()
+        self.transport = pool.config('transport') or TRANSPORT_RTU
+        self.client = connection_pool.get(self.transport, self.port or pool.config('port'))
         read_type = pool.config('register_read_type')
         if read_type == READ_HOLDING_REGISTERS:
             self.read_method = self._read_holding_registers
         elif read_type == READ_INPUT_REGISTERS:
             self.read_method = self._read_input_registers
 
+    def stop(self):
+        # pooled TCP connections stay open, serial ports are closed
+        connection_pool.release(self.client)
 
+    def is_open(self):
+        return self.client is not None and self.client.is_socket_open()
 
-
-    def stop(self):
-        self.client.close()
+    def reconnect(self):
+        """Replace the connection with a new one, pooled or not."""
+        if self.client is not None:
+            connection_pool.discard(self.client)
+        self.start()
+        if not self.is_open():
+            raise ConnectionException(f"Failed to open {self.port or pool.config('port')}")
 
     def reload(self):
         try:
@@ -45,19 +119,69 @@ class DataReader:
             print('failed to stop data reader.' + str(e))
         self.start()
 
-    def _read_holding_registers(self, dev, addr):
-        reg = self.client.read_holding_registers(unit=dev, address=addr)
-        return reg.registers[0]
+    @property
+    def name(self):
+        return self.port or 'main'
 
-    def _read_input_registers(self, dev, addr):
-        reg = self.client.read_input_registers(unit=dev, address=addr)
-        return reg.registers[0]
+    def _read_registers(self, function, dev, addr, count):
+        started = perf_counter()
+        try:
+            try:
+                reg = getattr(self.client, function)(unit=dev, address=addr, count=count)
+            except ConnectionException:
+                if not is_tcp(self.transport):
+                    raise
+                # the peer dropped the connection (e.g. a gateway closing idle connections):
+                # retry once on a fresh connection instead of losing the sample
+                self.reconnect()
+                reg = getattr(self.client, function)(unit=dev, address=addr, count=count)
+        except Exception:
+            bus_metrics.record_transaction(self.name, dev, addr, perf_counter() - started, PORT_ERROR)
+            raise
+        bus_metrics.record_transaction(self.name, dev, addr, perf_counter() - started, self._outcome(dev, reg))
+        if reg.isError():
+            # no (valid) answer from the slave or an exception response: the port itself is fine
+            raise DeviceError(f"Device {dev}: {reg}")
+        return reg.registers
+
+    def _outcome(self, dev, reg):
+        if isinstance(reg, ModbusIOException):
+            # pymodbus lists the slaves whose last request got no bytes back at all;
+            # anything else that failed to decode is a CRC / framing error
+            no_response = getattr(self.client.transaction, '_no_response_devices', ())
+            return TIMEOUT if dev in no_response else INVALID
+        if reg.isError():
+            return EXCEPTION
+        return OK
+
+    def _read_holding_registers(self, dev, addr, count=1):
+        return self._read_registers('read_holding_registers', dev, addr, count)
+
+    def _read_input_registers(self, dev, addr, count=1):
+        return self._read_registers('read_input_registers', dev, addr, count)
 
     def readData(self, dev, addr):
-        return self.read_method(dev, addr)
+        return self.read_method(dev, addr)[0]
+
+    def readBlock(self, dev, addr, count):
+        return self.read_method(dev, addr, count)
+
+    def readGroup(self, group):
+        registers = self.readBlock(group.dev, group.start_addr, group.count)
+        return {channel: registers[offset] for channel, offset in group.channels}
 
     def writeData(self, dev, addr, data):
         self.client.write_register(unit=dev, address=addr, value=data)
 
 
 dataReader = DataReader()
+bus_readers = dict()
+
+
+def get_bus_reader(port):
+    """The shared reader of a serial port; None is the main port."""
+    if port is None:
+        return dataReader
+    if port not in bus_readers:
+        bus_readers[port] = DataReader(port)
+    return bus_readers[port]
@@ -0,0 +1,238 @@
+import argparse
+import csv
+from collections import deque
+from math import inf, nan
+
+import numpy as np
+
+from RaspPiReader import pool
+
+# Per channel storage modes (the texts of the settings' compression combo boxes)
+NONE = 'None'
+DEADBAND = 'Deadband'  # report by exception, the value holds until the next stored point
+SWINGING_DOOR = 'Swinging Door'  # values are linear between stored points
+MODES = (NONE, DEADBAND, SWINGING_DOOR)
+
+MAX_GAP = 600.0
+
+# title of the cycle info row that lists the channels' modes in a compressed CSV file
+CSV_INFO_TITLE = "Compression"
+
+
+class Deadband:
+    """
+    Stores a value when it differs from the last stored one by more than tolerance, or max_gap
+    seconds after it. Holding the last stored value reconstructs every value within tolerance.
+    """
+
+    def __init__(self, tolerance=0.0, max_gap=MAX_GAP):
+        self.tolerance = tolerance
+        self.max_gap = max_gap
+        self.value = None
+        self.time = None
+
+    def offer(self, index, t, value):
+        """[(index, stored)] of the points decided by this one."""
+        if self.value is None or abs(value - self.value) > self.tolerance or t - self.time >= self.max_gap:
+            self.value, self.time = value, t
+            return [(index, True)]
+        return [(index, False)]
+
+    def flush(self):
+        return []
+
+
+class SwingingDoor:
+    """
+    Stores the points where the value stops being a straight line, so that linear interpolation
+    between stored points reconstructs every value within tolerance. The door is the range of
+    slopes from the last stored point that pass within tolerance of every point since; a point
+    is dropped when the next one still falls inside the door, so each point is decided one point
+    late. A point is stored at least every max_gap seconds.
+    """
+
+    def __init__(self, tolerance=0.0, max_gap=MAX_GAP):
+        self.tolerance = tolerance
+        self.max_gap = max_gap
+        self.archive = None
+        self.pending = None
+        self.low = -inf
+        self.high = inf
+
+    def _store(self, t, value):
+        self.archive = (t, value)
+        self.low = -inf
+        self.high = inf
+
+    def offer(self, index, t, value):
+        """[(index, stored)] of the points decided by this one."""
+        if self.archive is None:
+            self._store(t, value)
+            return [(index, True)]
+        decisions = []
+        if self.pending is not None:
+            archive_t, archive_value = self.archive
+            dt = max(t - archive_t, 1e-9)
+            slope = (value - archive_value) / dt
+            if self.low <= slope <= self.high and dt < self.max_gap:
+                decisions.append((self.pending[0], False))
+            else:
+                pending_index, pending_t, pending_value = self.pending
+                decisions.append((pending_index, True))
+                self._store(pending_t, pending_value)
+        archive_t, archive_value = self.archive
+        dt = max(t - archive_t, 1e-9)
+        self.low = max(self.low, (value - self.tolerance - archive_value) / dt)
+        self.high = min(self.high, (value + self.tolerance - archive_value) / dt)
+        self.pending = (index, t, value)
+        return decisions
+
+    def flush(self):
+        """The last point is always stored."""
+        if self.pending is None:
+            return []
+        pending_index, pending_t, pending_value = self.pending
+        self.pending = None
+        self._store(pending_t, pending_value)
+        return [(pending_index, True)]
+
+
+COMPRESSORS = {DEADBAND: Deadband, SWINGING_DOOR: SwingingDoor}
+
+
+class RowCompressor:
+    """
+    Compresses [process_time, v1, ... , vN, sampling_time] rows: values of compressed channels
+    that are not stored become nan, and rows without any stored value are left out.
+    A row is released once every compressor has decided on its values, which for swinging door
+    channels is when the channel's next value arrives; flush() releases the rest at the end of a cycle.
+    compressors: {channel: compressor}, other channels are stored as they are.
+    """
+
+    def __init__(self, compressors, modes=None):
+        self.compressors = compressors
+        self.modes = modes
+        self.rows = deque()  # [row, undecided values]
+        self.first = 0  # index of self.rows[0]
+        self.count = 0
+
+    @classmethod
+    def from_config(cls, channel_plan):
+        """None when no channel is compressed."""
+        active = set(channel_plan.active_channels)
+        modes = [pool.config('compression' + str(i)) or NONE if i in active else NONE
+                 for i in range(1, channel_plan.channel_count + 1)]
+        return cls.from_modes(modes, active)
+
+    @classmethod
+    def from_modes(cls, modes, active_channels):
+        """
+        Compressor of the channels' given modes (e.g. a cycle log header's compression_modes),
+        with the configured tolerances; None when no channel is compressed.
+        """
+        if not modes or all(mode not in COMPRESSORS for mode in modes):
+            return None
+        max_gap = pool.config('compression_max_gap', float) or MAX_GAP
+        active = set(active_channels)
+        compressors = {}
+        for channel, mode in enumerate(modes, 1):
+            if channel not in active:
+                # constant, stored once and then every max_gap
+                compressors[channel] = Deadband(0.0, max_gap)
+            elif mode in COMPRESSORS:
+                tolerance = abs(pool.config('compression_tolerance' + str(channel), float) or 0.0)
+                compressors[channel] = COMPRESSORS[mode](tolerance, max_gap)
+        return cls(compressors, modes)
+
+    def push(self, row):
+        """The rows released by this one."""
+        row = list(row)
+        index = self.count
+        self.count += 1
+        entry = [row, 0]
+        self.rows.append(entry)
+        t = row[-1]
+        for channel, compressor in self.compressors.items():
+            value = row[channel]
+            if value != value:  # not sampled
+                continue
+            entry[1] += 1
+            for decided, stored in compressor.offer(index, t, value):
+                self._decide(decided, channel, stored)
+        return self._release()
+
+    def flush(self):
+        for channel, compressor in self.compressors.items():
+            for decided, stored in compressor.flush():
+                self._decide(decided, channel, stored)
+        return self._release()
+
+    def _decide(self, index, channel, stored):
+        entry = self.rows[index - self.first]
+        if not stored:
+            entry[0][channel] = nan
+        entry[1] -= 1
+
+    def _release(self):
+        released = []
+        while self.rows and not self.rows[0][1]:
+            row, _ = self.rows.popleft()
+            self.first += 1
+            if any(value == value for value in row[1:-1]):
+                released.append(row)
+        return released
+
+
+def reconstruct(x, y, mode):
+    """
+    y at every x from its stored (not nan) points: the last stored value for DEADBAND, linear
+    interpolation otherwise. nan before the first stored point, and after the last one unless held.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    stored = ~np.isnan(y)
+    if stored.all() or not stored.any():
+        return y
+    if mode == DEADBAND:
+        last = np.maximum.accumulate(np.where(stored, np.arange(len(y)), -1))
+        return np.where(last >= 0, y[np.maximum(last, 0)], nan)
+    return np.interp(x, x[stored], y[stored], left=nan, right=nan)
+
+
+def expand_csv(path, out_path):
+    """Write a copy of a compressed cycle CSV file with every blank value reconstructed."""
+    with open(path, newline='') as f:
+        rows = list(csv.reader(f))
+    modes = None
+    header = None
+    for i, row in enumerate(rows):
+        if row and row[0] == CSV_INFO_TITLE:
+            modes = row[1:]
+        elif row[:3] == ['Date', 'Time', 'Timer(min)']:
+            header = i
+            break
+    if header is None:
+        raise ValueError(f"{path} is not a cycle CSV file")
+    data = rows[header + 1:]
+    if modes and data:
+        values = np.array([[float(value) if value != '' else nan for value in row[2:]] for row in data])
+        for column, mode in enumerate(modes, 1):
+            values[:, column] = reconstruct(values[:, 0], values[:, column], mode)
+        data = [row[:2] + ['' if value != value else repr(value) for value in line]
+                for row, line in zip(data, values.tolist())]
+    with open(out_path, 'w', newline='') as f:
+        csv.writer(f).writerows(rows[:header + 1] + data)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reconstruct the values left out of a compressed cycle CSV file.")
+    parser.add_argument('path')
+    parser.add_argument('out_path', nargs='?', help="default: <path> with an '.expanded.csv' extension")
+    args = parser.parse_args(argv)
+    out_path = args.out_path or args.path.rsplit('.', 1)[0] + '.expanded.csv'
+    expand_csv(args.path, out_path)
+    print(f"Written {out_path}")
+
+
+if __name__ == '__main__':
+    main()
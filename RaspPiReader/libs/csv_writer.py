@@ -0,0 +1,161 @@
+import os
+from queue import Queue, Empty
+from threading import Thread, Event
+from time import localtime, strftime, monotonic
+
+from RaspPiReader import pool
+from RaspPiReader.libs.compression import CSV_INFO_TITLE
+
+DEFAULT_FLUSH_ROWS = 50
+DEFAULT_FLUSH_INTERVAL = 10.0
+
+_STOP = object()
+
+
+def cycle_file_name(order_id, start_time):
+    """Name of the cycle folder and of the files in it."""
+    return order_id + start_time.strftime("  %Y.%m.%d  %H.%M.%S")
+
+
+# config keys of the cycle info entered in the start cycle form (its cycle_settings)
+CYCLE_INFO_KEYS = (
+    "order_id", "cycle_id", "quantity", "size", "cycle_location", "dwell_time", "cool_down_temp",
+    "core_temp_setpoint", "temp_ramp", "set_pressure", "maintain_vacuum", "initial_set_cure_temp",
+    "final_set_cure_temp",
+)
+
+
+def cycle_info():
+    """The current cycle info, as stored with a cycle (journal, cycle log header, cycle database)."""
+    return {key: pool.config(key) for key in CYCLE_INFO_KEYS}
+
+
+def cycle_info_rows(start_time, channel_labels, compression_modes=None, info=None):
+    """
+    Cycle info and column header rows that open every cycle CSV file. A compressed file also
+    lists each channel's compression mode, which the values left out were reconstructed with.
+    info: cycle_info() of the cycle, the current one by default.
+    """
+    info = info or cycle_info()
+    rows = [
+        ["Work Order", info.get("order_id")],
+        ["Cycle Number", info.get("cycle_id")],
+        ["Quantity", info.get("quantity")],
+        ["Process Start Time", start_time],
+    ]
+    if compression_modes:
+        rows.append([CSV_INFO_TITLE] + list(compression_modes))
+    rows.append(['Date', 'Time', 'Timer(min)'] + list(channel_labels))
+    return rows
+
+
+class TimestampFormatter:
+    """
+    Formats epoch seconds as ("%Y/%m/%d", "%H:%M:%S") local time. strftime runs once per minute;
+    seconds are filled in arithmetically, which is exact since UTC offsets are whole minutes.
+    """
+
+    def __init__(self):
+        self._minute = None
+        self._date = None
+        self._hour_minute = None
+
+    def format(self, epoch):
+        minute, second = divmod(int(epoch), 60)
+        if minute != self._minute:
+            t = localtime(minute * 60)
+            self._minute = minute
+            self._date = strftime("%Y/%m/%d", t)
+            self._hour_minute = strftime("%H:%M:", t)
+        return self._date, f"{self._hour_minute}{second:02d}"
+
+
+def sample_row(formatter, epoch, values, start_time=None):
+    """[date, time, process time (minutes), *values] CSV row of one sample."""
+    minutes = '' if start_time is None else round((epoch - start_time) / 60, 2)
+    # channels not sampled in this row (nan) are left blank
+    return [*formatter.format(epoch), minutes, *('' if value != value else value for value in values)]
+
+
+class SampleWriterThread(Thread):
+    """
+    Writes queued samples on its own thread. What was written is flushed every flush_rows rows or
+    flush_interval seconds, whichever comes first, and on stop; with fsync the data is also
+    forced to disk on each flush, stop always forces it. Subclasses store a sample in
+    _write_sample, make what was stored durable in _flush and release their output in _close.
+    """
+
+    description = 'samples'
+
+    def __init__(self, path, flush_rows=None, flush_interval=None, fsync=False):
+        super(SampleWriterThread, self).__init__(daemon=True)
+        self.path = path
+        self.flush_rows = flush_rows or DEFAULT_FLUSH_ROWS
+        self.flush_interval = flush_interval or DEFAULT_FLUSH_INTERVAL
+        self.fsync = fsync
+        self.queue = Queue()
+
+    def write_sample(self, epoch, values):
+        """Queue one sample: epoch seconds and every channel's value."""
+        self.queue.put(('sample', (epoch, values)))
+
+    def flush(self, timeout=None):
+        """Flush everything queued so far and wait until it is on disk."""
+        done = Event()
+        self.queue.put(('flush', done))
+        return done.wait(timeout)
+
+    def stop(self, timeout=None):
+        self.queue.put(_STOP)
+        self.join(timeout)
+
+    def run(self):
+        pending = 0
+        last_flush = monotonic()
+        while True:
+            timeout = max(0.0, self.flush_interval - (monotonic() - last_flush)) if pending else None
+            try:
+                item = self.queue.get(timeout=timeout)
+            except Empty:
+                item = None
+
+            if item is _STOP:
+                break
+            if item is not None:
+                kind, payload = item
+                try:
+                    if kind == 'flush':
+                        self._flush(force_sync=True)
+                        pending = 0
+                        last_flush = monotonic()
+                        payload.set()
+                    else:
+                        self._write_sample(*payload)
+                        pending += 1
+                except Exception as e:
+                    print(f'Failed to write {self.description}.\n' + str(e))
+
+            if pending and (pending >= self.flush_rows or monotonic() - last_flush >= self.flush_interval):
+                self._flush()
+                pending = 0
+                last_flush = monotonic()
+
+        self._flush(force_sync=True)
+        self._close()
+
+    def _write_sample(self, epoch, values):
+        raise NotImplementedError
+
+    def _flush(self, force_sync=False):
+        raise NotImplementedError
+
+    def _close(self):
+        raise NotImplementedError
+
+    def _sync_file(self, file, force_sync=False):
+        try:
+            file.flush()
+            if self.fsync or force_sync:
+                os.fsync(file.fileno())
+        except Exception as e:
+            print(f'Failed to flush {self.description}.\n' + str(e))
@@ -0,0 +1,309 @@
+import argparse
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from RaspPiReader.libs.csv_writer import SampleWriterThread
+from RaspPiReader.libs.cycle_journal import FINISHED, read_state, state_path
+from RaspPiReader.libs.cycle_log import EXTENSION, CycleLogReader
+
+# Samples are stored one value per row, unsampled (nan) values are left out. Each cycle's
+# channels keep their min/max up to date, so cycles can be selected by value without reading
+# their samples.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cycles (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    order_id TEXT,
+    cycle_number TEXT,
+    start_time REAL NOT NULL,
+    end_time REAL,
+    core_temp_above_setpoint_time REAL,
+    pressure_drop_core_temp REAL
+);
+CREATE INDEX IF NOT EXISTS cycles_order_start ON cycles (order_id, start_time);
+CREATE INDEX IF NOT EXISTS cycles_start ON cycles (start_time);
+CREATE TABLE IF NOT EXISTS cycle_settings (
+    cycle_id INTEGER NOT NULL REFERENCES cycles (id),
+    key TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (cycle_id, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS channels (
+    cycle_id INTEGER NOT NULL REFERENCES cycles (id),
+    channel INTEGER NOT NULL,
+    label TEXT,
+    min_value REAL,
+    max_value REAL,
+    PRIMARY KEY (cycle_id, channel)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS channels_label_max ON channels (label, max_value);
+CREATE TABLE IF NOT EXISTS samples (
+    cycle_id INTEGER NOT NULL REFERENCES cycles (id),
+    timestamp REAL NOT NULL,
+    channel INTEGER NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (cycle_id, timestamp, channel)
+) WITHOUT ROWID;
+"""
+
+
+def connect(path):
+    """Connection to the cycle database at path, in WAL mode so readers never block the recording."""
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    # commits are durable at checkpoints; the cycle log is the crash-safe record
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def insert_samples(connection, cycle_id, samples):
+    """Insert [(epoch, values)] in one transaction and widen the channels' min/max."""
+    epochs = np.array([epoch for epoch, _ in samples])
+    values = np.array([values for _, values in samples], dtype=np.float64)
+    sampled = ~np.isnan(values)
+    times, channels = np.nonzero(sampled)
+    rows = zip([cycle_id] * len(times), epochs[times].tolist(), (channels + 1).tolist(),
+               values[times, channels].tolist())
+    ranges = []
+    for channel in np.flatnonzero(sampled.any(axis=0)):
+        column = values[sampled[:, channel], channel]
+        ranges.append((float(column.min()), float(column.max()), cycle_id, int(channel) + 1))
+    with connection:
+        connection.executemany("INSERT OR REPLACE INTO samples VALUES (?, ?, ?, ?)", rows)
+        connection.executemany("UPDATE channels SET min_value = min(coalesce(min_value, ?1), ?1), "
+                               "max_value = max(coalesce(max_value, ?2), ?2) "
+                               "WHERE cycle_id = ?3 AND channel = ?4", ranges)
+
+
+class CycleDatabase:
+    """
+    Optional SQLite store of every cycle: its metadata, the cycle settings, each channel's label
+    and min/max, and the samples, indexed by (cycle_id, timestamp). Samples are written by
+    CycleDbWriter, this class adds and finishes cycles and answers queries.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.connection = connect(path)
+        self.connection.row_factory = sqlite3.Row
+
+    def close(self):
+        self.connection.close()
+
+    def add_cycle(self, name, start_time, channel_labels, settings):
+        """id of the cycle named name, added if it is new (a resumed cycle keeps its id and settings)."""
+        with self.connection:
+            self.connection.execute("INSERT OR IGNORE INTO cycles (name, order_id, cycle_number, start_time) "
+                                    "VALUES (?, ?, ?, ?)",
+                                    (name, settings.get('order_id'), settings.get('cycle_id'), start_time))
+            cycle_id = self.connection.execute("SELECT id FROM cycles WHERE name = ?", (name,)).fetchone()[0]
+            self.connection.executemany("INSERT OR IGNORE INTO cycle_settings VALUES (?, ?, ?)",
+                                        [(cycle_id, key, None if value is None else str(value))
+                                         for key, value in settings.items()])
+            self.connection.executemany("INSERT OR IGNORE INTO channels (cycle_id, channel, label) VALUES (?, ?, ?)",
+                                        [(cycle_id, channel, label) for channel, label in enumerate(channel_labels, 1)])
+        return cycle_id
+
+    def finish_cycle(self, cycle_id, end_time, metrics=None):
+        metrics = metrics or {}
+        with self.connection:
+            self.connection.execute("UPDATE cycles SET end_time = ?, core_temp_above_setpoint_time = ?, "
+                                    "pressure_drop_core_temp = ? WHERE id = ?",
+                                    (end_time, metrics.get('core_temp_above_setpoint_time'),
+                                     metrics.get('pressure_drop_core_temp'), cycle_id))
+
+    def complete_cycle(self, cycle_id, end_time, metrics=None):
+        """Like finish_cycle, but only fills in the end and metrics the cycle is missing."""
+        metrics = metrics or {}
+        with self.connection:
+            self.connection.execute("UPDATE cycles SET end_time = coalesce(end_time, ?), "
+                                    "core_temp_above_setpoint_time = coalesce(core_temp_above_setpoint_time, ?), "
+                                    "pressure_drop_core_temp = coalesce(pressure_drop_core_temp, ?) WHERE id = ?",
+                                    (end_time, metrics.get('core_temp_above_setpoint_time'),
+                                     metrics.get('pressure_drop_core_temp'), cycle_id))
+
+    def cycles(self, order_id=None, since=None, until=None, label=None, above=None):
+        """
+        Cycles, oldest first, optionally of one order, started in [since, until) (epoch seconds),
+        and with the channel labelled label above the value above at some point.
+        """
+        query = "SELECT cycles.* FROM cycles"
+        conditions, parameters = [], []
+        if label is not None or above is not None:
+            query += " JOIN channels ON channels.cycle_id = cycles.id"
+            if label is not None:
+                conditions.append("channels.label = ?")
+                parameters.append(label)
+            if above is not None:
+                conditions.append("channels.max_value > ?")
+                parameters.append(above)
+        if order_id is not None:
+            conditions.append("cycles.order_id = ?")
+            parameters.append(order_id)
+        if since is not None:
+            conditions.append("cycles.start_time >= ?")
+            parameters.append(since)
+        if until is not None:
+            conditions.append("cycles.start_time < ?")
+            parameters.append(until)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " GROUP BY cycles.id ORDER BY cycles.start_time"
+        return [dict(row) for row in self.connection.execute(query, parameters)]
+
+    def settings(self, cycle_id):
+        return {row['key']: row['value'] for row in
+                self.connection.execute("SELECT key, value FROM cycle_settings WHERE cycle_id = ?", (cycle_id,))}
+
+    def samples(self, cycle_id, channel, since=None, until=None):
+        """(timestamps, values) of one channel of a cycle, optionally in [since, until)."""
+        rows = self.connection.execute("SELECT timestamp, value FROM samples WHERE cycle_id = ? AND channel = ? "
+                                       "AND timestamp >= ? AND timestamp < ? ORDER BY timestamp",
+                                       (cycle_id, channel, -np.inf if since is None else since,
+                                        np.inf if until is None else until)).fetchall()
+        data = np.array(rows, dtype=np.float64).reshape(-1, 2)
+        return data[:, 0], data[:, 1]
+
+    def import_cycle_log(self, log_path):
+        """
+        Add a cycle from its cycle log (and state file), or complete one the database holds in
+        part: only the samples it misses are inserted, and a finished cycle's end time and metrics
+        are only filled in where they are missing. A running cycle is left without an end.
+        """
+        reader = CycleLogReader(log_path)
+        settings = dict(reader.header['cycle'])
+        state = None
+        if os.path.exists(state_path(log_path)):
+            state = read_state(state_path(log_path))
+            settings.update(state['cycle_info'])
+        name = os.path.splitext(os.path.basename(log_path))[0]
+        cycle_id = self.add_cycle(name, reader.start_time, reader.channel_labels, settings)
+        stored = {row[0] for row in self.connection.execute("SELECT DISTINCT timestamp FROM samples WHERE cycle_id = ?",
+                                                            (cycle_id,))}
+        records = reader.read()
+        missing = [(epoch, values) for epoch, values in zip(records['epoch'].tolist(), records['values'])
+                   if epoch not in stored]
+        if missing:
+            insert_samples(self.connection, cycle_id, missing)
+        if state is None or state['status'] == FINISHED:
+            end_time = float(records['epoch'][-1]) if len(records) else None
+            self.complete_cycle(cycle_id, end_time, state['metrics'] if state else None)
+        return cycle_id
+
+
+def import_cycle(path, log_path):
+    """Add or complete the cycle of log_path in the database at path; False if that fails."""
+    try:
+        database = CycleDatabase(path)
+        try:
+            database.import_cycle_log(log_path)
+        finally:
+            database.close()
+        return True
+    except Exception as e:
+        print(f'Failed to import {log_path} into the cycle database {path}.\n' + str(e))
+        return False
+
+
+class CycleDbWriter(SampleWriterThread):
+    """
+    Inserts one cycle's samples into the cycle database on its own thread, with the flush policy
+    of SampleWriterThread: the samples queued since the last flush are inserted in one transaction.
+    """
+
+    description = 'cycle database'
+
+    def __init__(self, path, cycle_id, flush_rows=None, flush_interval=None):
+        super(CycleDbWriter, self).__init__(path, flush_rows, flush_interval)
+        self.cycle_id = cycle_id
+        self.samples = []
+        self.connection = connect(path)
+
+    @classmethod
+    def open_cycle(cls, path, name, header, settings, flush_rows=None, flush_interval=None, log_path=None):
+        """
+        Started writer of the cycle name (see cycle_log.cycle_header), or None if the database fails.
+        log_path: the cycle log of a resumed cycle, the samples it holds that the database missed
+        before the interruption are imported first.
+        """
+        try:
+            database = CycleDatabase(path)
+            try:
+                cycle_id = database.add_cycle(name, header['start_time'], header['channel_labels'], settings)
+                if log_path is not None:
+                    database.import_cycle_log(log_path)
+            finally:
+                database.close()
+            writer = cls(path, cycle_id, flush_rows, flush_interval)
+        except Exception as e:
+            print(f'Failed to open the cycle database {path}.\n' + str(e))
+            return None
+        writer.start()
+        return writer
+
+    def finish(self, end_time, metrics=None):
+        """Stop, then record the cycle's end and metrics."""
+        self.stop()
+        try:
+            database = CycleDatabase(self.path)
+            try:
+                database.finish_cycle(self.cycle_id, end_time, metrics)
+            finally:
+                database.close()
+        except Exception as e:
+            print(f'Failed to finish the cycle in {self.description}.\n' + str(e))
+
+    def _write_sample(self, epoch, values):
+        self.samples.append((epoch, values))
+
+    def _flush(self, force_sync=False):
+        if not self.samples:
+            return
+        samples, self.samples = self.samples, []
+        try:
+            insert_samples(self.connection, self.cycle_id, samples)
+        except Exception as e:
+            print(f'Failed to write {self.description}.\n' + str(e))
+
+    def _close(self):
+        self.connection.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import cycle logs into a cycle database, or list its cycles.")
+    parser.add_argument('database')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    import_parser = subparsers.add_parser('import', help="import the cycle logs found under folder")
+    import_parser.add_argument('folder')
+    list_parser = subparsers.add_parser('list', help="list cycles")
+    list_parser.add_argument('--order', help="work order")
+    list_parser.add_argument('--days', type=float, help="started in the last DAYS days")
+    list_parser.add_argument('--label', help="channel label, for --above")
+    list_parser.add_argument('--above', type=float, help="with a value above ABOVE")
+    args = parser.parse_args(argv)
+
+    database = CycleDatabase(args.database)
+    if args.command == 'import':
+        for folder, _, files in os.walk(args.folder):
+            for file in sorted(files):
+                if file.endswith(EXTENSION):
+                    path = os.path.join(folder, file)
+                    try:
+                        database.import_cycle_log(path)
+                        print(f"Imported {path}")
+                    except Exception as e:
+                        print(f"Failed to import {path}.\n" + str(e))
+    else:
+        since = (datetime.now() - timedelta(days=args.days)).timestamp() if args.days else None
+        for cycle in database.cycles(args.order, since, label=args.label, above=args.above):
+            start = datetime.fromtimestamp(cycle['start_time']).strftime("%Y/%m/%d %H:%M:%S")
+            print(f"{cycle['id']:6d}  {start}  {cycle['order_id'] or '-':<12} {cycle['name']}")
+    database.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+import json
+import os
+
+import numpy as np
+
+from RaspPiReader import pool
+from RaspPiReader.libs.clock import clock
+from RaspPiReader.libs.cycle_log import CsvExporter, CycleLogReader
+from RaspPiReader.libs.data_store import SampleStore
+
+STATE_EXTENSION = '.state.json'
+
+RUNNING = 'running'
+FINISHED = 'finished'
+
+# config key of the state file of the cycle being recorded, empty between cycles
+ACTIVE_CYCLE_KEY = 'active_cycle_state'
+
+
+def state_path(log_path):
+    return os.path.splitext(log_path)[0] + STATE_EXTENSION
+
+
+def write_state(path, state):
+    """Replace the state file atomically: after a crash it holds either the old or the new state."""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump(state, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def read_state(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+class CycleJournal:
+    """
+    Crash-safe record of a running cycle. The cycle log is its sample journal: one fsynced block
+    per flush. Next to it the state file holds what cannot be rebuilt from the logged samples:
+    the cure metrics, which see every row including those compression leaves out, and the cycle
+    info. The state is rewritten after every block (pass update as the cycle log's on_flush and queue
+    each sample with CycleMetrics.state() taken as it was recorded, so the metrics saved are those
+    of the block's last sample), and the config points at it until finish(), so an interrupted
+    cycle is found at the next start.
+    """
+
+    def __init__(self, log_path, csv_path, start_time, cycle_info, metrics=None):
+        self.path = state_path(log_path)
+        self.state = {
+            'status': RUNNING,
+            'log_path': log_path,
+            'csv_path': csv_path,
+            'start_time': start_time,
+            'cycle_info': cycle_info,
+            'metrics': metrics,  # those of a resumed cycle until the first block
+            'updated': None,
+        }
+
+    def start(self):
+        self._write()
+        pool.set_config(ACTIVE_CYCLE_KEY, self.path)
+        pool.sync_config()
+
+    def update(self, metrics=None):
+        """metrics: CycleMetrics.state() up to the last logged sample, the previous ones if None."""
+        if metrics is not None:
+            self.state['metrics'] = metrics
+        self._write()
+
+    def _write(self):
+        try:
+            self.state['updated'] = clock.time()
+            write_state(self.path, self.state)
+        except Exception as e:
+            print('Failed to write the cycle state.\n' + str(e))
+
+    def finish(self, metrics=None):
+        self.state['status'] = FINISHED
+        self.update(metrics)
+        pool.set_config(ACTIVE_CYCLE_KEY, '')
+        pool.sync_config()
+
+
+def interrupted_cycle():
+    """State of the cycle that was being recorded when the app stopped without finishing it, or None."""
+    path = pool.config(ACTIVE_CYCLE_KEY)
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        state = read_state(path)
+    except Exception as e:
+        print(f'Failed to read the cycle state {path}.\n' + str(e))
+        return None
+    if state.get('status') != RUNNING or not os.path.exists(state.get('log_path', '')):
+        return None
+    state['path'] = path
+    return state
+
+
+def recover(state):
+    """
+    (SampleStore, CycleLogReader) of an interrupted cycle, the store holding every valid sample
+    of its log; the reader's offset is where the log's valid data ends.
+    """
+    reader = CycleLogReader(state['log_path'])
+    records = reader.read()
+    data_stack = SampleStore(len(reader.channel_labels) + 2, max(len(records), 1), start_time=reader.start_time)
+    if len(records):
+        rows = reader.rows(records)
+        rows[:, 0] = np.nan  # derived by the store
+        data_stack.extend(rows)
+    return data_stack, reader
+
+
+def mark_finished(state):
+    state = dict(state, status=FINISHED)
+    write_state(state.pop('path', None) or state_path(state['log_path']), state)
+    pool.set_config(ACTIVE_CYCLE_KEY, '')
+    pool.sync_config()
+
+
+def finalize(state):
+    """Export the CSV file of an interrupted cycle and mark it finished."""
+    CsvExporter(state['log_path'], state['csv_path']).update(final=True)
+    mark_finished(state)
@@ -0,0 +1,436 @@
+import argparse
+import csv
+import json
+import mmap
+import struct
+import zlib
+from datetime import datetime
+from threading import Lock
+
+import numpy as np
+
+from RaspPiReader import pool
+from RaspPiReader.libs.compression import DEADBAND, reconstruct
+from RaspPiReader.libs.csv_writer import SampleWriterThread, TimestampFormatter, cycle_info, cycle_info_rows, sample_row
+
+# Cycle log layout:
+#   MAGIC, HEADER (json length, json crc32), json header
+#   then blocks: BLOCK (BLOCK_MAGIC, record count, payload crc32), records
+# A record is one scan: epoch seconds and every channel's value (float64, nan when the channel
+# was not sampled or not stored). A block is written on every flush, so a crash loses at most
+# the unflushed records and a torn last block is recognised by its length or CRC.
+MAGIC = b'RPRCYCLE'
+VERSION = 2
+HEADER = struct.Struct('<II')
+BLOCK_MAGIC = b'BLCK'
+BLOCK = struct.Struct('<4sII')
+
+EXTENSION = '.cyclelog'
+
+
+def record_dtype(n_channels):
+    return np.dtype([('epoch', '<f8'), ('values', '<f8', (n_channels,))])
+
+
+def cycle_header(start_time, channel_labels, compression_modes=None, info=None, active_channels=None):
+    """Header of a cycle log: what the cycle CSV file's info rows and plot are generated from."""
+    return {
+        'version': VERSION,
+        'start_time': start_time.timestamp(),
+        'channel_labels': list(channel_labels),
+        'active_channels': list(active_channels) if active_channels else None,
+        'compression_modes': list(compression_modes) if compression_modes else None,
+        'decimals': [pool.config('decimal_point' + str(i), int) or 0 for i in range(1, len(channel_labels) + 1)],
+        'cycle': info or cycle_info(),
+    }
+
+
+class CycleLogWriter(SampleWriterThread):
+    """
+    Writes a cycle's samples to a binary cycle log on its own thread, with the flush policy of
+    SampleWriterThread: the samples queued since the last flush become one CRC checked block, after
+    which on_flush(state) is called with the state queued with the block's last sample (e.g. the
+    cycle metrics up to that sample, see CycleJournal.update). With append_at an existing log is continued: anything after that
+    offset (the end of its valid blocks, see CycleLogReader) is cut off and header is not written.
+    """
+
+    description = 'cycle log'
+
+    def __init__(self, path, header, flush_rows=None, flush_interval=None, fsync=False, on_flush=None,
+                 append_at=None):
+        super(CycleLogWriter, self).__init__(path, flush_rows, flush_interval, fsync)
+        self.header = header
+        self.dtype = record_dtype(len(header['channel_labels']))
+        self.records = []
+        self.state = None
+        self.on_flush = on_flush
+        if append_at is None:
+            self.file = open(path, 'wb')
+            header = json.dumps(header).encode()
+            self.file.write(MAGIC + HEADER.pack(len(header), zlib.crc32(header)) + header)
+            self.file.flush()
+        else:
+            self.file = open(path, 'r+b')
+            self.file.truncate(append_at)
+            self.file.seek(append_at)
+
+    def write_sample(self, epoch, values, state=None):
+        """Queue one sample: epoch seconds, every channel's value and the state it brings the cycle to."""
+        self.queue.put(('sample', (epoch, values, state)))
+
+    def _write_sample(self, epoch, values, state=None):
+        self.records.append((epoch, values))
+        self.state = state
+
+    def _flush(self, force_sync=False):
+        written = False
+        if self.records:
+            records = np.array(self.records, dtype=self.dtype)
+            self.records = []
+            payload = records.tobytes()
+            try:
+                self.file.write(BLOCK.pack(BLOCK_MAGIC, len(records), zlib.crc32(payload)) + payload)
+                written = True
+            except Exception as e:
+                print(f'Failed to write {self.description}.\n' + str(e))
+        self._sync_file(self.file, force_sync)
+        if written and self.on_flush:
+            self.on_flush(self.state)
+
+    def _close(self):
+        self.file.close()
+
+
+class CycleLogReader:
+    """
+    Reads a cycle log, also while it is being written: read() returns the records of the blocks
+    completed since the previous call. Blocks failing their CRC are skipped; reading stops at an
+    incomplete block and resumes there on the next call.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.skipped_blocks = 0
+        with open(path, 'rb') as f:
+            head = f.read(len(MAGIC) + HEADER.size)
+            if len(head) < len(MAGIC) + HEADER.size or head[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{path} is not a cycle log")
+            length, crc = HEADER.unpack(head[len(MAGIC):])
+            header = f.read(length)
+            if len(header) < length or zlib.crc32(header) != crc:
+                raise ValueError(f"{path} has a corrupt header")
+        self.header = json.loads(header)
+        if self.header.get('version') != VERSION:
+            raise ValueError(f"{path} is a cycle log of unknown version {self.header.get('version')}")
+        self.dtype = record_dtype(len(self.header['channel_labels']))
+        self.offset = len(MAGIC) + HEADER.size + length
+
+    @property
+    def start_time(self):
+        return self.header['start_time']
+
+    @property
+    def channel_labels(self):
+        return self.header['channel_labels']
+
+    @property
+    def active_channels(self):
+        return self.header.get('active_channels') or list(range(1, len(self.channel_labels) + 1))
+
+    def read(self):
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            data = f.read()
+        blocks = list(self.blocks(data, self.offset))
+        return np.concatenate(blocks) if blocks else np.empty(0, self.dtype)
+
+    def blocks(self, buffer, base=0):
+        """
+        Record arrays, views of buffer, of the complete blocks from self.offset on, which moves
+        past them. buffer holds the file from offset base on.
+        """
+        for records, crc in self.unchecked_blocks(buffer, base):
+            if self.check(records, crc):
+                yield records
+
+    def unchecked_blocks(self, buffer, base=0):
+        """(records, crc) of the complete blocks as blocks() finds them, the CRCs left to check()."""
+        while True:
+            start = self.offset - base + BLOCK.size
+            if start > len(buffer):
+                return
+            magic, count, crc = BLOCK.unpack_from(buffer, start - BLOCK.size)
+            end = start + count * self.dtype.itemsize
+            if magic != BLOCK_MAGIC or end > len(buffer):
+                return
+            self.offset = end + base
+            yield np.frombuffer(buffer, self.dtype, count, start), crc
+
+    def check(self, records, crc):
+        """Whether a block's records match its CRC; a corrupt block is counted and reported."""
+        if zlib.crc32(records) == crc:
+            return True
+        self.skipped_blocks += 1
+        print(f"Skipped a corrupt block of {len(records)} records in {self.path}")
+        return False
+
+    def rows(self, records):
+        """[process_time(minutes), v1, ... , vN, sampling_time] float64 rows of read() records."""
+        rows = np.empty((len(records), self.dtype['values'].shape[0] + 2))
+        rows[:, 0] = (records['epoch'] - self.start_time) / 60
+        rows[:, 1:-1] = records['values']
+        rows[:, -1] = records['epoch']
+        return rows
+
+
+class MappedColumn:
+    """
+    One column of a MappedCycleLog, indexed like a SampleStore column (an int, a slice or an index
+    array) but read from the mapped blocks: only the blocks an index falls in are read, and what
+    it selects is returned as a float64 copy. A time column can be searched with searchsorted().
+    """
+
+    def __init__(self, log, column):
+        self.log = log
+        self.column = column
+
+    def __len__(self):
+        return len(self.log)
+
+    def __array__(self, dtype=None, copy=None):
+        # the whole column, only for callers that need it as one array
+        return self[:].astype(dtype or np.float64, copy=False)
+
+    def values(self, block):
+        return self.log.field(self.column, self.log.block(block))
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            return self._gather(start, max(start, stop))[::step] if step > 0 else self[np.arange(start, stop, step)]
+        if np.ndim(key) == 0:
+            index = int(key) + len(self) if key < 0 else int(key)
+            if not 0 <= index < len(self):
+                raise IndexError(f"index {key} is out of bounds for a column of {len(self)} rows")
+            block = self.log.block_of(index)
+            return float(self.values(block)[index - self.log.starts[block]])
+        indices = np.asarray(key)
+        if indices.dtype == bool:
+            indices = np.flatnonzero(indices)
+        indices = np.where(indices < 0, indices + len(self), indices)
+        data = np.empty(len(indices))
+        blocks = self.log.block_of(indices)
+        order = np.argsort(blocks, kind='stable')
+        for group in np.split(order, np.flatnonzero(np.diff(blocks[order])) + 1):
+            if len(group):
+                block = blocks[group[0]]
+                data[group] = self.values(block)[indices[group] - self.log.starts[block]]
+        return data
+
+    def _gather(self, start, stop):
+        data = np.empty(stop - start)
+        if stop > start:
+            for block in range(self.log.block_of(start), self.log.block_of(stop - 1) + 1):
+                first = self.log.starts[block]
+                low, high = max(first, start), min(self.log.starts[block + 1], stop)
+                data[low - start:high - start] = self.values(block)[low - first:high - first]
+        return data
+
+    def searchsorted(self, value, side='left'):
+        """numpy.searchsorted of a non-decreasing column, reading only the blocks it bisects."""
+        low, high = 0, len(self.log.starts) - 1
+        while low < high:
+            middle = (low + high) // 2
+            last = self.values(middle)[-1]
+            if last > value or (side == 'left' and last == value):
+                high = middle
+            else:
+                low = middle + 1
+        if low == len(self.log.starts) - 1:
+            return len(self)
+        return int(self.log.starts[low] + np.searchsorted(self.values(low), value, side))
+
+
+class MappedCycleLog:
+    """
+    Read-only view of a finished cycle log with the reading interface of data_store.SampleStore,
+    so a stored cycle can be plotted like the live one. The file is memory-mapped: opening it only
+    walks the block headers, a block's CRC is checked the first time it is read and its columns
+    (MappedColumn) read the mapped blocks directly, so only what is actually drawn is ever read.
+    The rows of a corrupt block keep their place, with nan values at the time of the row before.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.reader = CycleLogReader(path)
+        self.n_columns = len(self.reader.channel_labels) + 2
+        self.start_time = self.reader.start_time
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._blocks = [(records, crc) for records, crc in self.reader.unchecked_blocks(self._map) if len(records)]
+        self._checked = {}
+        # row index of every block's first row, and the number of rows last
+        self.starts = np.cumsum([0] + [len(records) for records, _ in self._blocks])
+        self._columns = [MappedColumn(self, column) for column in range(self.n_columns)]
+
+    @property
+    def channel_labels(self):
+        return self.reader.channel_labels
+
+    @property
+    def active_channels(self):
+        return self.reader.active_channels
+
+    @property
+    def compression_modes(self):
+        return self.reader.header['compression_modes']
+
+    def __len__(self):
+        return int(self.starts[-1])
+
+    def __getitem__(self, column):
+        return self._columns[column % self.n_columns]
+
+    def block_of(self, index):
+        """Block of row index (or of every row of an index array)."""
+        return np.searchsorted(self.starts, index, side='right') - 1
+
+    def block(self, block):
+        """The records of a block, CRC checked on first use."""
+        records = self._checked.get(block)
+        if records is None:
+            records, crc = self._blocks[block]
+            if not self.reader.check(records, crc):
+                epoch = self.block(block - 1)['epoch'][-1] if block else self.start_time
+                records = np.zeros(len(records), self.reader.dtype)
+                records['epoch'] = epoch
+                records['values'] = np.nan
+            self._checked[block] = records
+        return records
+
+    def field(self, column, records):
+        """Column column of a block's records, as rows() lays them out."""
+        if column == 0:
+            return (records['epoch'] - self.start_time) / 60
+        if column == self.n_columns - 1:
+            return records['epoch']
+        return records['values'][:, column - 1]
+
+    def column(self, column, start=0, stop=None):
+        return self[column][start:stop]
+
+    def rows(self, start=0, stop=None):
+        """(n_rows, n_columns) copy of the rows in [start, stop)."""
+        return np.column_stack([self.column(i, start, stop) for i in range(self.n_columns)])
+
+    def last(self):
+        return self.rows(len(self) - 1)[0]
+
+    def latest(self):
+        """The most recent value of every column, skipping nan."""
+        latest = np.full(self.n_columns, np.nan)
+        missing = list(range(self.n_columns))
+        for block in reversed(range(len(self._blocks))):
+            records = self.block(block)
+            for i in list(missing):
+                sampled = self.field(i, records)
+                sampled = sampled[~np.isnan(sampled)]
+                if len(sampled):
+                    latest[i] = sampled[-1]
+                    missing.remove(i)
+            if not missing:
+                break
+        return latest
+
+    def close(self):
+        self._blocks = []
+        self._checked = {}
+        self._map.close()
+
+
+class CsvExporter:
+    """
+    Keeps the cycle CSV file generated from a cycle log: the info rows are written once, then
+    update() appends the samples logged since the previous call. Values the log leaves out (nan:
+    compressed away, or not sampled in that scan) are filled in with compression.reconstruct:
+    held for deadband and inactive channels, interpolated otherwise. Samples after a channel's
+    last logged value are held back until the next one arrives, update(final=True) writes them
+    all, holding each channel's last value.
+    """
+
+    def __init__(self, log_path, csv_path):
+        self.reader = CycleLogReader(log_path)
+        self.csv_path = csv_path
+        self.formatter = TimestampFormatter()
+        self.lock = Lock()
+        header = self.reader.header
+        n_channels = len(header['channel_labels'])
+        active = set(self.reader.active_channels)
+        modes = header['compression_modes'] or [None] * n_channels
+        self.modes = [mode if channel in active else DEADBAND for channel, mode in enumerate(modes, 1)]
+        self.decimals = header.get('decimals')
+        self.pending = np.empty(0, self.reader.dtype)
+        # (epoch, value) of every channel's last value written, the filling continues from it
+        self.last_epochs = np.full(n_channels, np.nan)
+        self.last_values = np.full(n_channels, np.nan)
+        with open(csv_path, 'w', newline='') as f:
+            csv.writer(f).writerows(cycle_info_rows(datetime.fromtimestamp(header['start_time']),
+                                                    header['channel_labels'], header['compression_modes'],
+                                                    header['cycle']))
+
+    def update(self, final=False):
+        """The number of samples appended."""
+        with self.lock:
+            records = self.reader.read()
+            if len(self.pending):
+                records = np.concatenate([self.pending, records])
+            if not len(records):
+                return 0
+            epochs = records['epoch']
+            values = records['values']
+            ready = len(records)
+            if not final:
+                for channel, mode in enumerate(self.modes):
+                    if mode != DEADBAND:
+                        logged = np.flatnonzero(~np.isnan(values[:, channel]))
+                        ready = min(ready, logged[-1] + 1 if len(logged) else 0)
+            self.pending = records[ready:]
+            if not ready:
+                return 0
+            filled = np.empty((ready, values.shape[1]))
+            for channel, mode in enumerate(self.modes):
+                x = np.append(self.last_epochs[channel], epochs)
+                y = reconstruct(x, np.append(self.last_values[channel], values[:, channel]), mode)
+                if final:
+                    y = reconstruct(x, y, DEADBAND)
+                y = y[1:ready + 1]
+                filled[:, channel] = y
+                if not np.isnan(y[-1]):
+                    self.last_epochs[channel], self.last_values[channel] = epochs[ready - 1], y[-1]
+            epochs = epochs[:ready]
+            if self.decimals:
+                filled = [np.round(filled[:, channel], decimals) for channel, decimals in enumerate(self.decimals)]
+                filled = np.column_stack(filled)
+            with open(self.csv_path, 'a', newline='') as f:
+                writer = csv.writer(f)
+                for epoch, line in zip(epochs.tolist(), filled.tolist()):
+                    writer.writerow(sample_row(self.formatter, epoch, line, self.reader.start_time))
+            return ready
+
+
+def export_csv(log_path, csv_path):
+    CsvExporter(log_path, csv_path).update(final=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export a cycle log to a cycle CSV file.")
+    parser.add_argument('path')
+    parser.add_argument('out_path', nargs='?', help="default: <path> with a '.csv' extension")
+    args = parser.parse_args(argv)
+    out_path = args.out_path or args.path.rsplit('.', 1)[0] + '.csv'
+    export_csv(args.path, out_path)
+    print(f"Written {out_path}")
+
+
+if __name__ == '__main__':
+    main()
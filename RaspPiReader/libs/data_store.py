@@ -0,0 +1,129 @@
+import numpy as np
+
+CHUNK_SIZE = 4096
+
+
+class SampleStore:
+    """
+    Columnar float64 sample store.
+    Cycle layout: [process_time(minutes), v1, v2, ... , vN, sampling_time(epoch seconds)]
+    The process time is not taken from the appended rows: it is derived from the sampling time
+    and start_time, vectorized and only when column 0 is read (nan while start_time is None).
+
+    All columns live in one preallocated (n_columns, capacity) array whose capacity grows by
+    doubling in whole chunks, so appends are amortized O(1). store[i] is a zero-copy view of the
+    filled part of column i; views taken before a growth keep pointing at the old, still valid data.
+    Appends are expected from a single producer thread; readers only ever see complete rows.
+    Channels sampled at a slower rate than the rows are nan in the rows they were not read in.
+    """
+
+    def __init__(self, n_columns, capacity=CHUNK_SIZE, start_time=None):
+        self.n_columns = n_columns
+        self._data = np.empty((n_columns, self._round_capacity(capacity)))
+        self._length = 0
+        self._latest = np.full(n_columns, np.nan)
+        self._latest_times = np.full(n_columns, np.nan)
+        self.start_time = start_time
+        # process time is filled in up to row _derived of the array _derived_data
+        self._derived = 0
+        self._derived_data = None
+
+    def set_start_time(self, start_time):
+        self.start_time = start_time
+        self._derived_data = None
+
+    def _derive(self):
+        data, length = self._data, self._length
+        start = self._derived if self._derived_data is data else 0
+        if start < length:
+            if self.start_time is None:
+                data[0, start:length] = np.nan
+            else:
+                np.subtract(data[-1, start:length], self.start_time, out=data[0, start:length])
+                data[0, start:length] /= 60
+        self._derived = length
+        self._derived_data = data
+
+    @staticmethod
+    def _round_capacity(capacity):
+        return max(1, -(-capacity // CHUNK_SIZE)) * CHUNK_SIZE
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, column):
+        if column == 0:
+            self._derive()
+        return self._data[column, :self._length]
+
+    @property
+    def capacity(self):
+        return self._data.shape[1]
+
+    def column(self, column, start=0, stop=None):
+        stop = self._length if stop is None else min(stop, self._length)
+        if column == 0:
+            self._derive()
+        return self._data[column, start:stop]
+
+    def rows(self, start=0, stop=None):
+        """(n_rows, n_columns) view of the rows in [start, stop)."""
+        stop = self._length if stop is None else min(stop, self._length)
+        self._derive()
+        return self._data[:, start:stop].T
+
+    def last(self):
+        self._derive()
+        return self._data[:, self._length - 1]
+
+    def latest(self):
+        """The most recent value of every column, skipping nan, and kept across clear()."""
+        return self._latest.copy()
+
+    def latest_times(self):
+        """The sampling time of every column's latest() value."""
+        return self._latest_times.copy()
+
+    def observe(self, row):
+        """Take row's values as the latest ones without storing it (e.g. a row compression holds back)."""
+        row = np.asarray(row, dtype=np.float64)
+        sampled = ~np.isnan(row)
+        np.copyto(self._latest, row, where=sampled)
+        np.copyto(self._latest_times, row[-1], where=sampled)
+
+    def append(self, row):
+        if self._length == self.capacity:
+            self._grow()
+        column = self._data[:, self._length]
+        column[:] = row
+        sampled = ~np.isnan(column)
+        np.copyto(self._latest, column, where=sampled)
+        np.copyto(self._latest_times, column[-1], where=sampled)
+        self._length += 1
+
+    def extend(self, rows):
+        """Append a (n_rows, n_columns) block of rows."""
+        start = self._length
+        end = start + len(rows)
+        if end == start:
+            return
+        while end > self.capacity:
+            self._grow()
+        block = self._data[:, start:end]
+        block[:] = np.asarray(rows).T
+        valid = ~np.isnan(block)
+        sampled = valid.any(axis=1)
+        last = end - start - 1 - valid[:, ::-1].argmax(axis=1)
+        self._latest[sampled] = block[sampled, last[sampled]]
+        self._latest_times[sampled] = block[-1, last[sampled]]
+        self._length = end
+
+    def _grow(self):
+        data = np.empty((self.n_columns, self._round_capacity(self.capacity * 2)))
+        data[:, :self._length] = self._data[:, :self._length]
+        self._data = data
+
+    def clear(self):
+        self._length = 0
+        self._derived = 0
+        self._derived_data = None
@@ -0,0 +1,140 @@
+import numpy as np
+
+PYRAMID_FACTOR = 4
+LEVEL_CHUNK = 1024
+# Raw samples read from the column at a time when building level 1.
+RAW_CHUNK = 1 << 16
+
+
+class _Level:
+    """Min/max of consecutive blocks of PYRAMID_FACTOR ** level raw samples, with their raw indices."""
+
+    def __init__(self):
+        self.min_val = np.empty(LEVEL_CHUNK)
+        self.max_val = np.empty(LEVEL_CHUNK)
+        self.min_idx = np.empty(LEVEL_CHUNK, dtype=np.int64)
+        self.max_idx = np.empty(LEVEL_CHUNK, dtype=np.int64)
+        self.length = 0
+
+    def extend(self, min_val, min_idx, max_val, max_idx):
+        end = self.length + len(min_val)
+        if end > len(self.min_val):
+            capacity = max(2 * len(self.min_val), end)
+            self.min_val = np.resize(self.min_val, capacity)
+            self.max_val = np.resize(self.max_val, capacity)
+            self.min_idx = np.resize(self.min_idx, capacity)
+            self.max_idx = np.resize(self.max_idx, capacity)
+        self.min_val[self.length:end] = min_val
+        self.max_val[self.length:end] = max_val
+        self.min_idx[self.length:end] = min_idx
+        self.max_idx[self.length:end] = max_idx
+        self.length = end
+
+    def envelope(self, first_block, last_block):
+        """Raw indices of the extremes of blocks [first_block, last_block), in time order."""
+        min_idx = self.min_idx[first_block:last_block]
+        max_idx = self.max_idx[first_block:last_block]
+        return np.column_stack((np.minimum(min_idx, max_idx), np.maximum(min_idx, max_idx))).ravel()
+
+
+class MinMaxPyramid:
+    """
+    Streaming multi-resolution min/max decimation of one column.
+    Level n holds, for every complete block of PYRAMID_FACTOR ** n raw samples, the raw indices of
+    its minimum and maximum, so any range can be drawn with a bounded number of points that still
+    contains every peak and dip. Levels are extended as samples arrive, at amortized O(1) per sample.
+    nan (unsampled) values are never picked unless a whole block is nan; callers drop those indices.
+    The raw column is only sliced, RAW_CHUNK samples at a time, so it may be any column that can be
+    sliced into arrays (e.g. a cycle_log.MappedColumn).
+    """
+
+    def __init__(self, factor=PYRAMID_FACTOR):
+        self.factor = factor
+        self.levels = [None]  # level 0 is the raw column itself
+        self.n_raw = 0
+
+    def block_size(self, level):
+        return self.factor ** level
+
+    def update(self, y):
+        """Consume the raw column y (the full column, of which only new samples are read)."""
+        self.n_raw = len(y)
+        level = 1
+        while True:
+            if level == len(self.levels):
+                if self.n_raw < self.block_size(level):
+                    break
+                self.levels.append(_Level())
+            current = self.levels[level]
+            if level == 1:
+                if not self._extend_raw(current, y):
+                    break
+            else:
+                lower = self.levels[level - 1]
+                done = current.length * self.factor
+                n_blocks = (lower.length - done) // self.factor
+                if n_blocks == 0:
+                    break
+                span = slice(done, done + n_blocks * self.factor)
+                mins = lower.min_val[span].reshape(n_blocks, self.factor)
+                maxs = lower.max_val[span].reshape(n_blocks, self.factor)
+                min_pos = mins.argmin(axis=1)
+                max_pos = maxs.argmax(axis=1)
+                rows = np.arange(n_blocks)
+                current.extend(mins[rows, min_pos], lower.min_idx[span].reshape(n_blocks, self.factor)[rows, min_pos],
+                               maxs[rows, max_pos], lower.max_idx[span].reshape(n_blocks, self.factor)[rows, max_pos])
+            level += 1
+
+    def _extend_raw(self, level, y):
+        """Extend level 1 with the complete blocks of y's new raw samples, the number of blocks added."""
+        added = 0
+        while True:
+            done = level.length * self.factor
+            n_blocks = min(self.n_raw - done, RAW_CHUNK) // self.factor
+            if n_blocks == 0:
+                return added
+            blocks = np.asarray(y[done:done + n_blocks * self.factor]).reshape(n_blocks, self.factor)
+            offsets = done + np.arange(n_blocks) * self.factor
+            low = high = blocks
+            unsampled = np.isnan(blocks)
+            if unsampled.any():
+                # +-inf never wins over a sample, and carries an all-nan block up the levels
+                low = np.where(unsampled, np.inf, blocks)
+                high = np.where(unsampled, -np.inf, blocks)
+            min_pos = low.argmin(axis=1)
+            max_pos = high.argmax(axis=1)
+            rows = np.arange(n_blocks)
+            level.extend(low[rows, min_pos], offsets + min_pos, high[rows, max_pos], offsets + max_pos)
+            added += n_blocks
+
+    def select_level(self, n_samples, max_points):
+        level = 0
+        while level + 1 < len(self.levels) and 2 * n_samples / self.block_size(level) > max_points:
+            level += 1
+        return level
+
+    def envelope(self, start, stop, max_points):
+        """
+        Raw indices in [start, stop) to draw so that the range takes about max_points points.
+        Blocks only partly inside the range are filled in from finer levels.
+        """
+        start = max(0, start)
+        stop = min(stop, self.n_raw)
+        if stop <= start:
+            return np.empty(0, dtype=np.int64)
+        level = self.select_level(stop - start, max_points)
+        return np.concatenate(self._collect(level, start, stop))
+
+    def _collect(self, level, start, stop):
+        if stop <= start:
+            return []
+        if level == 0:
+            return [np.arange(start, stop)]
+        block = self.block_size(level)
+        first_block = -(-start // block)
+        last_block = min(stop // block, self.levels[level].length)
+        if last_block <= first_block:
+            return self._collect(level - 1, start, stop)
+        return self._collect(level - 1, start, first_block * block) \
+            + [self.levels[level].envelope(first_block, last_block)] \
+            + self._collect(level - 1, last_block * block, stop)
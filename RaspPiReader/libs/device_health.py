@@ -0,0 +1,70 @@
+from time import monotonic
+
+FAILURE_THRESHOLD = 3
+BASE_BACKOFF = 2.0
+MAX_BACKOFF = 60.0
+
+# key of the port (bus) itself, next to the slave addresses
+PORT = 'port'
+
+
+class _Circuit:
+
+    def __init__(self):
+        self.failures = 0
+        self.backoff = 0.0
+        self.open_until = None
+
+
+class DeviceHealth:
+    """
+    Circuit breaker per slave address (and one for the port itself).
+    After failure_threshold consecutive failures a device's circuit opens and the device is skipped
+    for a backoff period. When it has passed, one trial read is allowed: success closes the circuit,
+    failure opens it again with twice the backoff, up to max_backoff.
+    """
+
+    def __init__(self, failure_threshold=FAILURE_THRESHOLD, base_backoff=BASE_BACKOFF,
+                 max_backoff=MAX_BACKOFF, clock=monotonic):
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.clock = clock
+        self.circuits = dict()
+
+    def _circuit(self, key):
+        if key not in self.circuits:
+            self.circuits[key] = _Circuit()
+        return self.circuits[key]
+
+    def allow(self, key):
+        circuit = self.circuits.get(key)
+        return circuit is None or circuit.open_until is None or self.clock() >= circuit.open_until
+
+    def is_open(self, key):
+        circuit = self.circuits.get(key)
+        return circuit is not None and circuit.open_until is not None
+
+    def success(self, key):
+        """Returns True if this closed an open circuit."""
+        circuit = self.circuits.get(key)
+        if circuit is None:
+            return False
+        was_open = circuit.open_until is not None
+        circuit.failures = 0
+        circuit.backoff = 0.0
+        circuit.open_until = None
+        return was_open
+
+    def failure(self, key):
+        """Returns the backoff in seconds if this opened (or re-opened) the circuit, else None."""
+        circuit = self._circuit(key)
+        circuit.failures += 1
+        if circuit.open_until is None and circuit.failures < self.failure_threshold:
+            return None
+        circuit.backoff = min(self.max_backoff, circuit.backoff * 2 if circuit.backoff else self.base_backoff)
+        circuit.open_until = self.clock() + circuit.backoff
+        return circuit.backoff
+
+    def open_keys(self):
+        return [key for key in self.circuits if self.is_open(key)]
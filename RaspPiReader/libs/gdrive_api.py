@@ -92,6 +92,38 @@ class GoogleDriveAPI(object):
             return False
 
 
+class DriveSync(object):
+    """
+    Uploads the files of one cycle into a Drive folder named after it. The folder and file ids are kept
+    (one file per mime type), so later syncs update the same files instead of creating new ones.
+    """
+
+    def __init__(self, folder_name):
+        self.folder_name = folder_name
+        self.folder_id = None
+        self.file_ids = dict()
+        self.gapi = None
+
+    def connect(self):
+        self.gapi = GoogleDriveAPI()
+        self.gapi.check_creds()
+        if not self.folder_id:
+            self.folder_id = self.gapi.create_folder(self.folder_name)
+
+    def sync_file(self, file_path, mime_type, delete_existing=True):
+        """Returns 'upload' if the file was uploaded as a new file, 'update' if the existing one was updated."""
+        file_id = self.file_ids.get(mime_type)
+        if file_id and delete_existing:
+            self.gapi.delete_file(file_id)
+            file_id = None
+
+        if not file_id:
+            self.file_ids[mime_type] = self.gapi.upload_file(self.folder_name, mime_type, file_path, self.folder_id)
+            return 'upload'
+        self.gapi.update_file(file_id, file_path)
+        return 'update'
+
+
 def grant_access(self, sheet_id, email):
     def callback(request_id, response, exception):
         if exception:
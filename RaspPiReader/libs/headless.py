@@ -0,0 +1,164 @@
+import os
+import signal
+from datetime import datetime
+from threading import Thread, Event
+from time import monotonic
+
+from colorama import Fore
+
+from RaspPiReader import pool
+from RaspPiReader.libs.acquisition import CycleMetrics, CycleRecorder
+from RaspPiReader.libs.acquisition_process import ProcessAcquisition, acquisition_class
+from RaspPiReader.libs.channel_plan import ChannelPlan, load_active_channels, load_channel_count, load_channel_labels
+from RaspPiReader.libs.clock import clock
+from RaspPiReader.libs.communication import dataReader
+from RaspPiReader.libs.compression import RowCompressor
+from RaspPiReader.libs.csv_writer import cycle_file_name, cycle_info
+from RaspPiReader.libs.cycle_db import CycleDbWriter, import_cycle
+from RaspPiReader.libs.cycle_journal import CycleJournal, finalize, interrupted_cycle
+from RaspPiReader.libs.cycle_log import EXTENSION, CsvExporter, CycleLogWriter, cycle_header
+from RaspPiReader.libs.data_store import SampleStore
+from RaspPiReader.libs.gdrive_api import DriveSync
+from RaspPiReader.libs.transport import connection_pool
+
+STATUS_INTERVAL = 60
+POLL_INTERVAL = 1.0
+
+
+class HeadlessRunner:
+    """
+    Runs one cycle without any Qt widgets: acquisition, the cycle log and its CSV export, cure
+    metrics and the periodic Google Drive sync, using the settings and cycle info last saved from the GUI.
+    The cycle ends on SIGINT/SIGTERM (or when the demo data runs out).
+    """
+
+    def __init__(self, status_interval=STATUS_INTERVAL):
+        self.status_interval = status_interval
+        self.stop_event = Event()
+        self.cycle_log = None
+        self.drive_sync = None
+
+    def finalize_interrupted_cycle(self):
+        """Export the CSV file of a cycle left unfinished by a crash; it can still be reported from the GUI."""
+        state = interrupted_cycle()
+        if state is None:
+            return
+        try:
+            finalize(state)
+            if pool.config('cycle_db_path'):
+                import_cycle(pool.config('cycle_db_path'), state['log_path'])
+            print(f"Finalized the interrupted cycle: {state['csv_path']}")
+        except Exception as e:
+            print('Failed to finalize the interrupted cycle.\n' + str(e))
+
+    def start(self):
+        self.finalize_interrupted_cycle()
+        clock.anchor()
+        self.cycle_start_time = clock.now()
+        self.file_name = cycle_file_name(pool.config('order_id'), self.cycle_start_time)
+        self.folder_path = os.path.join(pool.config('csv_file_path'), self.file_name)
+        os.makedirs(self.folder_path)
+        self.log_path = os.path.join(self.folder_path, self.file_name + EXTENSION)
+        self.csv_path = os.path.join(self.folder_path, self.file_name + '.csv')
+        self.drive_sync = DriveSync(self.file_name)
+
+        active_channels = pool.set('active_channels', load_active_channels())
+        channel_plan = ChannelPlan.from_config(active_channels)
+        self.data_stack = pool.set('data_stack', SampleStore(load_channel_count() + 2))
+        self.metrics = CycleMetrics.from_config()
+        compressor = RowCompressor.from_config(channel_plan)
+
+        header = cycle_header(self.cycle_start_time, load_channel_labels(),
+                              compressor.modes if compressor else None, active_channels=active_channels)
+        info = cycle_info()
+        self.journal = CycleJournal(self.log_path, self.csv_path, header['start_time'], info)
+        self.cycle_log = CycleLogWriter(self.log_path, header,
+                                        flush_rows=pool.config('csv_flush_rows', int),
+                                        flush_interval=pool.config('csv_flush_interval', float),
+                                        fsync=True, on_flush=self.journal.update)
+        self.journal.start()
+        self.cycle_log.start()
+        self.cycle_db = None
+        if pool.config('cycle_db_path'):
+            self.cycle_db = CycleDbWriter.open_cycle(pool.config('cycle_db_path'), self.file_name, header, info,
+                                                     flush_rows=pool.config('csv_flush_rows', int),
+                                                     flush_interval=pool.config('csv_flush_interval', float))
+        self.csv_exporter = CsvExporter(self.log_path, self.csv_path)
+        self.recorder = CycleRecorder(self.data_stack, self.cycle_start_time.timestamp(),
+                                      metrics=self.metrics,
+                                      sample_sinks=(self.write_cycle_sample,),
+                                      compressor=compressor)
+
+        acquisition = acquisition_class()
+        if not pool.get('demo') and acquisition is not ProcessAcquisition:
+            dataReader.start()
+        self.acquisition = acquisition(channel_plan, None,
+                                       pool.config('time_interval', float),
+                                       self.cycle_start_time.timestamp(),
+                                       sample_sinks=(self.recorder,),
+                                       stop_event=self.stop_event)
+        self.read_thread = Thread(target=self.acquisition.run)
+        self.read_thread.daemon = True
+        self.read_thread.start()
+        print(f"Cycle started: {self.log_path}")
+
+    def write_cycle_sample(self, row):
+        # row: [process_time, v1, ... , Vn, sampling_time]
+        # the metrics as of this row, saved with the block that holds it
+        self.cycle_log.write_sample(row[-1], row[1:-1], self.metrics.state())
+        if self.cycle_db is not None:
+            self.cycle_db.write_sample(row[-1], row[1:-1])
+
+    def export_csv(self, final=False):
+        if self.cycle_log.is_alive():
+            self.cycle_log.flush(timeout=5)
+        self.csv_exporter.update(final)
+
+    def stop(self, *args):
+        self.stop_event.set()
+
+    def run(self):
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGTERM, self.stop)
+        self.start()
+
+        last_sync = last_status = monotonic()
+        while not self.stop_event.wait(POLL_INTERVAL) and self.read_thread.is_alive():
+            if monotonic() - last_sync >= pool.config('gdrive_update_interval', int):
+                self.sync_gdrive(delete_existing=False)
+                last_sync = monotonic()
+            if monotonic() - last_status >= self.status_interval:
+                self.print_status()
+                last_status = monotonic()
+
+        self.stop_event.set()
+        self.read_thread.join()
+        self.recorder.flush()
+        self.cycle_log.stop()
+        self.export_csv(final=True)
+        self.journal.finish(self.metrics.state())
+        if self.cycle_db is not None:
+            self.cycle_db.finish(clock.time(), self.metrics.state())
+        self.print_status()
+        self.sync_gdrive(delete_existing=False)
+        connection_pool.close_all()
+        print(f"Cycle stopped: {self.csv_path}")
+
+    def sync_gdrive(self, delete_existing=True):
+        try:
+            self.drive_sync.connect()
+            self.export_csv()
+            if self.drive_sync.sync_file(self.csv_path, 'text/csv', delete_existing) == 'upload':
+                print(Fore.GREEN + "Google drive CSV upload successful: {}. ".format(datetime.now().strftime("%H:%M:%S")))
+            else:
+                print(Fore.GREEN + "Google drive CSV update successful: {}. ".format(datetime.now().strftime("%H:%M:%S")))
+        except Exception as e:
+            print(Fore.RED + "Google drive update/upload failed: {}. \n".format(datetime.now().strftime("%H:%M:%S")) + str(e))
+
+    def print_status(self):
+        if not len(self.data_stack):
+            print("No samples yet.")
+            return
+        print(f"{len(self.data_stack)} samples, {self.data_stack.last()[0]:.2f} min. "
+              f"Core temp above setpoint: {self.metrics.core_temp_above_setpoint_time or 'N/A'} min, "
+              f"pressure drop core temp: {self.metrics.pressure_drop_core_temp or 'N/A'}")
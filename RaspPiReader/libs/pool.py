@@ -29,5 +29,9 @@ class Pool:
     def set_config(self, key, value):
         return self._setting.setValue(key, value)
 
+    def sync_config(self):
+        """Write changed settings to storage now rather than at exit."""
+        self._setting.sync()
+
 
 pool = Pool()
@@ -0,0 +1,164 @@
+from collections import deque
+from threading import Condition, Lock, Thread
+
+# Delivery policies
+INLINE = 'inline'  # called on the producer's thread: must be quick and must not block
+DROP_OLDEST = 'drop_oldest'  # own thread; when its queue is full the oldest sample is dropped
+BLOCK = 'block'  # own thread; when its queue is full the producer waits, nothing is lost
+POLICIES = (INLINE, DROP_OLDEST, BLOCK)
+
+QUEUE_SIZE = 1024
+
+
+def merge_unsampled(row, older):
+    """row, with its nan cells taken from older."""
+    return [value if value == value else old for value, old in zip(row, older)]
+
+
+class Subscription:
+    """
+    One consumer of the sample bus. Its deliveries follow its own grid of deadlines (first row's
+    timestamp + n * interval): it gets the published row nearest to each deadline, timestamps being
+    the rows' last column. So the delivered rows keep the subscriber's interval on average even when
+    it is not a multiple of the producer's (see SampleBus.producer_interval), each one off the grid
+    by at most half the producer's interval, and a subscriber asking for the producer's interval or
+    less gets every row. Channels not sampled in the delivered row (nan) take their latest value
+    from the rows skipped since the last delivery. Rows are shared between subscribers and must
+    not be modified.
+    """
+
+    def __init__(self, callback, interval=0.0, policy=INLINE, queue_size=QUEUE_SIZE, name=None):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown delivery policy {policy}, expected one of {', '.join(POLICIES)}")
+        self.callback = callback
+        self.interval = interval or 0.0
+        self.policy = policy
+        self.queue_size = max(1, queue_size)
+        self.name = name or getattr(callback, '__name__', 'subscriber')
+        self.tolerance = 0.0
+        self.delivered = 0
+        self.dropped = 0
+        self._deadline = None
+        self._held = None
+        self._closed = False
+        self._thread = None
+        if policy != INLINE:
+            self._queue = deque()
+            self._condition = Condition()
+            self._thread = Thread(target=self._run, name=f"sample bus: {self.name}")
+            self._thread.daemon = True
+            self._thread.start()
+
+    def set_producer_interval(self, producer_interval):
+        # a row is due once it is nearer to the deadline than the next row will be
+        self.tolerance = producer_interval / 2 if producer_interval else 0.0
+
+    def due(self, timestamp):
+        """Whether the row sampled at timestamp is delivered; moves the deadline past it if so."""
+        if self.interval <= 0:
+            return True
+        if self._deadline is None:
+            self._deadline = timestamp
+        if timestamp < self._deadline - self.tolerance:
+            return False
+        # next grid point, skipping those missed (e.g. while the producer was stopped)
+        self._deadline += self.interval * ((timestamp + self.tolerance - self._deadline) // self.interval + 1)
+        return True
+
+    def offer(self, row):
+        if not self.due(row[-1]):
+            self._held = row if self._held is None else merge_unsampled(row, self._held)
+            return
+        if self._held is not None:
+            row = merge_unsampled(row, self._held)
+            self._held = None
+        if self._thread is None:
+            self._deliver(row)
+            return
+        with self._condition:
+            if len(self._queue) >= self.queue_size:
+                if self.policy == DROP_OLDEST:
+                    self._queue.popleft()
+                    self.dropped += 1
+                else:
+                    while len(self._queue) >= self.queue_size and not self._closed:
+                        self._condition.wait()
+            if self._closed:
+                return
+            self._queue.append(row)
+            self._condition.notify_all()
+
+    def _deliver(self, row):
+        try:
+            self.callback(row)
+            self.delivered += 1
+        except Exception as e:
+            print(f"Sample subscriber {self.name} failed.\n" + str(e))
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                row = self._queue.popleft()
+                self._condition.notify_all()
+            self._deliver(row)
+
+    def close(self, timeout=None):
+        """Stop taking rows; a queued subscriber first delivers what it already holds."""
+        if self._thread is None:
+            self._closed = True
+            return
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+
+
+class SampleBus:
+    """
+    Fan-out of one acquisition producer's rows to any number of subscribers (panel preview, cycle
+    recording, alarms, network sinks ...), each with its own rate and delivery policy, so adding a
+    consumer adds no traffic on the Modbus link. The producer calls publish() for every scan.
+    """
+
+    def __init__(self):
+        self._subscriptions = ()
+        self._lock = Lock()
+        self.interval = None
+
+    def subscribe(self, callback, interval=0.0, policy=INLINE, queue_size=QUEUE_SIZE, name=None):
+        subscription = Subscription(callback, interval, policy, queue_size, name)
+        subscription.set_producer_interval(self.interval)
+        with self._lock:
+            self._subscriptions += (subscription,)
+        return subscription
+
+    def unsubscribe(self, subscription, timeout=None):
+        with self._lock:
+            self._subscriptions = tuple(s for s in self._subscriptions if s is not subscription)
+        subscription.close(timeout)
+
+    def publish(self, row):
+        for subscription in self._subscriptions:
+            subscription.offer(row)
+
+    def producer_interval(self):
+        """
+        The interval the producer should run at: the shortest one asked for (None if no subscriber
+        asks for one). Subscribers' decimation is set up for it.
+        """
+        intervals = [s.interval for s in self._subscriptions if s.interval > 0]
+        self.interval = min(intervals) if intervals else None
+        for subscription in self._subscriptions:
+            subscription.set_producer_interval(self.interval)
+        return self.interval
+
+    def subscriptions(self):
+        return self._subscriptions
+
+    def close(self):
+        for subscription in self._subscriptions:
+            self.unsubscribe(subscription)
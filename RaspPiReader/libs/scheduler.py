@@ -0,0 +1,48 @@
+from threading import Event
+from time import monotonic
+
+
+class DeadlineScheduler:
+    """
+    Paces a loop on a fixed grid of absolute deadlines (start + n * interval) measured on the
+    monotonic clock, so the grid neither drifts by the work duration nor follows wall-clock jumps.
+    When an iteration overruns its slot, the next iteration runs immediately for the most recent
+    grid point; ticks passed over entirely are skipped and counted.
+    """
+
+    def __init__(self, interval, stop_event=None):
+        self.interval = interval
+        self.stop_event = stop_event or Event()
+        self.overruns = 0
+        self.missed_ticks = 0
+        self.last_overrun = 0.0
+        self.start()
+
+    def start(self):
+        self.start_time = monotonic()
+        self.tick = 0
+
+    def deadline(self, tick):
+        return self.start_time + tick * self.interval
+
+    def wait(self):
+        """
+        Sleep until the next tick. Returns False if the stop event was set while waiting.
+        """
+        next_tick = self.tick + 1
+        now = monotonic()
+        if now > self.deadline(next_tick):
+            current_tick = max(next_tick, int((now - self.start_time) // self.interval))
+            self.overruns += 1
+            self.missed_ticks += current_tick - next_tick
+            self.last_overrun = now - self.deadline(next_tick)
+            self.tick = current_tick
+            return not self.stop_event.is_set()
+        self.tick = next_tick
+        return not self.stop_event.wait(self.deadline(next_tick) - now)
+
+    def elapsed(self):
+        return monotonic() - self.start_time
+
+    def stop(self):
+        self.stop_event.set()
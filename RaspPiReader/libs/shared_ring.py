@@ -0,0 +1,84 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+
+RING_CAPACITY = 1 << 16
+HEADER_BYTES = 64
+
+
+class SharedRing:
+    """
+    Fixed-size ring of float64 rows in a multiprocessing.shared_memory block, for one writer process
+    and any number of reader processes.
+
+    The header holds seq, the number of rows written so far; row k lives in slot k % capacity.
+    The writer fills a slot before publishing it by incrementing seq, so a reader that has seen seq
+    only ever reads complete rows. Readers keep their own position and get zero-copy views, which
+    stay valid until the writer laps them (capacity rows later); rows lapped before they were read
+    are reported as lost.
+    """
+
+    def __init__(self, shm, n_columns, capacity, owner=False, readonly=False):
+        self.shm = shm
+        self.n_columns = n_columns
+        self.capacity = capacity
+        self.owner = owner
+        self._header = np.ndarray((1,), dtype=np.int64, buffer=shm.buf)
+        self._data = np.ndarray((capacity, n_columns), dtype=np.float64, buffer=shm.buf, offset=HEADER_BYTES)
+        if readonly:
+            self._data.flags.writeable = False
+
+    @staticmethod
+    def size(n_columns, capacity):
+        return HEADER_BYTES + n_columns * capacity * 8
+
+    @classmethod
+    def create(cls, n_columns, capacity=RING_CAPACITY, readonly=False):
+        shm = shared_memory.SharedMemory(create=True, size=cls.size(n_columns, capacity))
+        ring = cls(shm, n_columns, capacity, owner=True, readonly=readonly)
+        ring._header[0] = 0
+        return ring
+
+    @classmethod
+    def attach(cls, name, n_columns, capacity=RING_CAPACITY, readonly=False):
+        return cls(shared_memory.SharedMemory(name=name), n_columns, capacity, readonly=readonly)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def seq(self):
+        return int(self._header[0])
+
+    def __len__(self):
+        return self.seq
+
+    def append(self, row):
+        seq = self.seq
+        self._data[seq % self.capacity] = row
+        self._header[0] = seq + 1
+
+    def read(self, since):
+        """
+        Rows published after position `since`, as (blocks, seq, lost): blocks is a list of at most two
+        (n_rows, n_columns) views in order, seq the position to pass next time.
+        """
+        seq = self.seq
+        start = max(since, seq - self.capacity)
+        lost = start - since
+        if seq == start:
+            return [], seq, lost
+        first, last = start % self.capacity, seq % self.capacity
+        if first < last:
+            return [self._data[first:last]], seq, lost
+        blocks = [self._data[first:]]
+        if last:
+            blocks.append(self._data[:last])
+        return blocks, seq, lost
+
+    def close(self):
+        self._header = self._data = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
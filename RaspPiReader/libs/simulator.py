@@ -0,0 +1,394 @@
+"""
+Virtual Modbus slaves for benchmarking and trying the logger without hardware.
+
+The simulator answers read holding / input registers (3, 4) and write register(s) (6, 16) requests
+on a pseudo-terminal (RTU, POSIX only) or on a TCP port (Modbus TCP or RTU over TCP), so the real
+DataReader / pymodbus path is exercised end to end. Usage:
+
+    python -m RaspPiReader.libs.simulator --slaves 1,2 --profile sine
+    python -m RaspPiReader.libs.simulator --tcp 127.0.0.1:5020 --latency 5 --timeout-rate 0.01
+
+and set the printed serial port (or host:port with the matching transport) in the connection settings.
+"""
+import argparse
+import csv
+import math
+import os
+import random
+import select
+import socketserver
+import struct
+import time
+from threading import Lock
+
+READ_HOLDING_REGISTERS = 3
+READ_INPUT_REGISTERS = 4
+WRITE_REGISTER = 6
+WRITE_REGISTERS = 16
+
+ILLEGAL_FUNCTION = 1
+ILLEGAL_DATA_ADDRESS = 2
+ILLEGAL_DATA_VALUE = 3
+SLAVE_DEVICE_FAILURE = 4
+
+MAX_REGISTERS_PER_READ = 125
+# a partial RTU frame older than this is dropped, like the 3.5 character silence on a real line
+FRAME_GAP = 0.05
+
+PROFILES = ('constant', 'ramp', 'sine', 'noise', 'replay')
+DEMO_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'demo.csv')
+
+
+def _crc_table():
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+CRC_TABLE = _crc_table()
+
+
+def crc16(data):
+    crc = 0xFFFF
+    for byte in data:
+        crc = (crc >> 8) ^ CRC_TABLE[(crc ^ byte) & 0xFF]
+    return struct.pack('<H', crc)
+
+
+class Profile:
+    """
+    Register values over time. Values are in engineering units and sent with `decimals`
+    implied decimal places, as the channel settings expect them. Every slave / register
+    gets its own phase so that channels do not all show the same curve.
+      constant: base
+      ramp:     base + rate * t, starting over after `period` seconds
+      sine:     base + amplitude * sin(2 pi t / period)
+      noise:    base + gaussian noise of standard deviation `amplitude`
+      replay:   the rows of demo.csv, one per `period` seconds, column by register
+    """
+
+    def __init__(self, kind='sine', base=25.0, amplitude=10.0, period=60.0, rate=1.0, decimals=1,
+                 replay_file=DEMO_CSV):
+        if kind not in PROFILES:
+            raise ValueError(f"Unknown profile {kind}, expected one of {', '.join(PROFILES)}")
+        self.kind = kind
+        self.base = base
+        self.amplitude = amplitude
+        self.period = period
+        self.rate = rate
+        self.scale = pow(10, decimals)
+        self.rows = None
+        if kind == 'replay':
+            with open(replay_file) as file:
+                self.rows = [[float(value) for value in row] for row in csv.reader(file) if row]
+
+    def value(self, dev, addr, t):
+        phase = (dev * 7 + addr) % 16 / 16
+        if self.kind == 'constant':
+            value = self.base
+        elif self.kind == 'ramp':
+            value = self.base + self.rate * ((t + phase * self.period) % self.period)
+        elif self.kind == 'sine':
+            value = self.base + self.amplitude * math.sin(2 * math.pi * (t / self.period + phase))
+        elif self.kind == 'noise':
+            value = random.gauss(self.base, self.amplitude)
+        else:
+            row = self.rows[int(t / self.period) % len(self.rows)]
+            value = row[addr % len(row)]
+        return int(round(value * self.scale)) & 0xFFFF
+
+
+class VirtualSlave:
+    """
+    One slave address. Written registers keep their value, everything else follows the profile.
+    Faults are injected per request: no answer (timeout), a corrupted CRC, or a slave device
+    failure exception response.
+    """
+
+    def __init__(self, address, profile=None, latency=0.0, jitter=0.0, timeout_rate=0.0,
+                 crc_error_rate=0.0, exception_rate=0.0):
+        self.address = address
+        self.profile = profile or Profile()
+        self.latency = latency
+        self.jitter = jitter
+        self.timeout_rate = timeout_rate
+        self.crc_error_rate = crc_error_rate
+        self.exception_rate = exception_rate
+        self.written = dict()
+        self.requests = 0
+
+    def register(self, addr, t):
+        if addr in self.written:
+            return self.written[addr]
+        return self.profile.value(self.address, addr, t)
+
+    def handle(self, pdu, t):
+        """Response PDU for a request PDU."""
+        function = pdu[0]
+        if random.random() < self.exception_rate:
+            return exception_response(function, SLAVE_DEVICE_FAILURE)
+        if function in (READ_HOLDING_REGISTERS, READ_INPUT_REGISTERS):
+            if len(pdu) != 5:
+                return exception_response(function, ILLEGAL_DATA_VALUE)
+            addr, count = struct.unpack('>HH', pdu[1:5])
+            if not 1 <= count <= MAX_REGISTERS_PER_READ:
+                return exception_response(function, ILLEGAL_DATA_VALUE)
+            if addr + count > 0x10000:
+                return exception_response(function, ILLEGAL_DATA_ADDRESS)
+            values = [self.register(addr + i, t) for i in range(count)]
+            return struct.pack('>BB%dH' % count, function, count * 2, *values)
+        if function == WRITE_REGISTER:
+            if len(pdu) != 5:
+                return exception_response(function, ILLEGAL_DATA_VALUE)
+            addr, value = struct.unpack('>HH', pdu[1:5])
+            self.written[addr] = value
+            return bytes(pdu)
+        if function == WRITE_REGISTERS:
+            if len(pdu) < 6:
+                return exception_response(function, ILLEGAL_DATA_VALUE)
+            addr, count, byte_count = struct.unpack('>HHB', pdu[1:6])
+            if byte_count != count * 2 or len(pdu) != 6 + byte_count:
+                return exception_response(function, ILLEGAL_DATA_VALUE)
+            for i, value in enumerate(struct.unpack('>%dH' % count, pdu[6:])):
+                self.written[addr + i] = value
+            return struct.pack('>BHH', function, addr, count)
+        return exception_response(function, ILLEGAL_FUNCTION)
+
+
+def exception_response(function, code):
+    return struct.pack('>BB', function | 0x80, code)
+
+
+def rtu_frame_length(buffer):
+    """Length of the RTU request at the start of buffer, 0 if more bytes are needed, None if unknown."""
+    if len(buffer) < 2:
+        return 0
+    function = buffer[1]
+    if function in (READ_HOLDING_REGISTERS, READ_INPUT_REGISTERS, WRITE_REGISTER):
+        return 8
+    if function == WRITE_REGISTERS:
+        return 9 + buffer[6] if len(buffer) >= 7 else 0
+    return None
+
+
+class Simulator:
+    """A bus of virtual slaves. baudrate, if set, adds the serial transmission time to every answer."""
+
+    def __init__(self, slaves, baudrate=None):
+        self.slaves = {slave.address: slave for slave in slaves}
+        self.baudrate = baudrate
+        self.started = time.monotonic()
+        self.lock = Lock()  # one request at a time, as on a serial line
+
+    def respond(self, unit, pdu):
+        """
+        Response PDU, or None if the slave does not answer (unknown address or injected timeout).
+        Second value: True if the answer should be sent with a corrupted CRC.
+        """
+        slave = self.slaves.get(unit)
+        if slave is None:
+            return None, False
+        with self.lock:
+            slave.requests += 1
+            if random.random() < slave.timeout_rate:
+                return None, False
+            delay = slave.latency + random.uniform(0, slave.jitter)
+            response = slave.handle(pdu, time.monotonic() - self.started)
+            if self.baudrate:
+                # 11 bits per character, request and response, plus address and CRC
+                delay += (len(pdu) + len(response) + 6) * 11 / self.baudrate
+            if delay > 0:
+                time.sleep(delay)
+            return response, random.random() < slave.crc_error_rate
+
+    def handle_rtu(self, frame):
+        """Response frame for an RTU request frame, None for no answer."""
+        if len(frame) < 4 or crc16(frame[:-2]) != frame[-2:]:
+            return None  # garbled requests are ignored by real slaves too
+        unit = frame[0]
+        response, corrupt = self.respond(unit, frame[1:-2])
+        if response is None:
+            return None
+        body = bytes([unit]) + response
+        crc = crc16(body)
+        if corrupt:
+            crc = bytes([crc[0] ^ 0xFF, crc[1]])
+        return body + crc
+
+    def handle_mbap(self, header, pdu):
+        """Response for a Modbus TCP request, None for no answer."""
+        transaction, protocol, length, unit = struct.unpack('>HHHB', header)
+        response, corrupt = self.respond(unit, pdu)
+        if response is None:
+            return None
+        if corrupt:
+            # no CRC in Modbus TCP, send a truncated answer instead
+            response = response[:2]
+        return struct.pack('>HHHB', transaction, protocol, len(response) + 1, unit) + response
+
+    def stats(self):
+        return {address: slave.requests for address, slave in sorted(self.slaves.items())}
+
+
+class RtuStream:
+    """Splits a byte stream into RTU requests, resynchronising on garbage and stale partial frames."""
+
+    def __init__(self):
+        self.buffer = b''
+        self.last_data = 0.0
+
+    def feed(self, data):
+        now = time.monotonic()
+        if self.buffer and now - self.last_data > FRAME_GAP:
+            self.buffer = b''
+        self.last_data = now
+        self.buffer += data
+        frames = []
+        while self.buffer:
+            length = rtu_frame_length(self.buffer)
+            if length is None:
+                self.buffer = b''
+            elif length == 0 or len(self.buffer) < length:
+                break
+            else:
+                frames.append(self.buffer[:length])
+                self.buffer = self.buffer[length:]
+        return frames
+
+
+def serve_pty(simulator, link=None):
+    """Serve RTU on a new pseudo-terminal until interrupted. link: optional symlink to the slave side."""
+    import tty
+
+    master, slave = os.openpty()
+    tty.setraw(slave)
+    port = os.ttyname(slave)
+    if link:
+        if os.path.islink(link):
+            os.unlink(link)
+        os.symlink(port, link)
+        port = link
+    print(f"Serial port: {port}")
+    stream = RtuStream()
+    try:
+        while True:
+            readable, _, _ = select.select([master], [], [], 1.0)
+            if not readable:
+                continue
+            for frame in stream.feed(os.read(master, 1024)):
+                response = simulator.handle_rtu(frame)
+                if response is not None:
+                    os.write(master, response)
+    finally:
+        if link and os.path.islink(link):
+            os.unlink(link)
+        os.close(slave)
+        os.close(master)
+
+
+class _TcpHandler(socketserver.BaseRequestHandler):
+
+    def handle(self):
+        simulator = self.server.simulator
+        connection = self.request
+        if self.server.rtu:
+            stream = RtuStream()
+            while True:
+                data = connection.recv(1024)
+                if not data:
+                    return
+                for frame in stream.feed(data):
+                    response = simulator.handle_rtu(frame)
+                    if response is not None:
+                        connection.sendall(response)
+        while True:
+            header = _recv_exactly(connection, 7)
+            if header is None:
+                return
+            length = struct.unpack('>H', header[4:6])[0]
+            pdu = _recv_exactly(connection, length - 1)
+            if pdu is None:
+                return
+            response = simulator.handle_mbap(header, pdu)
+            if response is not None:
+                connection.sendall(response)
+
+
+def _recv_exactly(connection, size):
+    data = b''
+    while len(data) < size:
+        chunk = connection.recv(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+class TcpServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, simulator, address, rtu=False):
+        super(TcpServer, self).__init__(address, _TcpHandler)
+        self.simulator = simulator
+        self.rtu = rtu
+
+
+def serve_tcp(simulator, host, port, rtu=False):
+    """Serve Modbus TCP (or RTU frames over TCP) until interrupted."""
+    with TcpServer(simulator, (host, port), rtu) as server:
+        print(f"Listening on {host}:{server.server_address[1]} ({'RTU over TCP' if rtu else 'Modbus TCP'})")
+        server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--slaves', default='1', help='slave addresses in hex, comma separated (default 1)')
+    parser.add_argument('--tcp', metavar='HOST:PORT', help='listen on TCP instead of a pseudo-terminal')
+    parser.add_argument('--rtu-over-tcp', action='store_true', help='RTU frames on the TCP port')
+    parser.add_argument('--link', help='symlink to create for the pseudo-terminal, e.g. /tmp/ttySIM0')
+    parser.add_argument('--profile', choices=PROFILES, default='sine')
+    parser.add_argument('--base', type=float, default=25.0)
+    parser.add_argument('--amplitude', type=float, default=10.0)
+    parser.add_argument('--period', type=float, default=60.0, help='seconds')
+    parser.add_argument('--rate', type=float, default=1.0, help='ramp rate, units per second')
+    parser.add_argument('--decimals', type=int, default=1)
+    parser.add_argument('--baudrate', type=int, help='simulate the transmission time at this baud rate')
+    parser.add_argument('--latency', type=float, default=0.0, help='response delay, ms')
+    parser.add_argument('--jitter', type=float, default=0.0, help='random extra delay up to, ms')
+    parser.add_argument('--timeout-rate', type=float, default=0.0, help='fraction of requests not answered')
+    parser.add_argument('--crc-error-rate', type=float, default=0.0, help='fraction of answers corrupted')
+    parser.add_argument('--exception-rate', type=float, default=0.0,
+                        help='fraction of requests answered with an exception')
+    parser.add_argument('--seed', type=int, help='random seed, for repeatable fault injection')
+    args = parser.parse_args(argv)
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    profile = Profile(args.profile, args.base, args.amplitude, args.period, args.rate, args.decimals)
+    slaves = [VirtualSlave(int(address, 16), profile,
+                           latency=args.latency / 1000,
+                           jitter=args.jitter / 1000,
+                           timeout_rate=args.timeout_rate,
+                           crc_error_rate=args.crc_error_rate,
+                           exception_rate=args.exception_rate)
+              for address in args.slaves.split(',') if address.strip()]
+    simulator = Simulator(slaves, args.baudrate)
+    print(f"Slaves: {', '.join('%X' % slave.address for slave in slaves)}, profile: {args.profile}")
+    try:
+        if args.tcp:
+            host, _, port = args.tcp.rpartition(':')
+            serve_tcp(simulator, host or '127.0.0.1', int(port), args.rtu_over_tcp)
+        else:
+            serve_pty(simulator, args.link)
+    except KeyboardInterrupt:
+        pass
+    print(f"Requests per slave: {simulator.stats()}")
+
+
+if __name__ == '__main__':
+    main()
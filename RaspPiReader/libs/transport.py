@@ -0,0 +1,93 @@
+from threading import Lock
+
+import serial
+from pymodbus.client.sync import ModbusSerialClient, ModbusTcpClient
+from pymodbus.framer.rtu_framer import ModbusRtuFramer
+from pymodbus.framer.socket_framer import ModbusSocketFramer
+
+from RaspPiReader import pool
+from RaspPiReader.ui.setting_form_handler import TRANSPORT_TCP, TRANSPORT_RTU_OVER_TCP
+
+DEFAULT_TCP_PORT = 502
+SERIAL_TIMEOUT = 0.1
+TCP_TIMEOUT = 1.0
+
+
+def is_tcp(transport):
+    return transport in (TRANSPORT_TCP, TRANSPORT_RTU_OVER_TCP)
+
+
+def parse_host(address):
+    """"host[:port]" -> (host, port)"""
+    host, _, port = address.strip().partition(':')
+    return host, int(port) if port else DEFAULT_TCP_PORT
+
+
+def create_client(transport, address):
+    """
+    Modbus client for a serial port (RTU) or a host[:port] (Modbus TCP, or RTU frames tunnelled
+    through a TCP gateway).
+    """
+    if is_tcp(transport):
+        host, port = parse_host(address)
+        framer = ModbusRtuFramer if transport == TRANSPORT_RTU_OVER_TCP else ModbusSocketFramer
+        return ModbusTcpClient(host, port, framer=framer, timeout=TCP_TIMEOUT)
+
+    baudrate = pool.config('baudrate', int)
+    bytesize = pool.config('databits', int)
+    parity = [k for k in serial.PARITY_NAMES if serial.PARITY_NAMES[k] == pool.config('parity')][0]
+    stopbits = pool.config('stopbits', float)
+    if stopbits % 1 == 0:
+        stopbits = int(stopbits)
+    return ModbusSerialClient(method='rtu',
+                              port=address,
+                              baudrate=baudrate,
+                              bytesize=bytesize,
+                              parity=parity,
+                              stopbits=stopbits,
+                              timeout=SERIAL_TIMEOUT
+                              )
+
+
+class ConnectionPool:
+    """
+    Keeps TCP connections open across DataReader.start()/stop(), keyed by (transport, address), so
+    restarting a reader does not pay for a new connection. Serial ports are not pooled: they are
+    closed on release so that another process can open them.
+    """
+
+    def __init__(self):
+        self._clients = dict()
+        self._lock = Lock()
+
+    def get(self, transport, address):
+        if not is_tcp(transport):
+            client = create_client(transport, address)
+        else:
+            with self._lock:
+                key = (transport, address)
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._clients[key] = create_client(transport, address)
+        client.connect()  # no-op on an open connection
+        return client
+
+    def release(self, client):
+        if client not in self._clients.values():
+            client.close()
+
+    def discard(self, client):
+        """Close a connection and forget it, so the next get() opens a new one."""
+        with self._lock:
+            for key in [key for key, pooled in self._clients.items() if pooled is client]:
+                del self._clients[key]
+        client.close()
+
+    def close_all(self):
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+
+
+connection_pool = ConnectionPool()
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'bus_status.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtWidgets
+
+
+class BusStatusForm():
+    def setupUi(self, parent):
+        parent.setObjectName("parent")
+        parent.resize(900, 500)
+        parent.centralwidget = QtWidgets.QWidget(parent)
+        parent.centralwidget.setObjectName("centralwidget")
+        parent.verticalLayout = QtWidgets.QVBoxLayout(parent.centralwidget)
+        parent.verticalLayout.setObjectName("verticalLayout")
+        parent.processLabel = QtWidgets.QLabel(parent.centralwidget)
+        parent.processLabel.setVisible(False)
+        parent.processLabel.setObjectName("processLabel")
+        parent.verticalLayout.addWidget(parent.processLabel)
+        parent.scanLabel = QtWidgets.QLabel(parent.centralwidget)
+        parent.scanLabel.setObjectName("scanLabel")
+        parent.verticalLayout.addWidget(parent.scanLabel)
+        parent.scanTable = QtWidgets.QTableWidget(parent.centralwidget)
+        parent.scanTable.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        parent.scanTable.setObjectName("scanTable")
+        parent.scanTable.setColumnCount(8)
+        parent.scanTable.setRowCount(0)
+        item = QtWidgets.QTableWidgetItem()
+        parent.scanTable.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        parent.scanTable.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        parent.scanTable.setHorizontalHeaderItem(2, item)
+        item = QtWidgets.QTableWidgetItem()
+        parent.scanTable.setHorizontalHeaderItem(3, item)
+        item = QtWidgets.QTableWidgetItem()
+        parent.scanTable.setHorizontalHeaderItem(4, item)
+        item = QtWidgets.QTableWidgetItem()
+        parent.scanTable.setHorizontalHeaderItem(5, item)
+        item = QtWidgets.QTableWidgetItem()
+        parent.scanTable.setHorizontalHeaderItem(6, item)
+        item = QtWidgets.QTableWidgetItem()
+        parent.scanTable.setHorizontalHeaderItem(7, item)
+        parent.scanTable.verticalHeader().setVisible(False)
+        parent.verticalLayout.addWidget(parent.scanTable)
+        parent.transactionLabel = QtWidgets.QLabel(parent.centralwidget)
+        parent.transactionLabel.setObjectName("transactionLabel")
+        parent.verticalLayout.addWidget(parent.transactionLabel)
+        parent.transactionTable = QtWidgets.QTableWidget(parent.centralwidget)
+        parent.transactionTable.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        parent.transactionTable.setObjectName("transactionTable")
+        parent.transactionTable.setColumnCount(13)
+        parent.transactionTable.setRowCount(0)
+        item = QtWidgets.QTableWidgetItem()
+        parent.transactionTable.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        parent.transactionTable.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        parent.transactionTable.setHorizontalHeaderItem(2, item)
+        item = QtWidgets.QTableWidgetItem()
+        parent.transactionTable.setHorizontalHeaderItem(3, item)
+        item = QtWidgets.QTableWidgetItem()
+        parent.transactionTable.setHorizontalHeaderItem(4, item)
+        item = QtWidgets.QTableWidgetItem()
+        parent.transactionTable.setHorizontalHeaderItem(5, item)
+        item = QtWidgets.QTableWidgetItem()
+        parent.transactionTable.setHorizontalHeaderItem(6, item)
+        item = QtWidgets.QTableWidgetItem()
+        parent.transactionTable.setHorizontalHeaderItem(7, item)
+        item = QtWidgets.QTableWidgetItem()
+        parent.transactionTable.setHorizontalHeaderItem(8, item)
+        item = QtWidgets.QTableWidgetItem()
+        parent.transactionTable.setHorizontalHeaderItem(9, item)
+        item = QtWidgets.QTableWidgetItem()
+        parent.transactionTable.setHorizontalHeaderItem(10, item)
+        item = QtWidgets.QTableWidgetItem()
+        parent.transactionTable.setHorizontalHeaderItem(11, item)
+        item = QtWidgets.QTableWidgetItem()
+        parent.transactionTable.setHorizontalHeaderItem(12, item)
+        parent.transactionTable.verticalHeader().setVisible(False)
+        parent.verticalLayout.addWidget(parent.transactionTable)
+        parent.horizontalLayout = QtWidgets.QHBoxLayout()
+        parent.horizontalLayout.setObjectName("horizontalLayout")
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        parent.horizontalLayout.addItem(spacerItem)
+        parent.resetPushButton = QtWidgets.QPushButton(parent.centralwidget)
+        parent.resetPushButton.setObjectName("resetPushButton")
+        parent.horizontalLayout.addWidget(parent.resetPushButton)
+        parent.closePushButton = QtWidgets.QPushButton(parent.centralwidget)
+        parent.closePushButton.setObjectName("closePushButton")
+        parent.horizontalLayout.addWidget(parent.closePushButton)
+        parent.verticalLayout.addLayout(parent.horizontalLayout)
+        parent.verticalLayout.setStretch(2, 1)
+        parent.verticalLayout.setStretch(4, 3)
+        parent.setCentralWidget(parent.centralwidget)
+
+        self.retranslateUi(parent)
+        QtCore.QMetaObject.connectSlotsByName(parent)
+
+    def retranslateUi(self, parent):
+        _translate = QtCore.QCoreApplication.translate
+        parent.setWindowTitle(_translate("parent", "Bus Status"))
+        parent.processLabel.setText(_translate("parent", "Acquisition runs in a separate process, its bus statistics are not available here."))
+        parent.scanLabel.setText(_translate("parent", "Scans"))
+        item = parent.scanTable.horizontalHeaderItem(0)
+        item.setText(_translate("parent", "Scan"))
+        item = parent.scanTable.horizontalHeaderItem(1)
+        item.setText(_translate("parent", "Count"))
+        item = parent.scanTable.horizontalHeaderItem(2)
+        item.setText(_translate("parent", "Interval (ms)"))
+        item = parent.scanTable.horizontalHeaderItem(3)
+        item.setText(_translate("parent", "Mean (ms)"))
+        item = parent.scanTable.horizontalHeaderItem(4)
+        item.setText(_translate("parent", "P95 (ms)"))
+        item = parent.scanTable.horizontalHeaderItem(5)
+        item.setText(_translate("parent", "Max (ms)"))
+        item = parent.scanTable.horizontalHeaderItem(6)
+        item.setText(_translate("parent", "Utilisation"))
+        item = parent.scanTable.horizontalHeaderItem(7)
+        item.setText(_translate("parent", "Overruns"))
+        parent.transactionLabel.setText(_translate("parent", "Transactions"))
+        item = parent.transactionTable.horizontalHeaderItem(0)
+        item.setText(_translate("parent", "Port"))
+        item = parent.transactionTable.horizontalHeaderItem(1)
+        item.setText(_translate("parent", "Slave"))
+        item = parent.transactionTable.horizontalHeaderItem(2)
+        item.setText(_translate("parent", "Register"))
+        item = parent.transactionTable.horizontalHeaderItem(3)
+        item.setText(_translate("parent", "Count"))
+        item = parent.transactionTable.horizontalHeaderItem(4)
+        item.setText(_translate("parent", "Mean (ms)"))
+        item = parent.transactionTable.horizontalHeaderItem(5)
+        item.setText(_translate("parent", "P50 (ms)"))
+        item = parent.transactionTable.horizontalHeaderItem(6)
+        item.setText(_translate("parent", "P95 (ms)"))
+        item = parent.transactionTable.horizontalHeaderItem(7)
+        item.setText(_translate("parent", "Max (ms)"))
+        item = parent.transactionTable.horizontalHeaderItem(8)
+        item.setText(_translate("parent", "OK"))
+        item = parent.transactionTable.horizontalHeaderItem(9)
+        item.setText(_translate("parent", "Timeout"))
+        item = parent.transactionTable.horizontalHeaderItem(10)
+        item.setText(_translate("parent", "CRC/Frame"))
+        item = parent.transactionTable.horizontalHeaderItem(11)
+        item.setText(_translate("parent", "Exception"))
+        item = parent.transactionTable.horizontalHeaderItem(12)
+        item.setText(_translate("parent", "Port Error"))
+        parent.resetPushButton.setText(_translate("parent", "Reset"))
+        parent.closePushButton.setText(_translate("parent", "Close"))
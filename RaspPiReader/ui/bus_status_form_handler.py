@@ -0,0 +1,72 @@
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QMainWindow, QTableWidgetItem
+
+from RaspPiReader import pool
+from RaspPiReader.libs.bus_metrics import bus_metrics
+from .busStatusForm import BusStatusForm
+
+REFRESH_INTERVAL_MS = 1000
+
+# bus_metrics.snapshot() keys of the table columns, in the order of the form's headers
+SCAN_COLUMNS = ['name', 'count', 'interval_ms', 'mean_ms', 'p95_ms', 'max_ms', 'utilisation', 'overruns']
+TRANSACTION_COLUMNS = ['port', 'slave', 'register', 'count', 'mean_ms', 'p50_ms', 'p95_ms', 'max_ms',
+                       'ok', 'timeout', 'invalid', 'exception', 'port_error']
+
+
+def format_cell(key, value):
+    if key == 'slave':
+        return f"{value:X}"
+    if key == 'register':
+        return f"0x{value:04X}"
+    if key == 'utilisation':
+        return f"{value:.0%}"
+    if isinstance(value, float):
+        return f"{value:.1f}"
+    return str(value)
+
+
+class BusStatusFormHandler(QMainWindow):
+    """
+    Live view of bus_metrics: scan time against the interval, and per register latency and errors.
+    bus_metrics counts this process's transactions only, so with acquisition_process (the devices
+    read in a separate process) the tables are disabled and a notice is shown instead.
+    """
+
+    def __init__(self):
+        super(BusStatusFormHandler, self).__init__()
+        self.form_obj = BusStatusForm()
+        self.form_obj.setupUi(self)
+        self.set_connections()
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(REFRESH_INTERVAL_MS)
+        self.refresh()
+
+    def set_connections(self):
+        self.resetPushButton.clicked.connect(self.reset)
+        self.closePushButton.clicked.connect(self.close)
+
+    def refresh(self):
+        # the devices are read in this process
+        local = not pool.config('acquisition_process', bool)
+        self.processLabel.setVisible(not local)
+        for widget in (self.scanTable, self.transactionTable, self.resetPushButton):
+            widget.setEnabled(local)
+        snapshot = bus_metrics.snapshot() if local else {'scans': [], 'transactions': []}
+        self.fill(self.scanTable, SCAN_COLUMNS, snapshot['scans'])
+        self.fill(self.transactionTable, TRANSACTION_COLUMNS, snapshot['transactions'])
+
+    @staticmethod
+    def fill(table, columns, rows):
+        table.setRowCount(len(rows))
+        for r, row in enumerate(rows):
+            for c, key in enumerate(columns):
+                table.setItem(r, c, QTableWidgetItem(format_cell(key, row[key])))
+
+    def reset(self):
+        bus_metrics.reset()
+        self.refresh()
+
+    def closeEvent(self, event):
+        self.timer.stop()
+        event.accept()
@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 
-# Form implementation generated from reading ui file '.\main_new.ui'
+# Form implementation generated from reading ui file 'main.ui'
 #
-# Created by: PyQt5 UI code generator 0.05.6
+# Created by: PyQt5 UI code generator 5.15.11
 #
 # WARNING: Any manual changes made to this file will be lost when pyuic5 is
 # run again.  Do not edit this file unless you know what you are doing.
@@ -81,7 +81,6 @@ class MainForm():
         parent.horizontalLayout_5.addLayout(parent.verticalLayout_7)
         parent.gridLayout_8.addLayout(parent.horizontalLayout_5, 0, 0, 1, 1)
         parent.verticalLayout_8.addWidget(parent.groupBox_9)
-
         parent.groupBox_run_stat = QtWidgets.QGroupBox(parent.cycle_infoGroupBox)
         font = QtGui.QFont()
         font.setPointSize(9)
@@ -99,11 +98,7 @@ class MainForm():
         parent.Label_run_duration.setFont(font)
         parent.Label_run_duration.setObjectName("Label_run_duration")
         parent.horizontalLayout_run_stat.addWidget(parent.Label_run_duration)
-        parent.verticalLayout_8.addWidget(parent.groupBox_run_stat)
-
         parent.run_duration = QtWidgets.QLabel(parent.groupBox_run_stat)
-
-
         palette = QtGui.QPalette()
         brush = QtGui.QBrush(QtGui.QColor(180, 0, 0))
         brush.setStyle(QtCore.Qt.SolidPattern)
@@ -115,19 +110,15 @@ class MainForm():
         brush.setStyle(QtCore.Qt.SolidPattern)
         palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.WindowText, brush)
         parent.run_duration.setPalette(palette)
-
         font = QtGui.QFont()
         font.setPointSize(16)
         font.setBold(True)
         font.setWeight(70)
         parent.run_duration.setFont(font)
-
         parent.run_duration.setObjectName("run_duration")
         parent.horizontalLayout_run_stat.addWidget(parent.run_duration)
         parent.gridLayout_run_stat.addLayout(parent.horizontalLayout_run_stat, 0, 0, 1, 1)
-
-        # spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
-        # parent.verticalLayout_8.addItem(spacerItem1)
+        parent.verticalLayout_8.addWidget(parent.groupBox_run_stat)
         parent.gridLayout_10.addLayout(parent.verticalLayout_8, 1, 2, 1, 1)
         parent.groupBox_7 = QtWidgets.QGroupBox(parent.cycle_infoGroupBox)
         font = QtGui.QFont()
@@ -180,15 +171,17 @@ class MainForm():
         parent.cH1Label_15.setFont(font)
         parent.cH1Label_15.setObjectName("cH1Label_15")
         parent.verticalLayout_3.addWidget(parent.cH1Label_15)
-        parent.horizontalLayout_3.addLayout(parent.verticalLayout_3)
-        parent.verticalLayout_2 = QtWidgets.QVBoxLayout()
-        parent.verticalLayout_2.setObjectName("verticalLayout_2")
         parent.cH1Label_cooldown = QtWidgets.QLabel(parent.groupBox_7)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
         parent.cH1Label_cooldown.setFont(font)
         parent.cH1Label_cooldown.setObjectName("cH1Label_cooldown")
         parent.verticalLayout_3.addWidget(parent.cH1Label_cooldown)
-
-
+        parent.horizontalLayout_3.addLayout(parent.verticalLayout_3)
+        parent.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        parent.verticalLayout_2.setObjectName("verticalLayout_2")
         parent.p1 = QtWidgets.QLabel(parent.groupBox_7)
         font = QtGui.QFont()
         font.setPointSize(9)
@@ -229,7 +222,6 @@ class MainForm():
         parent.p5.setFont(font)
         parent.p5.setObjectName("p5")
         parent.verticalLayout_2.addWidget(parent.p5)
-
         parent.p6 = QtWidgets.QLabel(parent.groupBox_7)
         font = QtGui.QFont()
         font.setPointSize(9)
@@ -238,7 +230,6 @@ class MainForm():
         parent.p6.setFont(font)
         parent.p6.setObjectName("p6")
         parent.verticalLayout_2.addWidget(parent.p6)
-
         parent.horizontalLayout_3.addLayout(parent.verticalLayout_2)
         parent.gridLayout_6.addLayout(parent.horizontalLayout_3, 0, 0, 1, 1)
         parent.gridLayout_10.addWidget(parent.groupBox_7, 1, 0, 1, 1)
@@ -522,8 +513,8 @@ class MainForm():
         parent.chLabel4.setObjectName("chLabel4")
         parent.formLayout.setWidget(3, QtWidgets.QFormLayout.LabelRole, parent.chLabel4)
         parent.horizontalLayout.addLayout(parent.formLayout)
-        spacerItem2 = QtWidgets.QSpacerItem(9, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
-        parent.horizontalLayout.addItem(spacerItem2)
+        spacerItem1 = QtWidgets.QSpacerItem(9, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        parent.horizontalLayout.addItem(spacerItem1)
         parent.formLayout_4 = QtWidgets.QFormLayout()
         parent.formLayout_4.setObjectName("formLayout_4")
         parent.chLabel5 = QtWidgets.QLabel(parent.groupBox)
@@ -896,33 +887,26 @@ class MainForm():
         parent.horizontalLayout_6.setObjectName("horizontalLayout_6")
         parent.verticalLayout_9 = QtWidgets.QVBoxLayout()
         parent.verticalLayout_9.setObjectName("verticalLayout_9")
-        # parent.ToolbarFrame = QtWidgets.QFrame(parent.mainPlotGroupBox)
-        # parent.ToolbarFrame.setMaximumSize(QtCore.QSize(16777215, 30))
-        # parent.ToolbarFrame.setFrameShape(QtWidgets.QFrame.StyledPanel)
-        # parent.ToolbarFrame.setFrameShadow(QtWidgets.QFrame.Raised)
-        # parent.ToolbarFrame.setObjectName("ToolbarFrame")
-        # parent.plotToolboxLayout = QtWidgets.QGridLayout(parent.ToolbarFrame)
-        # parent.plotToolboxLayout.setObjectName("plotToolboxLayout")
-        # parent.verticalLayout_9.addWidget(parent.ToolbarFrame)
         parent.PlotAreaFrame = QtWidgets.QFrame(parent.mainPlotGroupBox)
         parent.PlotAreaFrame.setMinimumSize(QtCore.QSize(500, 0))
         parent.PlotAreaFrame.setFrameShape(QtWidgets.QFrame.StyledPanel)
         parent.PlotAreaFrame.setFrameShadow(QtWidgets.QFrame.Raised)
         parent.PlotAreaFrame.setObjectName("PlotAreaFrame")
         parent.plotAreaLayout = QtWidgets.QGridLayout(parent.PlotAreaFrame)
+        parent.plotAreaLayout.setContentsMargins(0, 0, 0, 0)
         parent.plotAreaLayout.setObjectName("plotAreaLayout")
-
         parent.verticalLayout_9.addWidget(parent.PlotAreaFrame)
-        parent.plotAreaLayout.setContentsMargins(0, 0, 0, 0)
         parent.horizontalLayout_6.addLayout(parent.verticalLayout_9)
-        parent.legendScroll = QtWidgets.QScrollArea()
+        parent.legendScroll = QtWidgets.QScrollArea(parent.mainPlotGroupBox)
         parent.legendScroll.setWidgetResizable(True)
-        parent.legendScroll.setMaximumWidth(350)
-        parent.legendScroll.setMinimumWidth(250)
+        parent.legendScroll.setMinimumSize(QtCore.QSize(250, 0))
+        parent.legendScroll.setMaximumSize(QtCore.QSize(350, 16777215))
+        parent.legendScroll.setObjectName("legendScroll")
         parent.legendScrollWidget = QtWidgets.QWidget()
+        parent.legendScrollWidget.setObjectName("legendScrollWidget")
+        parent.formLayoutLegend = QtWidgets.QFormLayout(parent.legendScrollWidget)
+        parent.formLayoutLegend.setObjectName("formLayoutLegend")
         parent.legendScroll.setWidget(parent.legendScrollWidget)
-        parent.formLayoutLegend = QtWidgets.QFormLayout()
-        parent.legendScrollWidget.setLayout(parent.formLayoutLegend)
         parent.horizontalLayout_6.addWidget(parent.legendScroll)
         parent.gridLayout_9.addLayout(parent.horizontalLayout_6, 0, 0, 1, 1)
         parent.gridLayout_11.addWidget(parent.mainPlotGroupBox, 2, 0, 1, 1)
@@ -940,14 +924,8 @@ class MainForm():
         parent.statusbar = QtWidgets.QStatusBar(parent)
         parent.statusbar.setObjectName("statusbar")
         parent.setStatusBar(parent.statusbar)
-        parent.status_current_time = QtWidgets.QLabel(parent.statusbar)
-        parent.status_spacer_lbl = QtWidgets.QLabel(parent.statusbar)
-        parent.status_spacer_lbl.setText(5*" ")
-        parent.status_run_status = QtWidgets.QLabel(parent.statusbar)
-        parent.status_spacer_lbl2 = QtWidgets.QLabel(parent.statusbar)
-        parent.status_spacer_lbl2.setText(5 * " ")
-        parent.status_run_time = QtWidgets.QLabel(parent.statusbar)
-
+        parent.actionOpen_Cycle = QtWidgets.QAction(parent)
+        parent.actionOpen_Cycle.setObjectName("actionOpen_Cycle")
         parent.actionSetting = QtWidgets.QAction(parent)
         parent.actionSetting.setObjectName("actionSetting")
         parent.actionExit = QtWidgets.QAction(parent)
@@ -955,23 +933,19 @@ class MainForm():
         parent.actionStart = QtWidgets.QAction(parent)
         parent.actionStart.setObjectName("actionStart")
         parent.actionStop = QtWidgets.QAction(parent)
-        parent.actionStop.setObjectName("actionStop")
         parent.actionStop.setEnabled(False)
+        parent.actionStop.setObjectName("actionStop")
         parent.actionPlot_preview = QtWidgets.QAction(parent)
-        parent.actionPlot_preview.setObjectName("actionPlot_preview")
         parent.actionPlot_preview.setEnabled(False)
+        parent.actionPlot_preview.setObjectName("actionPlot_preview")
         parent.actionSync_GDrive = QtWidgets.QAction(parent)
-        parent.actionSync_GDrive.setObjectName("actionSync_GDrive")
         parent.actionSync_GDrive.setEnabled(False)
+        parent.actionSync_GDrive.setObjectName("actionSync_GDrive")
         parent.actionTest_GDrive = QtWidgets.QAction(parent)
         parent.actionTest_GDrive.setObjectName("actionTest_GDrive")
         parent.actionPrint_results = QtWidgets.QAction(parent)
-        parent.actionPrint_results.setObjectName("actionPrint_results")
         parent.actionPrint_results.setEnabled(False)
-        # parent.actionSave = QtWidgets.QAction(parent)
-        # parent.actionSave.setObjectName("actionSave")
-        # parent.actionSave_AS = QtWidgets.QAction(parent)
-        # parent.actionSave_AS.setObjectName("actionSave_AS")
+        parent.actionPrint_results.setObjectName("actionPrint_results")
         parent.actionPlot = QtWidgets.QAction(parent)
         parent.actionPlot.setCheckable(True)
         parent.actionPlot.setChecked(True)
@@ -980,8 +954,9 @@ class MainForm():
         parent.actionCycle_Info.setCheckable(True)
         parent.actionCycle_Info.setChecked(True)
         parent.actionCycle_Info.setObjectName("actionCycle_Info")
-        # parent.menuSetting.addAction(parent.actionSave)
-        # parent.menuSetting.addAction(parent.actionSave_AS)
+        parent.actionBus_Status = QtWidgets.QAction(parent)
+        parent.actionBus_Status.setObjectName("actionBus_Status")
+        parent.menuSetting.addAction(parent.actionOpen_Cycle)
         parent.menuSetting.addAction(parent.actionSetting)
         parent.menuSetting.addSeparator()
         parent.menuSetting.addAction(parent.actionExit)
@@ -993,6 +968,7 @@ class MainForm():
         parent.menuAction.addAction(parent.actionPrint_results)
         parent.menuView.addAction(parent.actionCycle_Info)
         parent.menuView.addAction(parent.actionPlot)
+        parent.menuView.addAction(parent.actionBus_Status)
         parent.menubar.addAction(parent.menuSetting.menuAction())
         parent.menubar.addAction(parent.menuView.menuAction())
         parent.menubar.addAction(parent.menuAction.menuAction())
@@ -1005,12 +981,14 @@ class MainForm():
         parent.setWindowTitle(_translate("parent", "Raspberry Pi Reader V1.00"))
         parent.cycle_infoGroupBox.setTitle(_translate("parent", "Cycle Info"))
         parent.groupBox_9.setTitle(_translate("parent", "Cycle Outcomes"))
-        parent.groupBox_run_stat.setTitle(_translate("parent", "Cycle Status"))
         parent.cH1Label_36.setText(_translate("parent", "TIME (min) CORE TEMP ≥ 0 °C:"))
         parent.cH1Label_37.setText(_translate("parent", "CORE TEMP WHEN \n"
 "PRESSURE RELEASED (°C):"))
         parent.o1.setText(_translate("parent", "N/A"))
         parent.o2.setText(_translate("parent", "N/A"))
+        parent.groupBox_run_stat.setTitle(_translate("parent", "Cycle Status"))
+        parent.Label_run_duration.setText(_translate("parent", "CYCLE DURATION:"))
+        parent.run_duration.setText(_translate("parent", "00:00:00"))
         parent.groupBox_7.setTitle(_translate("parent", "Cycle Set Parameters"))
         parent.cH1Label_12.setText(_translate("parent", "MAINTAIN VACUUM (KPa):"))
         parent.cH1Label_13.setText(_translate("parent", "SET CURE TEMP (°C):"))
@@ -1061,6 +1039,7 @@ class MainForm():
         parent.menuSetting.setTitle(_translate("parent", "File"))
         parent.menuAction.setTitle(_translate("parent", "Action"))
         parent.menuView.setTitle(_translate("parent", "View"))
+        parent.actionOpen_Cycle.setText(_translate("parent", "Open Cycle..."))
         parent.actionSetting.setText(_translate("parent", "Settings"))
         parent.actionExit.setText(_translate("parent", "Exit"))
         parent.actionStart.setText(_translate("parent", "Start"))
@@ -1069,9 +1048,6 @@ class MainForm():
         parent.actionSync_GDrive.setText(_translate("parent", "Sync GDrive"))
         parent.actionTest_GDrive.setText(_translate("parent", "Test GDrive Connection"))
         parent.actionPrint_results.setText(_translate("parent", "Print Results"))
-        # parent.actionSave.setText(_translate("parent", "Save"))
-        # parent.actionSave_AS.setText(_translate("parent", "Save As..."))
         parent.actionPlot.setText(_translate("parent", "Plot"))
         parent.actionCycle_Info.setText(_translate("parent", "Cycle Info"))
-        parent.Label_run_duration.setText(_translate("parent", "CYCLE DURATION:"))
-        parent.run_duration.setText(_translate("parent", "00:00:00"))
+        parent.actionBus_Status.setText(_translate("parent", "Bus Status"))
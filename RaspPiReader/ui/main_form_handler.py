@@ -1,4 +1,3 @@
-import csv
 import os.path
 import tempfile
 import webbrowser
@@ -6,19 +5,31 @@ from datetime import datetime
 
 import google
 import jinja2
+import numpy as np
 import pdfkit
-from PyQt5.QtCore import QTimer, pyqtSignal
-from PyQt5.QtGui import QFont
-from PyQt5.QtWidgets import QMainWindow, QErrorMessage, QMessageBox, QApplication
+from PyQt5.QtCore import QLocale, QTimer, Qt, pyqtSignal
+from PyQt5.QtGui import QBrush, QColor, QFont, QPalette
+from PyQt5.QtWidgets import (QMainWindow, QErrorMessage, QMessageBox, QFileDialog, QAbstractSpinBox, QDoubleSpinBox,
+                             QFrame, QGridLayout, QGroupBox, QLabel, QScrollArea, QWidget)
 from colorama import Fore
 
 from RaspPiReader import pool
-from RaspPiReader.libs.gdrive_api import GoogleDriveAPI
+from RaspPiReader.libs.channel_plan import load_active_channels, load_channel_count
+from RaspPiReader.libs.clock import clock
+from RaspPiReader.libs.csv_writer import cycle_info
+from RaspPiReader.libs.cycle_db import CycleDbWriter, import_cycle
+from RaspPiReader.libs.cycle_journal import CycleJournal, interrupted_cycle, mark_finished, recover
+from RaspPiReader.libs.cycle_log import EXTENSION, CsvExporter, CycleLogWriter, MappedCycleLog, cycle_header
+from RaspPiReader.libs.data_store import SampleStore
+from RaspPiReader.libs.gdrive_api import GoogleDriveAPI, DriveSync
+from RaspPiReader.libs.transport import connection_pool
 from RaspPiReader.ui.google_auth_form import GoogleAuthForm
+from .bus_status_form_handler import BusStatusFormHandler
 from .mainForm import MainForm
 from .plot_handler import InitiatePlotWidget
 from .plot_preview_form_handler import PlotPreviewFormHandler
-from .setting_form_handler import SettingFormHandler, CHANNEL_COUNT
+from .render_scheduler import RenderScheduler
+from .setting_form_handler import CHANNEL_COUNT, SettingFormHandler
 from .start_cycle_form_handler import StartCycleFormHandler
 
 
@@ -41,13 +52,21 @@ class MainFormHandler(QMainWindow):
         self.form_obj.setupUi(self)
         self.file_name = None
         self.folder_name = None
+        self.log_path = None
         self.csv_path = None
         self.pdf_path = None
+        self.drive_sync = None
+        self.cycle_log = None
+        self.journal = None
+        self.cycle_db = None
         pool.set('main_form', self)
         self.cycle_timer = QTimer()
+        # GUI refreshes are paced independently of the sampling rate
+        self.render_scheduler = RenderScheduler(self.update_data, parent=self)
         self.set_connections()
         self.start_cycle_form = pool.set('cycle_start_form', StartCycleFormHandler())
         self.showMaximized()
+        QTimer.singleShot(0, self.check_interrupted_cycle)
 
     def set_connections(self):
         # Actions
@@ -61,83 +80,148 @@ class MainFormHandler(QMainWindow):
         self.actionSync_GDrive.triggered.connect(self._sync_gdrive)
         self.actionTest_GDrive.triggered.connect(self.test_gdrive_connection)
         self.actionPlot_preview.triggered.connect(self.show_plot_preview)
+        self.actionOpen_Cycle.triggered.connect(self.open_cycle)
+        self.actionBus_Status.triggered.connect(self.show_bus_status)
         self.actionPrint_results.triggered.connect(self.open_pdf)
         self.cycle_timer.timeout.connect(self.cycle_timer_update)
         self.update_status_bar_signal.connect(self.update_status_bar)
         # buttons
 
-    def create_stack(self):
-        # initialize data stack: [[process_time(minutes)], [v1], [v2], ... , [V14], sampling_time,]
-        data_stack = []
-        test_data_stack = []
-        for i in range(CHANNEL_COUNT + 2):
-            data_stack.append([])
-            test_data_stack.append([])
-            self.data_stack = pool.set("data_stack", data_stack)
-            self.test_data_stack = pool.set("test_data_stack", test_data_stack)
+    def create_stack(self, data_stack=None):
+        # initialize data stack: [process_time(minutes), v1, v2, ... , Vn, sampling_time(epoch)]
+        self.channel_count = load_channel_count()
+        if data_stack is None:
+            data_stack = SampleStore(self.channel_count + 2)
+        self.data_stack = pool.set("data_stack", data_stack)
+        self.test_data_stack = pool.set("test_data_stack", SampleStore(self.channel_count + 2))
 
     def load_active_channels(self):
-        self.active_channels = []
-        for i in range(CHANNEL_COUNT):
-            if pool.config('active' + str(i + 1), bool):
-                self.active_channels.append(i + 1)
+        self.active_channels = load_active_channels()
         return pool.set('active_channels', self.active_channels)
 
     def _start(self):
-        self.gdrive_csv_file_id = None
-        self.gdrive_folder_id = None
-        self.gdrive_pdf_file_id = None
-
         self.create_stack()
         self.active_channels = self.load_active_channels()
+        self.initialize_cycle_view()
+        self.start_cycle_form.show()
+
+    def initialize_cycle_view(self):
+        self.drive_sync = None
+        self.render_scheduler.set_rate(pool.config('gui_refresh_rate', int))
         self.initialize_ui_panels()
         self.plot = self.create_plot(plot_layout=self.plotAreaLayout, legend_layout=self.formLayoutLegend)
-        self.start_cycle_form.show()
+
+    def check_interrupted_cycle(self):
+        """Offer to resume or finalize the cycle that was being recorded when the app last stopped."""
+        state = interrupted_cycle()
+        if state is None:
+            return
+        try:
+            data_stack, reader = recover(state)
+        except Exception as e:
+            print('Failed to recover the interrupted cycle.\n' + str(e))
+            return
+        last_sample = datetime.fromtimestamp(data_stack.last()[-1]).strftime("%Y/%m/%d %H:%M:%S") \
+            if len(data_stack) else '-'
+        msg = QMessageBox(self)
+        msg.setIcon(QMessageBox.Warning)
+        msg.setWindowTitle("Interrupted Cycle")
+        msg.setText(f"The cycle {os.path.basename(os.path.dirname(state['log_path']))} was interrupted.\n"
+                    f"{len(data_stack)} samples were recovered, the last one from {last_sample}.\n\n"
+                    "Resume recording it, or finalize it to export and report it?")
+        resume = msg.addButton("Resume", QMessageBox.AcceptRole)
+        finalize = msg.addButton("Finalize", QMessageBox.ActionRole)
+        msg.addButton(QMessageBox.Cancel)
+        # the channel settings must still match the log to append to it
+        resume.setEnabled(data_stack.n_columns == load_channel_count() + 2)
+        msg.exec_()
+        if msg.clickedButton() is resume:
+            self.resume_cycle(state, data_stack, reader)
+        elif msg.clickedButton() is finalize:
+            self.finalize_cycle(state, data_stack, reader)
+
+    def recover_cycle(self, state, data_stack, reader):
+        self.create_stack(data_stack)
+        self.active_channels = pool.set('active_channels', reader.active_channels)
+        self.start_cycle_form.restore_cycle(state, reader.start_time)
+        self.initialize_cycle_view()
+        self.update_cycle_info_pannel()
+        self.plot.update_plot()
+
+    def resume_cycle(self, state, data_stack, reader):
+        self.recover_cycle(state, data_stack, reader)
+        self.start_cycle_form.resume_cycle(state, reader)
+
+    def finalize_cycle(self, state, data_stack, reader):
+        self.recover_cycle(state, data_stack, reader)
+        self.start_cycle_form.cycle_end_time = datetime.fromtimestamp(data_stack.last()[-1]) \
+            if len(data_stack) else self.start_cycle_form.cycle_start_time
+        self.log_path = state['log_path']
+        self.csv_path = state['csv_path']
+        self.cycle_log = None
+        self.csv_exporter = CsvExporter(self.log_path, self.csv_path)
+        self.export_csv(final=True)
+        mark_finished(state)
+        if pool.config('cycle_db_path'):
+            # the database may miss the last batches before the crash, and the cycle's end
+            import_cycle(pool.config('cycle_db_path'), state['log_path'])
+        self.actionSync_GDrive.setEnabled(True)
+        self.actionPrint_results.setEnabled(True)
+        self.show_plot_preview()
 
     def _stop(self):
         self.start_cycle_form.stop_cycle()
+        self.render_scheduler.flush()
         self.actionStart.setEnabled(True)
         self.actionStop.setEnabled(False)
         self.actionSync_GDrive.setEnabled(True)
         self.actionPrint_results.setEnabled(True)
         self.show_plot_preview()
-        QTimer.singleShot(1000, self.close_csv_file)
+        QTimer.singleShot(1000, self.close_cycle_log)
 
 
     def show_plot_preview(self):
         self.plot_preview_form = pool.set('plot_preview_form', PlotPreviewFormHandler())
         self.plot_preview_form.initiate_plot(self.headers)
 
+    def open_cycle(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Open Cycle", pool.config('csv_file_path'),
+                                              "Cycle logs (*" + EXTENSION + ")")
+        if not path:
+            return
+        try:
+            cycle_log = MappedCycleLog(path)
+        except Exception as e:
+            msg = QMessageBox()
+            msg.setIcon(QMessageBox.Critical)
+            msg.setText("Failed to open the cycle.\n" + str(e))
+            msg.setStandardButtons(QMessageBox.Ok)
+            msg.exec_()
+            return
+        headers = [pool.config('h_label'), pool.config('left_v_label'), pool.config('right_v_label')]
+        self.cycle_preview_form = PlotPreviewFormHandler()
+        self.cycle_preview_form.initiate_plot(headers + cycle_log.channel_labels, cycle_log)
+
+    def show_bus_status(self):
+        self.bus_status_form = BusStatusFormHandler()
+        self.bus_status_form.show()
+
     def _sync_gdrive(self, *args,  upload_csv=True, upload_pdf=True, show_message=True, delete_existing=True):
         try:
-            gapi = GoogleDriveAPI()
-            init_data = gapi.check_creds()
-            if not self.gdrive_folder_id:
-                self.gdrive_folder_id = gapi.create_folder(self.folder_name)
+            if self.drive_sync is None:
+                self.drive_sync = DriveSync(self.folder_name)
+            self.drive_sync.connect()
             if upload_pdf:
-                if self.gdrive_pdf_file_id and delete_existing:
-                    gapi.delete_file(self.gdrive_pdf_file_id)
-                    self.gdrive_pdf_file_id = None
-
-                if not self.gdrive_pdf_file_id:
-                    self.gdrive_pdf_file_id = gapi.upload_file(self.folder_name, 'application/pdf', self.pdf_path,
-                                                               self.gdrive_folder_id)
+                if self.drive_sync.sync_file(self.pdf_path, 'application/pdf', delete_existing) == 'upload':
                     print(Fore.GREEN + "Google drive PDF upload successful: {}".format(datetime.now()))
                 else:
-                    gapi.update_file(self.gdrive_pdf_file_id, self.pdf_path)
                     print(Fore.GREEN + "Google drive PDF update successful: {}".format(datetime.now()))
 
             if upload_csv:
-                if self.gdrive_csv_file_id and delete_existing:
-                    gapi.delete_file(self.gdrive_csv_file_id)
-                    self.gdrive_csv_file_id = None
-
-                if not self.gdrive_csv_file_id:
-                    self.gdrive_csv_file_id = gapi.upload_file(self.folder_name, 'text/csv', self.csv_path,
-                                                               self.gdrive_folder_id)
+                self.export_csv()
+                if self.drive_sync.sync_file(self.csv_path, 'text/csv', delete_existing) == 'upload':
                     msg = "Google drive CSV upload successful: {}. ".format(datetime.now().strftime("%H:%M:%S"))
                 else:
-                    gapi.update_file(self.gdrive_csv_file_id, self.csv_path)
                     msg = "Google drive CSV update successful: {}. ".format(datetime.now().strftime("%H:%M:%S"))
                 print(Fore.GREEN + msg)
                 self.update_status_bar_signal.emit(msg, 10000, 'green')
@@ -225,7 +309,7 @@ class MainFormHandler(QMainWindow):
         self.headers.append(pool.config('h_label'))
         self.headers.append(pool.config('left_v_label'))
         self.headers.append(pool.config('right_v_label'))
-        for i in range(1, CHANNEL_COUNT + 1):
+        for i in range(1, self.channel_count + 1):
             self.headers.append(pool.config('label' + str(i)))
 
         # Clear old plot if exists
@@ -248,8 +332,8 @@ class MainFormHandler(QMainWindow):
 
     def initialize_ui_panels(self):
         self.immediate_panel_update_locked = False
-        active_channels = pool.get('active_channels')
-        for i in range(CHANNEL_COUNT):
+        self.setup_channel_widgets()
+        for i in range(self.channel_count):
 
             getattr(self, 'chLabel' + str(i + 1)).setText(pool.config('label' + str(i + 1)))
             spin_widget = getattr(self, 'ch' + str(i + 1) + 'Value')
@@ -260,36 +344,96 @@ class MainFormHandler(QMainWindow):
                 spin_widget.setDecimals(pool.config('decimal_point' + str(i + 1), int))
                 spin_widget.setMinimum(-999999)
                 spin_widget.setMaximum(+999999)
+        for i in range(self.channel_count, CHANNEL_COUNT):  # fixed panel widgets of channels not configured
+            getattr(self, 'ch' + str(i + 1) + 'Value').setEnabled(False)
+
+    def setup_channel_widgets(self, columns=2):
+        """chLabel<n> / ch<n>Value of the channels after the fixed ones, in a scrolled group box next to them."""
+        if self.channel_count <= CHANNEL_COUNT and not hasattr(self, 'groupBox_channels'):
+            return
+        if not hasattr(self, 'groupBox_channels'):
+            self.groupBox_channels = QGroupBox("Channels", self.groupBox_5)
+            font = QFont()
+            font.setPointSize(9)
+            font.setBold(True)
+            self.groupBox_channels.setFont(font)
+            self.groupBox_channels.setObjectName("groupBox_channels")
+            scroll_area = QScrollArea(self.groupBox_channels)
+            scroll_area.setFrameShape(QFrame.NoFrame)
+            scroll_area.setWidgetResizable(True)
+            self.channel_values_widget = QWidget()
+            self.gridLayout_channel_values = QGridLayout(self.channel_values_widget)
+            scroll_area.setWidget(self.channel_values_widget)
+            QGridLayout(self.groupBox_channels).addWidget(scroll_area, 0, 0, 1, 1)
+            self.horizontalLayout_2.addWidget(self.groupBox_channels)
+        channel = CHANNEL_COUNT + 1
+        while channel <= self.channel_count or hasattr(self, 'ch' + str(channel) + 'Value'):
+            if not hasattr(self, 'ch' + str(channel) + 'Value'):
+                self.add_channel_widget(channel, columns)
+            visible = channel <= self.channel_count
+            getattr(self, 'chLabel' + str(channel)).setVisible(visible)
+            getattr(self, 'ch' + str(channel) + 'Value').setVisible(visible)
+            channel += 1
+        self.groupBox_channels.setVisible(self.channel_count > CHANNEL_COUNT)
+
+    def add_channel_widget(self, channel, columns):
+        """Label and value of a channel after the fixed ones, styled like the fixed ch<n>Value."""
+        row, column = divmod(channel - CHANNEL_COUNT - 1, columns)
+        label = QLabel("CH" + str(channel), self.channel_values_widget)
+        font = QFont()
+        font.setPointSize(9)
+        label.setFont(font)
+        label.setObjectName("chLabel" + str(channel))
+        self.gridLayout_channel_values.addWidget(label, row, 2 * column, 1, 1)
+        value = QDoubleSpinBox(self.channel_values_widget)
+        palette = QPalette()
+        palette.setBrush(QPalette.Active, QPalette.Text, QBrush(QColor(180, 0, 0)))
+        palette.setBrush(QPalette.Inactive, QPalette.Text, QBrush(QColor(180, 0, 0)))
+        palette.setBrush(QPalette.Disabled, QPalette.Text, QBrush(QColor(120, 120, 120)))
+        value.setPalette(palette)
+        font = QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        value.setFont(font)
+        value.setLocale(QLocale(QLocale.English, QLocale.UnitedStates))
+        value.setAlignment(Qt.AlignCenter)
+        value.setReadOnly(True)
+        value.setButtonSymbols(QAbstractSpinBox.NoButtons)
+        value.setDecimals(1)
+        value.setObjectName("ch" + str(channel) + "Value")
+        self.gridLayout_channel_values.addWidget(value, row, 2 * column + 1, 1, 1)
+        setattr(self, "chLabel" + str(channel), label)
+        setattr(self, "ch" + str(channel) + "Value", value)
 
     def update_data(self):
-        self.update_csv_file()
-        QApplication.processEvents()
         self.update_immediate_values_panel()
-        # QApplication.processEvents()
         self.update_plot()
-        # QApplication.processEvents()
 
     def update_immediate_test_values_panel(self):
+        if not len(self.test_data_stack):
+            return
+        last_values = self.test_data_stack.latest()
         for i in self.active_channels:
+            if np.isnan(last_values[i]):  # not sampled yet
+                continue
             spin_widget = getattr(self, 'ch' + str(i) + 'Value')
-            if self.test_data_stack[i]:
-                spin_widget.setValue(self.test_data_stack[i][-1])
-            self.test_data_stack[i] = []
+            spin_widget.setValue(last_values[i])
+        self.test_data_stack.clear()
 
     def update_immediate_values_panel(self):
+        # the channel values are shown by the panel subscription (update_immediate_test_values_panel),
+        # which gets every sample, compressed or not, at the panel interval
         if self.immediate_panel_update_locked:
             return
         self.immediate_panel_update_locked = True
-        for i in range(CHANNEL_COUNT):
-            spin_widget = getattr(self, 'ch' + str(i + 1) + 'Value')
-            spin_widget.setValue(self.data_stack[i + 1][-1])
-            self.o1.setText(str(self.start_cycle_form.core_temp_above_setpoint_time or 'N/A'))
-            self.o2.setText(str(self.start_cycle_form.pressure_drop_core_temp or 'N/A'))
+        self.o1.setText(str(self.start_cycle_form.core_temp_above_setpoint_time or 'N/A'))
+        self.o2.setText(str(self.start_cycle_form.pressure_drop_core_temp or 'N/A'))
         self.immediate_panel_update_locked = False
 
     def cycle_timer_update(self):
-        self.run_duration.setText(timedelta2str(datetime.now() - self.start_cycle_form.cycle_start_time))
-        self.d6.setText(datetime.now().strftime("%H:%M:%S"))  # Cycle end time
+        now = clock.now()
+        self.run_duration.setText(timedelta2str(now - self.start_cycle_form.cycle_start_time))
+        self.d6.setText(now.strftime("%H:%M:%S"))  # Cycle end time
 
     def update_cycle_info_pannel(self):
         self.d1.setText(pool.config("cycle_id"))
@@ -306,54 +450,61 @@ class MainFormHandler(QMainWindow):
         self.p6.setText(pool.config("cool_down_temp"))
         self.cH1Label_36.setText(f"TIME (min) CORE TEMP ≥ {pool.config('core_temp_setpoint')} °C:")
 
-    def create_csv_file(self):
-        self.csv_update_locked = False
-        self.last_written_index = 0
-        file_extension = '.csv'
-        csv_full_path = os.path.join(self.start_cycle_form.folder_path,
-                                     self.start_cycle_form.file_name + file_extension)
-        self.csv_path = csv_full_path
-        delimiter = pool.config('csv_delimiter') or ' '
-        csv.register_dialect('unixpwd', delimiter=delimiter)
-        self.open_csv_file(mode='w')
-        self.write_cycle_info_to_csv()
-
-    def open_csv_file(self, mode='a'):
-        self.csv_file = open(self.csv_path, mode, newline='')
-        self.csv_writer = csv.writer(self.csv_file)
-
-    def close_csv_file(self):
-        self.csv_file.close()
-
-    def write_cycle_info_to_csv(self):
-        data = [
-            ["Work Order", pool.config("order_id")],
-            ["Cycle Number", pool.config("cycle_id")],
-            ["Quantity", pool.config("quantity")],
-            ["Process Start Time", self.start_cycle_form.cycle_start_time],
-        ]
-        self.csv_writer.writerows(data)
-        self.csv_writer.writerows([['Date', 'Time', 'Timer(min)'] + self.headers[3:]])
-
-    def update_csv_file(self):
-        if self.csv_update_locked:
-            return
-        self.csv_update_locked = True
-        n_data = len(self.data_stack[0])
-        temp_data = []
-
-        for i in range(self.last_written_index, n_data):
-            temp_rec = []
-            temp_rec.append(self.data_stack[15][i].strftime("%Y/%m/%d"))
-            temp_rec.append(self.data_stack[15][i].strftime("%H:%M:%S"))
-            temp_rec.append(self.data_stack[0][i])
-            for j in range(CHANNEL_COUNT):
-                temp_rec.append(self.data_stack[j + 1][i])
-            temp_data.append(temp_rec)
-        self.csv_writer.writerows(temp_data)
-        self.last_written_index = n_data
-        self.csv_file.flush()
-        self.csv_update_locked = False
+    def create_cycle_log(self):
+        # the cycle log is the record of the cycle, the CSV file is exported from it
+        path = os.path.join(self.start_cycle_form.folder_path, self.start_cycle_form.file_name)
+        self.log_path = path + EXTENSION
+        self.csv_path = path + '.csv'
+        compressor = self.start_cycle_form.compressor
+        header = cycle_header(self.start_cycle_form.cycle_start_time, self.headers[3:],
+                              compressor.modes if compressor else None, active_channels=self.active_channels)
+        self.open_cycle_log(header)
+
+    def resume_cycle_log(self, state, reader):
+        """Continue the log of an interrupted cycle after its last valid block."""
+        self.log_path = state['log_path']
+        self.csv_path = state['csv_path']
+        self.open_cycle_log(reader.header, append_at=reader.offset, metrics_state=state['metrics'])
+
+    def open_cycle_log(self, header, append_at=None, metrics_state=None):
+        info = cycle_info()
+        self.journal = CycleJournal(self.log_path, self.csv_path, header['start_time'], info, metrics_state)
+        # the log is the cycle's journal: every block is forced to disk
+        self.cycle_log = CycleLogWriter(self.log_path, header,
+                                        flush_rows=pool.config('csv_flush_rows', int),
+                                        flush_interval=pool.config('csv_flush_interval', float),
+                                        fsync=True, on_flush=self.journal.update, append_at=append_at)
+        self.journal.start()
+        self.cycle_log.start()
+        self.csv_exporter = CsvExporter(self.log_path, self.csv_path)
+        if pool.config('cycle_db_path'):
+            self.cycle_db = CycleDbWriter.open_cycle(pool.config('cycle_db_path'), self.start_cycle_form.file_name,
+                                                     header, info,
+                                                     flush_rows=pool.config('csv_flush_rows', int),
+                                                     flush_interval=pool.config('csv_flush_interval', float),
+                                                     # the database may miss the last batches before the crash
+                                                     log_path=None if append_at is None else self.log_path)
+
+    def close_cycle_log(self):
+        self.cycle_log.stop()
+        self.export_csv(final=True)
+        self.journal.finish(self.start_cycle_form.metrics.state())
+        if self.cycle_db is not None:
+            self.cycle_db.finish(self.start_cycle_form.cycle_end_time.timestamp(), self.start_cycle_form.metrics.state())
+            self.cycle_db = None
+
+    def export_csv(self, final=False):
+        """Bring the cycle CSV file up to date with the samples logged so far (all of them once final)."""
+        if self.cycle_log is not None and self.cycle_log.is_alive():
+            self.cycle_log.flush(timeout=5)
+        self.csv_exporter.update(final)
+
+    def write_cycle_sample(self, row):
+        # row: [process_time, v1, ... , Vn, sampling_time]
+        # the metrics as of this row, saved with the block that holds it
+        self.cycle_log.write_sample(row[-1], row[1:-1], self.start_cycle_form.metrics.state())
+        if self.cycle_db is not None:
+            self.cycle_db.write_sample(row[-1], row[1:-1])
 
     def show_error_and_stop(self, msg, parent=None):
         error_dialog = QErrorMessage(parent or self)
@@ -361,7 +512,7 @@ class MainFormHandler(QMainWindow):
         self.start_cycle_form.stop_cycle()
         self.actionStart.setEnabled(True)
         self.actionStop.setEnabled(False)
-        self.csv_file.close()
+        self.close_cycle_log()
 
     def generate_html_report(self, image_path=None):
         report_data = {
@@ -443,6 +594,7 @@ class MainFormHandler(QMainWindow):
         reply = QMessageBox.question(self, 'Exiting app ...',
                                      quit_msg, (QMessageBox.Yes | QMessageBox.Cancel))
         if reply == QMessageBox.Yes:
+            connection_pool.close_all()
             event.accept()
 
         elif reply == QMessageBox.Cancel:
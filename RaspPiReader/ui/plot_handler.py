@@ -1,19 +1,110 @@
+from collections import deque
+
+import numpy as np
 import pyqtgraph as pg
 import pyqtgraph.exporters
-from PyQt5.QtWidgets import QApplication, QLabel, QCheckBox
+from PyQt5.QtWidgets import QLabel, QCheckBox
 
 from RaspPiReader import pool
-
-DATA_SKIP_FACTOR = 10
+from RaspPiReader.libs.compression import DEADBAND
+from RaspPiReader.libs.decimation import MinMaxPyramid
+
+# Raw points per frozen curve segment.
+SEGMENT_SIZE = 1000
+# The history is drawn with about one min/max pair per pixel column.
+POINTS_PER_PIXEL = 2
+
+
+class ChannelCurve:
+    """
+    Plot items of one channel, split so a new sample only redraws a bounded amount of data:
+    the min/max envelope of samples older than the accurate-data window, frozen raw segments of
+    SEGMENT_SIZE points that are never redrawn, and the live tail that receives new points.
+    Rows in which the channel was not sampled or not stored (nan) are left out, so the line joins
+    its samples; with hold (deadband compression) each value is drawn flat up to the next one.
+    """
+
+    def __init__(self, container, pen, hold=False):
+        self.container = container
+        self.pen = pen
+        self.hold = hold
+        self.visible = True
+        self.segments = deque()
+        self.pyramid = MinMaxPyramid()
+        self.last_point = None  # last sample of the frozen segments
+        self.history = self._new_item()
+        self.tail = self._new_item()
+
+    def _new_item(self):
+        item = pg.PlotDataItem(pen=self.pen, autoDownsample=True)
+        item.setVisible(self.visible)
+        self.container.addItem(item)
+        return item
+
+    def sampled(self, x, y):
+        keep = ~np.isnan(y)
+        if keep.all():
+            return self.steps(x, y)
+        held_to = x[-1] if self.hold and len(x) else None
+        if not keep[0] and self.last_point is not None:
+            # join the previous segment's last sample
+            keep[0] = True
+            x, y = x.copy(), y.copy()
+            x[0], y[0] = self.last_point
+        x, y = x[keep], y[keep]
+        if held_to is not None and len(y) and x[-1] != held_to:
+            x, y = np.append(x, held_to), np.append(y, y[-1])
+        return self.steps(x, y)
+
+    def steps(self, x, y):
+        if not self.hold or len(y) < 2:
+            return x, y
+        return np.repeat(x, 2)[1:], np.repeat(y, 2)[:-1]
+
+    def freeze(self, x, y):
+        x, y = self.sampled(x, y)
+        item = self._new_item()
+        item.setData(x, y)
+        self.segments.append(item)
+        if len(y):
+            self.last_point = (x[-1], y[-1])
+
+    def drop_segment(self):
+        """The oldest frozen segment is now covered by the history."""
+        self.container.removeItem(self.segments.popleft())
+
+    def render_history(self, x, y, start, stop, max_points):
+        # the bridge point at stop joins the history to the first raw segment
+        idx = np.append(self.pyramid.envelope(start, stop, max_points), stop)
+        idx = idx[~np.isnan(y[idx])]
+        self.history.setData(*self.steps(x[idx], y[idx]))
+
+    def set_tail(self, x, y, live=None):
+        if live is not None:
+            # the latest sample, not stored (yet)
+            x, y = np.append(x, live[0]), np.append(y, live[1])
+        self.tail.setData(*self.sampled(x, y))
+
+    def set_visible(self, visible):
+        self.visible = visible
+        for item in (self.history, self.tail, *self.segments):
+            item.setVisible(visible)
 
 
 class InitiatePlotWidget:
+    """
+    Plot of the live data_stack, or of data, any store with its reading interface.
+    With history (a finished cycle) every row is drawn from the min/max envelopes at the
+    resolution of the view, so even a multi-day cycle is drawn without any raw segments.
+    """
 
-    def __init__(self, active_channels, parent_layout, legend_layout=None, headers=None):
+    def __init__(self, active_channels, parent_layout, legend_layout=None, headers=None, data=None, history=False):
         self.parent_layout = parent_layout
         self.headers = headers
         self.legend_layout = legend_layout
         self.active_channels = active_channels
+        self.data = data
+        self.history = history
         self.create_plot()
 
     def create_plot(self):
@@ -39,53 +130,102 @@ class InitiatePlotWidget:
             # self.left_plot.addLegend(colCount=2, brush='f5f5f5', labelTextColor='#242323')
             # self.right_plot.addLegend(colCount=2, brush='f5f5f5', labelTextColor='#242323')
 
-        self.last_data_index = 0
-        self.data = pool.get('data_stack')
+        self.n_plotted = 0
+        self.live_plotted = {}
+        self.tail_start = 0
+        self.segment_bounds = deque()
+        self.history_end = 0
+        self.history_key = None
+        if self.data is None:
+            self.data = pool.get('data_stack')
+        # a stored cycle is drawn with the compression it was recorded with
+        modes = getattr(self.data, 'compression_modes', None)
+        self.acc_time = pool.config('accuarate_data_time', float) or 0
 
         self.left_lines = [i for i in self.active_channels if pool.config('axis_direction' + str(i)) == 'L']
         self.right_lines = [i for i in self.active_channels if i not in self.left_lines]
 
+        self.curves = {}
         for i in self.active_channels:
-            args = {
-                'pen': {'color': pool.config("color" + str(i)), 'width': 2},
-                'autoDownsample': True
-            }
+            pen = {'color': pool.config("color" + str(i)), 'width': 2}
+            container = self.left_plot.getPlotItem() if i in self.left_lines else self.right_plot
+            mode = modes[i - 1] if modes else pool.config('compression' + str(i))
+            curve = ChannelCurve(container, pen, hold=mode == DEADBAND)
             if self.legend_layout is None:
-                args.update(name=self.headers[i + 2])
-            if i in self.left_lines:
-                curve = self.left_plot.plot([], [], **args)
-            else:
-                curve = pg.PlotCurveItem([], [], **args)
-                self.right_plot.addItem(curve)
-                if self.legend_layout is None:
-                    self.legend.addItem(curve, curve.name())
-
-            setattr(self, "line" + str(i), curve)
+                self.legend.addItem(curve.tail, self.headers[i + 2])
+            self.curves[i] = curve
+        self.left_plot.getViewBox().sigXRangeChanged.connect(self.render_history)
+        self.left_plot.getViewBox().sigResized.connect(self.render_history)
+
+    def live_points(self):
+        """
+        {channel: (process_time, value)} of the live data_stack's latest samples that are newer than
+        its last row: those compression holds back or leaves out, drawn at the end of the tails.
+        """
+        if self.history or not hasattr(self.data, 'latest_times') or self.data.start_time is None:
+            return {}
+        times = self.data.latest_times()
+        values = self.data.latest()
+        last = self.data[-1][-1]
+        return {i: ((times[i] - self.data.start_time) / 60, values[i]) for i in self.curves if times[i] > last}
 
     def update_plot(self):
-        n_data = len(self.data[0])
-        if n_data > self.last_data_index:
-            acc_time = pool.config('accuarate_data_time', float)
-            if acc_time > 0:
-                acc_index = 0
-                for i in range(n_data, 0, -1):
-                    if (self.data[0][-1] - self.data[0][i - 1]) > acc_time:
-                        acc_index = i
-                        break
-                for i in self.active_channels:
-                    getattr(self, "line" + str(i)) \
-                        .setData(self.data[0][0: acc_index: DATA_SKIP_FACTOR]
-                                 + self.data[0][acc_index:],
-                                 self.data[i][0: acc_index: DATA_SKIP_FACTOR]
-                                 + self.data[i][acc_index:])
-            else:
-                for i in self.active_channels:
-                    getattr(self, "line" + str(i)) \
-                        .setData(self.data[0], self.data[i])
-
-            self.left_plot.setXRange(0, self.data[0][-1])
-            self.last_data_index = len(self.data[0]) - 1
-            QApplication.processEvents()
+        n_data = len(self.data)
+        if n_data == 0:
+            return
+        live = self.live_points()
+        if n_data == self.n_plotted and live == self.live_plotted:
+            return
+        x = self.data[0]
+
+        if self.history:
+            for i, curve in self.curves.items():
+                curve.pyramid.update(self.data[i])
+            # the last row is the tail, joined to the history by its bridge point
+            self.history_end = self.tail_start = n_data - 1
+
+        while n_data - self.tail_start > SEGMENT_SIZE:
+            start, end = self.tail_start, self.tail_start + SEGMENT_SIZE
+            for i, curve in self.curves.items():
+                curve.freeze(np.array(x[start:end + 1]), np.array(self.data[i][start:end + 1]))
+            self.segment_bounds.append((start, end))
+            self.tail_start = end
+
+        if self.acc_time > 0 and not self.history:
+            for i, curve in self.curves.items():
+                curve.pyramid.update(self.data[i])
+            acc_index = int(x.searchsorted(x[-1] - self.acc_time))
+            while self.segment_bounds and self.segment_bounds[0][1] <= acc_index:
+                _, self.history_end = self.segment_bounds.popleft()
+                for curve in self.curves.values():
+                    curve.drop_segment()
+
+        for i, curve in self.curves.items():
+            curve.set_tail(x[self.tail_start:n_data], self.data[i][self.tail_start:n_data], live.get(i))
+
+        self.left_plot.setXRange(0, max([x[-1]] + [point[0] for point in live.values()]))
+        self.n_plotted = n_data
+        self.live_plotted = live
+        self.render_history()
+
+    def render_history(self, *args):
+        """Redraw the history envelopes if the visible part of the history or its resolution changed."""
+        if not self.history_end:
+            return
+        x = self.data[0]
+        view_box = self.left_plot.getViewBox()
+        x_min, x_max = view_box.viewRange()[0]
+        start = max(int(x.searchsorted(x_min)) - 1, 0)
+        stop = min(int(x.searchsorted(x_max, side='right')), self.history_end)
+        if stop <= start:
+            return
+        max_points = POINTS_PER_PIXEL * max(int(view_box.width()), 1)
+        key = (start, stop, max_points)
+        if key == self.history_key:
+            return
+        self.history_key = key
+        for i, curve in self.curves.items():
+            curve.render_history(x, self.data[i], start, stop, max_points)
 
     def update_views(self):
         self.right_plot.setGeometry(self.left_plot.getViewBox().sceneBoundingRect())
@@ -107,10 +247,7 @@ class InitiatePlotWidget:
         return check_box, label
 
     def show_hide_plot(self, index, state):
-        if state:
-            getattr(self, 'line' + str(index)).show()
-        else:
-            getattr(self, 'line' + str(index)).hide()
+        self.curves[index].set_visible(bool(state))
 
     def export_plot(self, full_export_path):
         exporter = pg.exporters.ImageExporter(self.left_plot.scene())
@@ -5,6 +5,7 @@ from PyQt5.QtWidgets import QMainWindow, QFileDialog
 
 from RaspPiReader import pool
 from .plotPreviewForm import PlotPreviewForm
+from .plot_handler import InitiatePlotWidget
 import pyqtgraph as pg
 
 class PlotPreviewFormHandler(QMainWindow):
@@ -15,6 +16,7 @@ class PlotPreviewFormHandler(QMainWindow):
         self.set_connections()
         self.plot_layout = self.PlotGridLayout
         self.plot = None
+        self.cycle_log = None
         # self.setWindowModality(Qt.ApplicationModal)
         self.showMaximized()
 
@@ -24,33 +26,48 @@ class PlotPreviewFormHandler(QMainWindow):
         self.cancelPushButton.clicked.connect(self.close)
 
     def close(self):
+        if self.cycle_log is not None:
+            self.cycle_log.close()
+            self.cycle_log = None
         super().close()
 
+    def default_image_path(self):
+        if self.cycle_log is not None:
+            return os.path.splitext(self.cycle_log.path)[0] + '.png'
+        cycle_form = pool.get('cycle_start_form')
+        return os.path.join(cycle_form.folder_path, cycle_form.file_name + '.png')
+
     def save_and_close(self, file_full_path=None):
         try:
             if not file_full_path:
-                cycle_form = pool.get('cycle_start_form')
-                file_full_path = os.path.join(cycle_form.folder_path, cycle_form.file_name + '.png')
+                file_full_path = self.default_image_path()
             self.plot.export_plot(file_full_path)
-            pool.get("main_form").generate_html_report(image_path=file_full_path)
-            pool.get("main_form").actionSync_GDrive.triggered.emit()
+            # the report and the Drive folder belong to the current cycle, not to a reopened one
+            if self.cycle_log is None:
+                pool.get("main_form").generate_html_report(image_path=file_full_path)
+                pool.get("main_form").actionSync_GDrive.triggered.emit()
         except Exception as e:
             print(e)
         self.close()
 
     def save_as_and_close(self):
-        cycle_form = pool.get('cycle_start_form')
-        file_full_path = os.path.join(cycle_form.folder_path, cycle_form.file_name + '.png')
-        new_file_name, _ = QFileDialog.getSaveFileName(self, "Save audio file", file_full_path, "Images (*.png)")
-        self.save_and_close(path=new_file_name)
+        new_file_name, _ = QFileDialog.getSaveFileName(self, "Save audio file", self.default_image_path(), "Images (*.png)")
+        if new_file_name:
+            self.save_and_close(file_full_path=new_file_name)
 
 
     def show(self):
         super().show()
 
-    def initiate_plot(self, headers):
-        mf = pool.get('main_form')
-        self.plot = mf.create_plot(plot_layout=self.plot_layout)
+    def initiate_plot(self, headers, cycle_log=None):
+        """Plot the current cycle, or the stored cycle_log (a cycle_log.MappedCycleLog)."""
+        if cycle_log is None:
+            self.plot = pool.get('main_form').create_plot(plot_layout=self.plot_layout)
+        else:
+            self.cycle_log = cycle_log
+            self.setWindowTitle(os.path.basename(cycle_log.path))
+            self.plot = InitiatePlotWidget(cycle_log.active_channels, self.plot_layout, headers=headers,
+                                           data=cycle_log, history=True)
 
         font = QFont()
         font.setPixelSize(20)
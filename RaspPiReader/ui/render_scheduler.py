@@ -0,0 +1,44 @@
+from time import monotonic
+
+from PyQt5.QtCore import QObject, QTimer
+
+DEFAULT_REFRESH_RATE = 10
+
+
+class RenderScheduler(QObject):
+    """
+    Coalesces any number of update requests into at most `rate` calls of `callback` per second.
+    request() is meant to be connected to a signal emitted from a worker thread; the callback
+    always runs on the thread that owns the scheduler (the GUI thread).
+    """
+
+    def __init__(self, callback, rate=DEFAULT_REFRESH_RATE, parent=None):
+        super(RenderScheduler, self).__init__(parent)
+        self.callback = callback
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._run)
+        self.last_run = 0.0
+        self.set_rate(rate)
+
+    def set_rate(self, rate):
+        self.min_interval = 1.0 / (rate or DEFAULT_REFRESH_RATE)
+
+    def request(self):
+        if self.timer.isActive():
+            return
+        delay = self.min_interval - (monotonic() - self.last_run)
+        self.timer.start(max(0, int(delay * 1000)))
+
+    def flush(self):
+        """Run a pending callback right away."""
+        if self.timer.isActive():
+            self.timer.stop()
+            self._run()
+
+    def cancel(self):
+        self.timer.stop()
+
+    def _run(self):
+        self.last_run = monotonic()
+        self.callback()
@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 
-# Form implementation generated from reading ui file '.\settings.ui'
+# Form implementation generated from reading ui file 'settings.ui'
 #
-# Created by: PyQt5 UI code generator 5.15.6
+# Created by: PyQt5 UI code generator 5.15.11
 #
 # WARNING: Any manual changes made to this file will be lost when pyuic5 is
 # run again.  Do not edit this file unless you know what you are doing.
@@ -102,10 +102,9 @@ class SettingForm():
         parent.portLineEdit = QtWidgets.QLineEdit(parent.groupBox_4)
         parent.portLineEdit.setAutoFillBackground(True)
         parent.portLineEdit.setFrame(True)
+        parent.portLineEdit.setText("COM3")
         parent.portLineEdit.setObjectName("portLineEdit")
         parent.formLayout_2.setWidget(4, QtWidgets.QFormLayout.FieldRole, parent.portLineEdit)
-        parent.baudrateComboBox = QtWidgets.QComboBox(parent.groupBox_4)
-
         parent.label_con_type = QtWidgets.QLabel(parent.groupBox_4)
         font = QtGui.QFont()
         font.setPointSize(8)
@@ -113,12 +112,41 @@ class SettingForm():
         font.setWeight(75)
         font.setKerning(False)
         parent.label_con_type.setFont(font)
-        parent.label_con_type.setAlignment(QtCore.Qt.AlignJustify | QtCore.Qt.AlignVCenter)
+        parent.label_con_type.setAlignment(QtCore.Qt.AlignJustify|QtCore.Qt.AlignVCenter)
         parent.label_con_type.setObjectName("label_con_type")
         parent.formLayout_2.setWidget(5, QtWidgets.QFormLayout.LabelRole, parent.label_con_type)
         parent.conTypeComboBox = QtWidgets.QComboBox(parent.groupBox_4)
         parent.conTypeComboBox.setObjectName("conTypeComboBox")
         parent.formLayout_2.setWidget(5, QtWidgets.QFormLayout.FieldRole, parent.conTypeComboBox)
+        parent.label_bus_ports = QtWidgets.QLabel(parent.groupBox_4)
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        parent.label_bus_ports.setFont(font)
+        parent.label_bus_ports.setAlignment(QtCore.Qt.AlignJustify|QtCore.Qt.AlignVCenter)
+        parent.label_bus_ports.setObjectName("label_bus_ports")
+        parent.formLayout_2.setWidget(6, QtWidgets.QFormLayout.LabelRole, parent.label_bus_ports)
+        parent.busPortsLineEdit = QtWidgets.QLineEdit(parent.groupBox_4)
+        parent.busPortsLineEdit.setAutoFillBackground(True)
+        parent.busPortsLineEdit.setFrame(True)
+        parent.busPortsLineEdit.setObjectName("busPortsLineEdit")
+        parent.formLayout_2.setWidget(6, QtWidgets.QFormLayout.FieldRole, parent.busPortsLineEdit)
+        parent.label_transport = QtWidgets.QLabel(parent.groupBox_4)
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        parent.label_transport.setFont(font)
+        parent.label_transport.setAlignment(QtCore.Qt.AlignJustify|QtCore.Qt.AlignVCenter)
+        parent.label_transport.setObjectName("label_transport")
+        parent.formLayout_2.setWidget(7, QtWidgets.QFormLayout.LabelRole, parent.label_transport)
+        parent.transportComboBox = QtWidgets.QComboBox(parent.groupBox_4)
+        parent.transportComboBox.setObjectName("transportComboBox")
+        parent.formLayout_2.setWidget(7, QtWidgets.QFormLayout.FieldRole, parent.transportComboBox)
+        parent.baudrateComboBox = QtWidgets.QComboBox(parent.groupBox_4)
         parent.baudrateComboBox.setObjectName("baudrateComboBox")
         parent.formLayout_2.setWidget(0, QtWidgets.QFormLayout.FieldRole, parent.baudrateComboBox)
         parent.parityComboBox = QtWidgets.QComboBox(parent.groupBox_4)
@@ -205,7 +233,6 @@ class SettingForm():
         parent.timeIntervalDoubleSpinBox.setMaximum(10000000.0)
         parent.timeIntervalDoubleSpinBox.setObjectName("timeIntervalDoubleSpinBox")
         parent.formLayout_4.setWidget(3, QtWidgets.QFormLayout.FieldRole, parent.timeIntervalDoubleSpinBox)
-
         parent.label_panelTimeInterval = QtWidgets.QLabel(parent.groupBox_5)
         font = QtGui.QFont()
         font.setPointSize(8)
@@ -213,7 +240,7 @@ class SettingForm():
         font.setWeight(75)
         font.setKerning(False)
         parent.label_panelTimeInterval.setFont(font)
-        parent.label_panelTimeInterval.setAlignment(QtCore.Qt.AlignJustify | QtCore.Qt.AlignVCenter)
+        parent.label_panelTimeInterval.setAlignment(QtCore.Qt.AlignJustify|QtCore.Qt.AlignVCenter)
         parent.label_panelTimeInterval.setObjectName("label_panelTimeInterval")
         parent.formLayout_4.setWidget(4, QtWidgets.QFormLayout.LabelRole, parent.label_panelTimeInterval)
         parent.panelTimeIntervalDoubleSpinBox = QtWidgets.QDoubleSpinBox(parent.groupBox_5)
@@ -223,7 +250,6 @@ class SettingForm():
         parent.panelTimeIntervalDoubleSpinBox.setMaximum(10000000.0)
         parent.panelTimeIntervalDoubleSpinBox.setObjectName("panelTimeIntervalDoubleSpinBox")
         parent.formLayout_4.setWidget(4, QtWidgets.QFormLayout.FieldRole, parent.panelTimeIntervalDoubleSpinBox)
-
         parent.label_accurate_data = QtWidgets.QLabel(parent.groupBox_5)
         font = QtGui.QFont()
         font.setPointSize(8)
@@ -231,7 +257,7 @@ class SettingForm():
         font.setWeight(75)
         font.setKerning(False)
         parent.label_accurate_data.setFont(font)
-        parent.label_accurate_data.setAlignment(QtCore.Qt.AlignJustify | QtCore.Qt.AlignVCenter)
+        parent.label_accurate_data.setAlignment(QtCore.Qt.AlignJustify|QtCore.Qt.AlignVCenter)
         parent.label_accurate_data.setObjectName("label_accurate_data")
         parent.formLayout_4.setWidget(5, QtWidgets.QFormLayout.LabelRole, parent.label_accurate_data)
         parent.accurateTimeDoubleSpinBox = QtWidgets.QDoubleSpinBox(parent.groupBox_5)
@@ -241,88 +267,89 @@ class SettingForm():
         parent.accurateTimeDoubleSpinBox.setMaximum(10000000.0)
         parent.accurateTimeDoubleSpinBox.setObjectName("accurateTimeDoubleSpinBox")
         parent.formLayout_4.setWidget(5, QtWidgets.QFormLayout.FieldRole, parent.accurateTimeDoubleSpinBox)
-
-        # parent.scaleRangeLabel_2 = QtWidgets.QLabel(parent.groupBox_5)
-        # font = QtGui.QFont()
-        # font.setPointSize(8)
-        # parent.scaleRangeLabel_2.setFont(font)
-        # parent.scaleRangeLabel_2.setObjectName("scaleRangeLabel_2")
-        # parent.formLayout_4.setWidget(6, QtWidgets.QFormLayout.LabelRole, parent.scaleRangeLabel_2)
-        # parent.editScaleRange = QtWidgets.QLineEdit(parent.groupBox_5)
-        # parent.editScaleRange.setAutoFillBackground(True)
-        # parent.editScaleRange.setFrame(True)
-        # parent.editScaleRange.setObjectName("editScaleRange")
-        # parent.formLayout_4.setWidget(6, QtWidgets.QFormLayout.FieldRole, parent.editScaleRange)
-
-        # parent.pressureDropThresholdLabel_2 = QtWidgets.QLabel(parent.groupBox_5)
-        # font = QtGui.QFont()
-        # font.setPointSize(8)
-        # parent.pressureDropThresholdLabel_2.setFont(font)
-        # parent.pressureDropThresholdLabel_2.setObjectName("pressureDropThresholdLabel_2")
-        # # parent.formLayout_4.setWidget(6, QtWidgets.QFormLayout.LabelRole, parent.pressureDropThresholdLabel_2)
-        # parent.pressureDropThresholdEdit = QtWidgets.QLineEdit(parent.groupBox_5)
-        # parent.pressureDropThresholdEdit.setAutoFillBackground(True)
-        # parent.pressureDropThresholdEdit.setFrame(True)
-        # parent.pressureDropThresholdEdit.setObjectName("pressureDropThresholdEdit")
-        # parent.formLayout_4.setWidget(6, QtWidgets.QFormLayout.FieldRole, parent.pressureDropThresholdEdit)
-
+        parent.label_gui_refresh_rate = QtWidgets.QLabel(parent.groupBox_5)
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        parent.label_gui_refresh_rate.setFont(font)
+        parent.label_gui_refresh_rate.setAlignment(QtCore.Qt.AlignJustify|QtCore.Qt.AlignVCenter)
+        parent.label_gui_refresh_rate.setObjectName("label_gui_refresh_rate")
+        parent.formLayout_4.setWidget(6, QtWidgets.QFormLayout.LabelRole, parent.label_gui_refresh_rate)
+        parent.guiRefreshRateSpinBox = QtWidgets.QSpinBox(parent.groupBox_5)
+        parent.guiRefreshRateSpinBox.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
+        parent.guiRefreshRateSpinBox.setMinimum(1)
+        parent.guiRefreshRateSpinBox.setMaximum(60)
+        parent.guiRefreshRateSpinBox.setProperty("value", 10)
+        parent.guiRefreshRateSpinBox.setObjectName("guiRefreshRateSpinBox")
+        parent.formLayout_4.setWidget(6, QtWidgets.QFormLayout.FieldRole, parent.guiRefreshRateSpinBox)
+        parent.label_acquisition_process = QtWidgets.QLabel(parent.groupBox_5)
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(False)
+        parent.label_acquisition_process.setFont(font)
+        parent.label_acquisition_process.setAlignment(QtCore.Qt.AlignJustify|QtCore.Qt.AlignVCenter)
+        parent.label_acquisition_process.setObjectName("label_acquisition_process")
+        parent.formLayout_4.setWidget(7, QtWidgets.QFormLayout.LabelRole, parent.label_acquisition_process)
+        parent.acquisitionProcessCheckBox = QtWidgets.QCheckBox(parent.groupBox_5)
+        parent.acquisitionProcessCheckBox.setObjectName("acquisitionProcessCheckBox")
+        parent.formLayout_4.setWidget(7, QtWidgets.QFormLayout.FieldRole, parent.acquisitionProcessCheckBox)
         parent.CoreTempChannelLabel = QtWidgets.QLabel(parent.groupBox_5)
         font = QtGui.QFont()
         font.setPointSize(8)
         parent.CoreTempChannelLabel.setFont(font)
         parent.CoreTempChannelLabel.setObjectName("CoreTempChannelLabel")
-        parent.formLayout_4.setWidget(7, QtWidgets.QFormLayout.LabelRole, parent.CoreTempChannelLabel)
+        parent.formLayout_4.setWidget(8, QtWidgets.QFormLayout.LabelRole, parent.CoreTempChannelLabel)
         parent.CoreTempChannelSpinBox = QtWidgets.QSpinBox(parent.groupBox_5)
         parent.CoreTempChannelSpinBox.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
         parent.CoreTempChannelSpinBox.setMinimum(1)
-        parent.CoreTempChannelSpinBox.setMaximum(14)
+        parent.CoreTempChannelSpinBox.setMaximum(256)
         parent.CoreTempChannelSpinBox.setObjectName("CoreTempChannelSpinBox")
-        parent.formLayout_4.setWidget(7, QtWidgets.QFormLayout.FieldRole, parent.CoreTempChannelSpinBox)
-
+        parent.formLayout_4.setWidget(8, QtWidgets.QFormLayout.FieldRole, parent.CoreTempChannelSpinBox)
         parent.pressureChannelLabel = QtWidgets.QLabel(parent.groupBox_5)
         font = QtGui.QFont()
         font.setPointSize(8)
         parent.pressureChannelLabel.setFont(font)
         parent.pressureChannelLabel.setObjectName("pressureChannelLabel")
-        parent.formLayout_4.setWidget(8, QtWidgets.QFormLayout.LabelRole, parent.pressureChannelLabel)
+        parent.formLayout_4.setWidget(9, QtWidgets.QFormLayout.LabelRole, parent.pressureChannelLabel)
         parent.pressureChannelSpinBox = QtWidgets.QSpinBox(parent.groupBox_5)
         parent.pressureChannelSpinBox.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
         parent.pressureChannelSpinBox.setMinimum(1)
-        parent.pressureChannelSpinBox.setMaximum(14)
+        parent.pressureChannelSpinBox.setMaximum(256)
         parent.pressureChannelSpinBox.setObjectName("pressureChannelSpinBox")
-        parent.formLayout_4.setWidget(8, QtWidgets.QFormLayout.FieldRole, parent.pressureChannelSpinBox)
-
+        parent.formLayout_4.setWidget(9, QtWidgets.QFormLayout.FieldRole, parent.pressureChannelSpinBox)
+        parent.channelCountLabel = QtWidgets.QLabel(parent.groupBox_5)
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        parent.channelCountLabel.setFont(font)
+        parent.channelCountLabel.setObjectName("channelCountLabel")
+        parent.formLayout_4.setWidget(10, QtWidgets.QFormLayout.LabelRole, parent.channelCountLabel)
+        parent.channelCountSpinBox = QtWidgets.QSpinBox(parent.groupBox_5)
+        parent.channelCountSpinBox.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
+        parent.channelCountSpinBox.setMinimum(1)
+        parent.channelCountSpinBox.setMaximum(256)
+        parent.channelCountSpinBox.setProperty("value", 14)
+        parent.channelCountSpinBox.setObjectName("channelCountSpinBox")
+        parent.formLayout_4.setWidget(10, QtWidgets.QFormLayout.FieldRole, parent.channelCountSpinBox)
+        parent.compressionMaxGapLabel = QtWidgets.QLabel(parent.groupBox_5)
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        parent.compressionMaxGapLabel.setFont(font)
+        parent.compressionMaxGapLabel.setObjectName("compressionMaxGapLabel")
+        parent.formLayout_4.setWidget(11, QtWidgets.QFormLayout.LabelRole, parent.compressionMaxGapLabel)
+        parent.compressionMaxGapDoubleSpinBox = QtWidgets.QDoubleSpinBox(parent.groupBox_5)
+        parent.compressionMaxGapDoubleSpinBox.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
+        parent.compressionMaxGapDoubleSpinBox.setDecimals(1)
+        parent.compressionMaxGapDoubleSpinBox.setMinimum(1.0)
+        parent.compressionMaxGapDoubleSpinBox.setMaximum(86400.0)
+        parent.compressionMaxGapDoubleSpinBox.setProperty("value", 600.0)
+        parent.compressionMaxGapDoubleSpinBox.setObjectName("compressionMaxGapDoubleSpinBox")
+        parent.formLayout_4.setWidget(11, QtWidgets.QFormLayout.FieldRole, parent.compressionMaxGapDoubleSpinBox)
         parent.gridLayout_5.addLayout(parent.formLayout_4, 0, 0, 1, 1)
         parent.verticalLayout_2.addWidget(parent.groupBox_5)
-        # parent.groupBox_6 = QtWidgets.QGroupBox(parent.tabGeneral)
-        # font = QtGui.QFont()
-        # font.setPointSize(9)
-        # font.setBold(True)
-        # font.setWeight(75)
-        # parent.groupBox_6.setFont(font)
-        # parent.groupBox_6.setObjectName("groupBox_6")
-        # parent.gridLayout_4 = QtWidgets.QGridLayout(parent.groupBox_6)
-        # parent.gridLayout_4.setObjectName("gridLayout_4")
-        # parent.verticalLayout = QtWidgets.QVBoxLayout()
-        # parent.verticalLayout.setObjectName("verticalLayout")
-        # parent.horizontalLayout = QtWidgets.QHBoxLayout()
-        # parent.horizontalLayout.setObjectName("horizontalLayout")
-        # parent.signinLabel = QtWidgets.QLabel(parent.groupBox_6)
-        # parent.signinLabel.setObjectName("signinLabel")
-        # parent.horizontalLayout.addWidget(parent.signinLabel)
-        # parent.signinPushButton = QtWidgets.QPushButton(parent.groupBox_6)
-        # parent.signinPushButton.setMaximumSize(QtCore.QSize(200, 16777215))
-        # parent.signinPushButton.setObjectName("signinPushButton")
-        # parent.horizontalLayout.addWidget(parent.signinPushButton)
-        # parent.verticalLayout.addLayout(parent.horizontalLayout)
-        # parent.emailLabel = QtWidgets.QLabel(parent.groupBox_6)
-        # parent.emailLabel.setFrameShape(QtWidgets.QFrame.Box)
-        # parent.emailLabel.setText("")
-        # parent.emailLabel.setObjectName("emailLabel")
-        # parent.verticalLayout.addWidget(parent.emailLabel)
-        # parent.gridLayout_4.addLayout(parent.verticalLayout, 0, 0, 1, 1)
-        # parent.verticalLayout_2.addWidget(parent.groupBox_6)
-
         parent.groupBox7 = QtWidgets.QGroupBox(parent.tabGeneral)
         font = QtGui.QFont()
         font.setPointSize(8)
@@ -346,25 +373,49 @@ class SettingForm():
         parent.delimiterLineEdit = QtWidgets.QLineEdit(parent.groupBox7)
         parent.delimiterLineEdit.setObjectName("delimiterLineEdit")
         parent.formLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, parent.delimiterLineEdit)
-
         parent.gdriveUpdateLabel = QtWidgets.QLabel(parent.groupBox7)
         parent.gdriveUpdateLabel.setObjectName("gdriveUpdateLabel")
         parent.formLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, parent.gdriveUpdateLabel)
         parent.gdriveSpinBox = QtWidgets.QSpinBox(parent.groupBox7)
-        parent.gdriveSpinBox.setObjectName("gdriveSpinBox")
         parent.gdriveSpinBox.setMinimum(30)
         parent.gdriveSpinBox.setMaximum(1000000)
         parent.gdriveSpinBox.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
+        parent.gdriveSpinBox.setObjectName("gdriveSpinBox")
         parent.formLayout.setWidget(2, QtWidgets.QFormLayout.FieldRole, parent.gdriveSpinBox)
-
+        parent.csvFlushRowsLabel = QtWidgets.QLabel(parent.groupBox7)
+        parent.csvFlushRowsLabel.setObjectName("csvFlushRowsLabel")
+        parent.formLayout.setWidget(3, QtWidgets.QFormLayout.LabelRole, parent.csvFlushRowsLabel)
+        parent.csvFlushRowsSpinBox = QtWidgets.QSpinBox(parent.groupBox7)
+        parent.csvFlushRowsSpinBox.setMinimum(1)
+        parent.csvFlushRowsSpinBox.setMaximum(1000000)
+        parent.csvFlushRowsSpinBox.setProperty("value", 50)
+        parent.csvFlushRowsSpinBox.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
+        parent.csvFlushRowsSpinBox.setObjectName("csvFlushRowsSpinBox")
+        parent.formLayout.setWidget(3, QtWidgets.QFormLayout.FieldRole, parent.csvFlushRowsSpinBox)
+        parent.csvFlushIntervalLabel = QtWidgets.QLabel(parent.groupBox7)
+        parent.csvFlushIntervalLabel.setObjectName("csvFlushIntervalLabel")
+        parent.formLayout.setWidget(4, QtWidgets.QFormLayout.LabelRole, parent.csvFlushIntervalLabel)
+        parent.csvFlushIntervalDoubleSpinBox = QtWidgets.QDoubleSpinBox(parent.groupBox7)
+        parent.csvFlushIntervalDoubleSpinBox.setDecimals(1)
+        parent.csvFlushIntervalDoubleSpinBox.setMinimum(0.1)
+        parent.csvFlushIntervalDoubleSpinBox.setMaximum(3600.0)
+        parent.csvFlushIntervalDoubleSpinBox.setProperty("value", 10.0)
+        parent.csvFlushIntervalDoubleSpinBox.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
+        parent.csvFlushIntervalDoubleSpinBox.setObjectName("csvFlushIntervalDoubleSpinBox")
+        parent.formLayout.setWidget(4, QtWidgets.QFormLayout.FieldRole, parent.csvFlushIntervalDoubleSpinBox)
+        parent.cycleDbPathLabel = QtWidgets.QLabel(parent.groupBox7)
+        parent.cycleDbPathLabel.setObjectName("cycleDbPathLabel")
+        parent.formLayout.setWidget(5, QtWidgets.QFormLayout.LabelRole, parent.cycleDbPathLabel)
+        parent.cycleDbPathLineEdit = QtWidgets.QLineEdit(parent.groupBox7)
+        parent.cycleDbPathLineEdit.setObjectName("cycleDbPathLineEdit")
+        parent.formLayout.setWidget(5, QtWidgets.QFormLayout.FieldRole, parent.cycleDbPathLineEdit)
         parent.gridLayout_7.addLayout(parent.formLayout, 0, 0, 1, 1)
         parent.verticalLayout_2.addWidget(parent.groupBox7)
-
-        spacerItem2 = QtWidgets.QSpacerItem(249, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        parent.verticalLayout_2.addItem(spacerItem2)
+        spacerItem = QtWidgets.QSpacerItem(249, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        parent.verticalLayout_2.addItem(spacerItem)
         parent.gridLayout_6.addLayout(parent.verticalLayout_2, 0, 0, 1, 1)
-        spacerItem = QtWidgets.QSpacerItem(249, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        parent.gridLayout_6.addItem(spacerItem, 0, 1, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(249, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        parent.gridLayout_6.addItem(spacerItem1, 0, 1, 1, 1)
         parent.tabWidget.addTab(parent.tabGeneral, "")
         parent.tabChannels = QtWidgets.QWidget()
         parent.tabChannels.setObjectName("tabChannels")
@@ -2259,7 +2310,6 @@ class SettingForm():
         parent.editLimitHigh14.setObjectName("editLimitHigh14")
         parent.verticalLayout_25.addWidget(parent.editLimitHigh14)
         parent.horizontalLayout_2.addLayout(parent.verticalLayout_25)
-
         parent.verticalLayout_out_low = QtWidgets.QVBoxLayout()
         parent.verticalLayout_out_low.setObjectName("verticalLayout_out_low")
         parent.label_out_low = QtWidgets.QLabel(parent.tabChannels)
@@ -2490,8 +2540,6 @@ class SettingForm():
         parent.editOutLimitLow14.setObjectName("editOutLimitLow14")
         parent.verticalLayout_out_low.addWidget(parent.editOutLimitLow14)
         parent.horizontalLayout_2.addLayout(parent.verticalLayout_out_low)
-
-        #####################
         parent.verticalLayout_out_high = QtWidgets.QVBoxLayout()
         parent.verticalLayout_out_high.setObjectName("verticalLayout_out_high")
         parent.label_out_high = QtWidgets.QLabel(parent.tabChannels)
@@ -2722,8 +2770,6 @@ class SettingForm():
         parent.editOutLimitHigh14.setObjectName("editOutLimitHigh14")
         parent.verticalLayout_out_high.addWidget(parent.editOutLimitHigh14)
         parent.horizontalLayout_2.addLayout(parent.verticalLayout_out_high)
-
-        ###################
         parent.verticalLayout_26 = QtWidgets.QVBoxLayout()
         parent.verticalLayout_26.setObjectName("verticalLayout_26")
         parent.label_70 = QtWidgets.QLabel(parent.tabChannels)
@@ -2954,6 +3000,710 @@ class SettingForm():
         parent.editDecPoint14.setObjectName("editDecPoint14")
         parent.verticalLayout_26.addWidget(parent.editDecPoint14)
         parent.horizontalLayout_2.addLayout(parent.verticalLayout_26)
+        parent.verticalLayout_period = QtWidgets.QVBoxLayout()
+        parent.verticalLayout_period.setObjectName("verticalLayout_period")
+        parent.label_period = QtWidgets.QLabel(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.label_period.sizePolicy().hasHeightForWidth())
+        parent.label_period.setSizePolicy(sizePolicy)
+        parent.label_period.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        font.setKerning(False)
+        parent.label_period.setFont(font)
+        parent.label_period.setAlignment(QtCore.Qt.AlignCenter)
+        parent.label_period.setObjectName("label_period")
+        parent.verticalLayout_period.addWidget(parent.label_period)
+        parent.editPeriod1 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editPeriod1.sizePolicy().hasHeightForWidth())
+        parent.editPeriod1.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editPeriod1.setFont(font)
+        parent.editPeriod1.setAutoFillBackground(True)
+        parent.editPeriod1.setFrame(True)
+        parent.editPeriod1.setObjectName("editPeriod1")
+        parent.verticalLayout_period.addWidget(parent.editPeriod1)
+        parent.editPeriod2 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editPeriod2.sizePolicy().hasHeightForWidth())
+        parent.editPeriod2.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editPeriod2.setFont(font)
+        parent.editPeriod2.setAutoFillBackground(True)
+        parent.editPeriod2.setFrame(True)
+        parent.editPeriod2.setObjectName("editPeriod2")
+        parent.verticalLayout_period.addWidget(parent.editPeriod2)
+        parent.editPeriod3 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editPeriod3.sizePolicy().hasHeightForWidth())
+        parent.editPeriod3.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editPeriod3.setFont(font)
+        parent.editPeriod3.setAutoFillBackground(True)
+        parent.editPeriod3.setFrame(True)
+        parent.editPeriod3.setObjectName("editPeriod3")
+        parent.verticalLayout_period.addWidget(parent.editPeriod3)
+        parent.editPeriod4 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editPeriod4.sizePolicy().hasHeightForWidth())
+        parent.editPeriod4.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editPeriod4.setFont(font)
+        parent.editPeriod4.setAutoFillBackground(True)
+        parent.editPeriod4.setFrame(True)
+        parent.editPeriod4.setObjectName("editPeriod4")
+        parent.verticalLayout_period.addWidget(parent.editPeriod4)
+        parent.editPeriod5 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editPeriod5.sizePolicy().hasHeightForWidth())
+        parent.editPeriod5.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editPeriod5.setFont(font)
+        parent.editPeriod5.setAutoFillBackground(True)
+        parent.editPeriod5.setFrame(True)
+        parent.editPeriod5.setObjectName("editPeriod5")
+        parent.verticalLayout_period.addWidget(parent.editPeriod5)
+        parent.editPeriod6 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editPeriod6.sizePolicy().hasHeightForWidth())
+        parent.editPeriod6.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editPeriod6.setFont(font)
+        parent.editPeriod6.setAutoFillBackground(True)
+        parent.editPeriod6.setFrame(True)
+        parent.editPeriod6.setObjectName("editPeriod6")
+        parent.verticalLayout_period.addWidget(parent.editPeriod6)
+        parent.editPeriod7 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editPeriod7.sizePolicy().hasHeightForWidth())
+        parent.editPeriod7.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editPeriod7.setFont(font)
+        parent.editPeriod7.setAutoFillBackground(True)
+        parent.editPeriod7.setFrame(True)
+        parent.editPeriod7.setObjectName("editPeriod7")
+        parent.verticalLayout_period.addWidget(parent.editPeriod7)
+        parent.editPeriod8 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editPeriod8.sizePolicy().hasHeightForWidth())
+        parent.editPeriod8.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editPeriod8.setFont(font)
+        parent.editPeriod8.setAutoFillBackground(True)
+        parent.editPeriod8.setFrame(True)
+        parent.editPeriod8.setObjectName("editPeriod8")
+        parent.verticalLayout_period.addWidget(parent.editPeriod8)
+        parent.editPeriod9 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editPeriod9.sizePolicy().hasHeightForWidth())
+        parent.editPeriod9.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editPeriod9.setFont(font)
+        parent.editPeriod9.setAutoFillBackground(True)
+        parent.editPeriod9.setFrame(True)
+        parent.editPeriod9.setObjectName("editPeriod9")
+        parent.verticalLayout_period.addWidget(parent.editPeriod9)
+        parent.editPeriod10 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editPeriod10.sizePolicy().hasHeightForWidth())
+        parent.editPeriod10.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editPeriod10.setFont(font)
+        parent.editPeriod10.setAutoFillBackground(True)
+        parent.editPeriod10.setFrame(True)
+        parent.editPeriod10.setObjectName("editPeriod10")
+        parent.verticalLayout_period.addWidget(parent.editPeriod10)
+        parent.editPeriod11 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editPeriod11.sizePolicy().hasHeightForWidth())
+        parent.editPeriod11.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editPeriod11.setFont(font)
+        parent.editPeriod11.setAutoFillBackground(True)
+        parent.editPeriod11.setFrame(True)
+        parent.editPeriod11.setObjectName("editPeriod11")
+        parent.verticalLayout_period.addWidget(parent.editPeriod11)
+        parent.editPeriod12 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editPeriod12.sizePolicy().hasHeightForWidth())
+        parent.editPeriod12.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editPeriod12.setFont(font)
+        parent.editPeriod12.setAutoFillBackground(True)
+        parent.editPeriod12.setFrame(True)
+        parent.editPeriod12.setObjectName("editPeriod12")
+        parent.verticalLayout_period.addWidget(parent.editPeriod12)
+        parent.editPeriod13 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editPeriod13.sizePolicy().hasHeightForWidth())
+        parent.editPeriod13.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editPeriod13.setFont(font)
+        parent.editPeriod13.setAutoFillBackground(True)
+        parent.editPeriod13.setFrame(True)
+        parent.editPeriod13.setObjectName("editPeriod13")
+        parent.verticalLayout_period.addWidget(parent.editPeriod13)
+        parent.editPeriod14 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editPeriod14.sizePolicy().hasHeightForWidth())
+        parent.editPeriod14.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editPeriod14.setFont(font)
+        parent.editPeriod14.setAutoFillBackground(True)
+        parent.editPeriod14.setFrame(True)
+        parent.editPeriod14.setObjectName("editPeriod14")
+        parent.verticalLayout_period.addWidget(parent.editPeriod14)
+        parent.horizontalLayout_2.addLayout(parent.verticalLayout_period)
+        parent.verticalLayout_compression = QtWidgets.QVBoxLayout()
+        parent.verticalLayout_compression.setObjectName("verticalLayout_compression")
+        parent.label_compression = QtWidgets.QLabel(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.label_compression.sizePolicy().hasHeightForWidth())
+        parent.label_compression.setSizePolicy(sizePolicy)
+        parent.label_compression.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        font.setKerning(False)
+        parent.label_compression.setFont(font)
+        parent.label_compression.setAlignment(QtCore.Qt.AlignCenter)
+        parent.label_compression.setObjectName("label_compression")
+        parent.verticalLayout_compression.addWidget(parent.label_compression)
+        parent.comboCompression1 = QtWidgets.QComboBox(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.comboCompression1.sizePolicy().hasHeightForWidth())
+        parent.comboCompression1.setSizePolicy(sizePolicy)
+        parent.comboCompression1.setMinimumSize(QtCore.QSize(110, 0))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        parent.comboCompression1.setFont(font)
+        parent.comboCompression1.setFrame(True)
+        parent.comboCompression1.setObjectName("comboCompression1")
+        parent.comboCompression1.addItem("")
+        parent.comboCompression1.addItem("")
+        parent.comboCompression1.addItem("")
+        parent.verticalLayout_compression.addWidget(parent.comboCompression1)
+        parent.comboCompression2 = QtWidgets.QComboBox(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.comboCompression2.sizePolicy().hasHeightForWidth())
+        parent.comboCompression2.setSizePolicy(sizePolicy)
+        parent.comboCompression2.setMinimumSize(QtCore.QSize(110, 0))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        parent.comboCompression2.setFont(font)
+        parent.comboCompression2.setFrame(True)
+        parent.comboCompression2.setObjectName("comboCompression2")
+        parent.comboCompression2.addItem("")
+        parent.comboCompression2.addItem("")
+        parent.comboCompression2.addItem("")
+        parent.verticalLayout_compression.addWidget(parent.comboCompression2)
+        parent.comboCompression3 = QtWidgets.QComboBox(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.comboCompression3.sizePolicy().hasHeightForWidth())
+        parent.comboCompression3.setSizePolicy(sizePolicy)
+        parent.comboCompression3.setMinimumSize(QtCore.QSize(110, 0))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        parent.comboCompression3.setFont(font)
+        parent.comboCompression3.setFrame(True)
+        parent.comboCompression3.setObjectName("comboCompression3")
+        parent.comboCompression3.addItem("")
+        parent.comboCompression3.addItem("")
+        parent.comboCompression3.addItem("")
+        parent.verticalLayout_compression.addWidget(parent.comboCompression3)
+        parent.comboCompression4 = QtWidgets.QComboBox(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.comboCompression4.sizePolicy().hasHeightForWidth())
+        parent.comboCompression4.setSizePolicy(sizePolicy)
+        parent.comboCompression4.setMinimumSize(QtCore.QSize(110, 0))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        parent.comboCompression4.setFont(font)
+        parent.comboCompression4.setFrame(True)
+        parent.comboCompression4.setObjectName("comboCompression4")
+        parent.comboCompression4.addItem("")
+        parent.comboCompression4.addItem("")
+        parent.comboCompression4.addItem("")
+        parent.verticalLayout_compression.addWidget(parent.comboCompression4)
+        parent.comboCompression5 = QtWidgets.QComboBox(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.comboCompression5.sizePolicy().hasHeightForWidth())
+        parent.comboCompression5.setSizePolicy(sizePolicy)
+        parent.comboCompression5.setMinimumSize(QtCore.QSize(110, 0))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        parent.comboCompression5.setFont(font)
+        parent.comboCompression5.setFrame(True)
+        parent.comboCompression5.setObjectName("comboCompression5")
+        parent.comboCompression5.addItem("")
+        parent.comboCompression5.addItem("")
+        parent.comboCompression5.addItem("")
+        parent.verticalLayout_compression.addWidget(parent.comboCompression5)
+        parent.comboCompression6 = QtWidgets.QComboBox(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.comboCompression6.sizePolicy().hasHeightForWidth())
+        parent.comboCompression6.setSizePolicy(sizePolicy)
+        parent.comboCompression6.setMinimumSize(QtCore.QSize(110, 0))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        parent.comboCompression6.setFont(font)
+        parent.comboCompression6.setFrame(True)
+        parent.comboCompression6.setObjectName("comboCompression6")
+        parent.comboCompression6.addItem("")
+        parent.comboCompression6.addItem("")
+        parent.comboCompression6.addItem("")
+        parent.verticalLayout_compression.addWidget(parent.comboCompression6)
+        parent.comboCompression7 = QtWidgets.QComboBox(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.comboCompression7.sizePolicy().hasHeightForWidth())
+        parent.comboCompression7.setSizePolicy(sizePolicy)
+        parent.comboCompression7.setMinimumSize(QtCore.QSize(110, 0))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        parent.comboCompression7.setFont(font)
+        parent.comboCompression7.setFrame(True)
+        parent.comboCompression7.setObjectName("comboCompression7")
+        parent.comboCompression7.addItem("")
+        parent.comboCompression7.addItem("")
+        parent.comboCompression7.addItem("")
+        parent.verticalLayout_compression.addWidget(parent.comboCompression7)
+        parent.comboCompression8 = QtWidgets.QComboBox(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.comboCompression8.sizePolicy().hasHeightForWidth())
+        parent.comboCompression8.setSizePolicy(sizePolicy)
+        parent.comboCompression8.setMinimumSize(QtCore.QSize(110, 0))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        parent.comboCompression8.setFont(font)
+        parent.comboCompression8.setFrame(True)
+        parent.comboCompression8.setObjectName("comboCompression8")
+        parent.comboCompression8.addItem("")
+        parent.comboCompression8.addItem("")
+        parent.comboCompression8.addItem("")
+        parent.verticalLayout_compression.addWidget(parent.comboCompression8)
+        parent.comboCompression9 = QtWidgets.QComboBox(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.comboCompression9.sizePolicy().hasHeightForWidth())
+        parent.comboCompression9.setSizePolicy(sizePolicy)
+        parent.comboCompression9.setMinimumSize(QtCore.QSize(110, 0))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        parent.comboCompression9.setFont(font)
+        parent.comboCompression9.setFrame(True)
+        parent.comboCompression9.setObjectName("comboCompression9")
+        parent.comboCompression9.addItem("")
+        parent.comboCompression9.addItem("")
+        parent.comboCompression9.addItem("")
+        parent.verticalLayout_compression.addWidget(parent.comboCompression9)
+        parent.comboCompression10 = QtWidgets.QComboBox(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.comboCompression10.sizePolicy().hasHeightForWidth())
+        parent.comboCompression10.setSizePolicy(sizePolicy)
+        parent.comboCompression10.setMinimumSize(QtCore.QSize(110, 0))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        parent.comboCompression10.setFont(font)
+        parent.comboCompression10.setFrame(True)
+        parent.comboCompression10.setObjectName("comboCompression10")
+        parent.comboCompression10.addItem("")
+        parent.comboCompression10.addItem("")
+        parent.comboCompression10.addItem("")
+        parent.verticalLayout_compression.addWidget(parent.comboCompression10)
+        parent.comboCompression11 = QtWidgets.QComboBox(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.comboCompression11.sizePolicy().hasHeightForWidth())
+        parent.comboCompression11.setSizePolicy(sizePolicy)
+        parent.comboCompression11.setMinimumSize(QtCore.QSize(110, 0))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        parent.comboCompression11.setFont(font)
+        parent.comboCompression11.setFrame(True)
+        parent.comboCompression11.setObjectName("comboCompression11")
+        parent.comboCompression11.addItem("")
+        parent.comboCompression11.addItem("")
+        parent.comboCompression11.addItem("")
+        parent.verticalLayout_compression.addWidget(parent.comboCompression11)
+        parent.comboCompression12 = QtWidgets.QComboBox(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.comboCompression12.sizePolicy().hasHeightForWidth())
+        parent.comboCompression12.setSizePolicy(sizePolicy)
+        parent.comboCompression12.setMinimumSize(QtCore.QSize(110, 0))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        parent.comboCompression12.setFont(font)
+        parent.comboCompression12.setFrame(True)
+        parent.comboCompression12.setObjectName("comboCompression12")
+        parent.comboCompression12.addItem("")
+        parent.comboCompression12.addItem("")
+        parent.comboCompression12.addItem("")
+        parent.verticalLayout_compression.addWidget(parent.comboCompression12)
+        parent.comboCompression13 = QtWidgets.QComboBox(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.comboCompression13.sizePolicy().hasHeightForWidth())
+        parent.comboCompression13.setSizePolicy(sizePolicy)
+        parent.comboCompression13.setMinimumSize(QtCore.QSize(110, 0))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        parent.comboCompression13.setFont(font)
+        parent.comboCompression13.setFrame(True)
+        parent.comboCompression13.setObjectName("comboCompression13")
+        parent.comboCompression13.addItem("")
+        parent.comboCompression13.addItem("")
+        parent.comboCompression13.addItem("")
+        parent.verticalLayout_compression.addWidget(parent.comboCompression13)
+        parent.comboCompression14 = QtWidgets.QComboBox(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.comboCompression14.sizePolicy().hasHeightForWidth())
+        parent.comboCompression14.setSizePolicy(sizePolicy)
+        parent.comboCompression14.setMinimumSize(QtCore.QSize(110, 0))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        parent.comboCompression14.setFont(font)
+        parent.comboCompression14.setFrame(True)
+        parent.comboCompression14.setObjectName("comboCompression14")
+        parent.comboCompression14.addItem("")
+        parent.comboCompression14.addItem("")
+        parent.comboCompression14.addItem("")
+        parent.verticalLayout_compression.addWidget(parent.comboCompression14)
+        parent.horizontalLayout_2.addLayout(parent.verticalLayout_compression)
+        parent.verticalLayout_tolerance = QtWidgets.QVBoxLayout()
+        parent.verticalLayout_tolerance.setObjectName("verticalLayout_tolerance")
+        parent.label_tolerance = QtWidgets.QLabel(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.label_tolerance.sizePolicy().hasHeightForWidth())
+        parent.label_tolerance.setSizePolicy(sizePolicy)
+        parent.label_tolerance.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        font.setKerning(False)
+        parent.label_tolerance.setFont(font)
+        parent.label_tolerance.setAlignment(QtCore.Qt.AlignCenter)
+        parent.label_tolerance.setObjectName("label_tolerance")
+        parent.verticalLayout_tolerance.addWidget(parent.label_tolerance)
+        parent.editTolerance1 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editTolerance1.sizePolicy().hasHeightForWidth())
+        parent.editTolerance1.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editTolerance1.setFont(font)
+        parent.editTolerance1.setAutoFillBackground(True)
+        parent.editTolerance1.setFrame(True)
+        parent.editTolerance1.setObjectName("editTolerance1")
+        parent.verticalLayout_tolerance.addWidget(parent.editTolerance1)
+        parent.editTolerance2 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editTolerance2.sizePolicy().hasHeightForWidth())
+        parent.editTolerance2.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editTolerance2.setFont(font)
+        parent.editTolerance2.setAutoFillBackground(True)
+        parent.editTolerance2.setFrame(True)
+        parent.editTolerance2.setObjectName("editTolerance2")
+        parent.verticalLayout_tolerance.addWidget(parent.editTolerance2)
+        parent.editTolerance3 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editTolerance3.sizePolicy().hasHeightForWidth())
+        parent.editTolerance3.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editTolerance3.setFont(font)
+        parent.editTolerance3.setAutoFillBackground(True)
+        parent.editTolerance3.setFrame(True)
+        parent.editTolerance3.setObjectName("editTolerance3")
+        parent.verticalLayout_tolerance.addWidget(parent.editTolerance3)
+        parent.editTolerance4 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editTolerance4.sizePolicy().hasHeightForWidth())
+        parent.editTolerance4.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editTolerance4.setFont(font)
+        parent.editTolerance4.setAutoFillBackground(True)
+        parent.editTolerance4.setFrame(True)
+        parent.editTolerance4.setObjectName("editTolerance4")
+        parent.verticalLayout_tolerance.addWidget(parent.editTolerance4)
+        parent.editTolerance5 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editTolerance5.sizePolicy().hasHeightForWidth())
+        parent.editTolerance5.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editTolerance5.setFont(font)
+        parent.editTolerance5.setAutoFillBackground(True)
+        parent.editTolerance5.setFrame(True)
+        parent.editTolerance5.setObjectName("editTolerance5")
+        parent.verticalLayout_tolerance.addWidget(parent.editTolerance5)
+        parent.editTolerance6 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editTolerance6.sizePolicy().hasHeightForWidth())
+        parent.editTolerance6.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editTolerance6.setFont(font)
+        parent.editTolerance6.setAutoFillBackground(True)
+        parent.editTolerance6.setFrame(True)
+        parent.editTolerance6.setObjectName("editTolerance6")
+        parent.verticalLayout_tolerance.addWidget(parent.editTolerance6)
+        parent.editTolerance7 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editTolerance7.sizePolicy().hasHeightForWidth())
+        parent.editTolerance7.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editTolerance7.setFont(font)
+        parent.editTolerance7.setAutoFillBackground(True)
+        parent.editTolerance7.setFrame(True)
+        parent.editTolerance7.setObjectName("editTolerance7")
+        parent.verticalLayout_tolerance.addWidget(parent.editTolerance7)
+        parent.editTolerance8 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editTolerance8.sizePolicy().hasHeightForWidth())
+        parent.editTolerance8.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editTolerance8.setFont(font)
+        parent.editTolerance8.setAutoFillBackground(True)
+        parent.editTolerance8.setFrame(True)
+        parent.editTolerance8.setObjectName("editTolerance8")
+        parent.verticalLayout_tolerance.addWidget(parent.editTolerance8)
+        parent.editTolerance9 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editTolerance9.sizePolicy().hasHeightForWidth())
+        parent.editTolerance9.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editTolerance9.setFont(font)
+        parent.editTolerance9.setAutoFillBackground(True)
+        parent.editTolerance9.setFrame(True)
+        parent.editTolerance9.setObjectName("editTolerance9")
+        parent.verticalLayout_tolerance.addWidget(parent.editTolerance9)
+        parent.editTolerance10 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editTolerance10.sizePolicy().hasHeightForWidth())
+        parent.editTolerance10.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editTolerance10.setFont(font)
+        parent.editTolerance10.setAutoFillBackground(True)
+        parent.editTolerance10.setFrame(True)
+        parent.editTolerance10.setObjectName("editTolerance10")
+        parent.verticalLayout_tolerance.addWidget(parent.editTolerance10)
+        parent.editTolerance11 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editTolerance11.sizePolicy().hasHeightForWidth())
+        parent.editTolerance11.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editTolerance11.setFont(font)
+        parent.editTolerance11.setAutoFillBackground(True)
+        parent.editTolerance11.setFrame(True)
+        parent.editTolerance11.setObjectName("editTolerance11")
+        parent.verticalLayout_tolerance.addWidget(parent.editTolerance11)
+        parent.editTolerance12 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editTolerance12.sizePolicy().hasHeightForWidth())
+        parent.editTolerance12.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editTolerance12.setFont(font)
+        parent.editTolerance12.setAutoFillBackground(True)
+        parent.editTolerance12.setFrame(True)
+        parent.editTolerance12.setObjectName("editTolerance12")
+        parent.verticalLayout_tolerance.addWidget(parent.editTolerance12)
+        parent.editTolerance13 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editTolerance13.sizePolicy().hasHeightForWidth())
+        parent.editTolerance13.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editTolerance13.setFont(font)
+        parent.editTolerance13.setAutoFillBackground(True)
+        parent.editTolerance13.setFrame(True)
+        parent.editTolerance13.setObjectName("editTolerance13")
+        parent.verticalLayout_tolerance.addWidget(parent.editTolerance13)
+        parent.editTolerance14 = QtWidgets.QLineEdit(parent.tabChannels)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(parent.editTolerance14.sizePolicy().hasHeightForWidth())
+        parent.editTolerance14.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.editTolerance14.setFont(font)
+        parent.editTolerance14.setAutoFillBackground(True)
+        parent.editTolerance14.setFrame(True)
+        parent.editTolerance14.setObjectName("editTolerance14")
+        parent.verticalLayout_tolerance.addWidget(parent.editTolerance14)
+        parent.horizontalLayout_2.addLayout(parent.verticalLayout_tolerance)
         parent.verticalLayout_22 = QtWidgets.QVBoxLayout()
         parent.verticalLayout_22.setObjectName("verticalLayout_22")
         parent.label_66 = QtWidgets.QLabel(parent.tabChannels)
@@ -3070,7 +3820,7 @@ class SettingForm():
         sizePolicy.setVerticalStretch(0)
         sizePolicy.setHeightForWidth(parent.checkScale7.sizePolicy().hasHeightForWidth())
         parent.checkScale7.setSizePolicy(sizePolicy)
-        parent.checkScale7.setMinimumSize(QtCore.QSize(20,19))
+        parent.checkScale7.setMinimumSize(QtCore.QSize(20, 19))
         parent.checkScale7.setMaximumSize(QtCore.QSize(30, 16777215))
         parent.checkScale7.setLayoutDirection(QtCore.Qt.LeftToRight)
         parent.checkScale7.setStyleSheet("margin-left:7%;\n"
@@ -3175,7 +3925,7 @@ class SettingForm():
         sizePolicy.setVerticalStretch(0)
         sizePolicy.setHeightForWidth(parent.checkScale14.sizePolicy().hasHeightForWidth())
         parent.checkScale14.setSizePolicy(sizePolicy)
-        parent.checkScale14.setMinimumSize(QtCore.QSize(20,19))
+        parent.checkScale14.setMinimumSize(QtCore.QSize(20, 19))
         parent.checkScale14.setMaximumSize(QtCore.QSize(30, 16777215))
         parent.checkScale14.setLayoutDirection(QtCore.Qt.LeftToRight)
         parent.checkScale14.setStyleSheet("margin-left:7%;\n"
@@ -3544,7 +4294,7 @@ class SettingForm():
         parent.labelColor10.setText("")
         parent.labelColor10.setObjectName("labelColor10")
         parent.verticalLayout_28.addWidget(parent.labelColor10)
-        parent.labelColor11 =ColorLabel(parent.tabChannels)
+        parent.labelColor11 = ColorLabel(parent.tabChannels)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
@@ -3577,7 +4327,7 @@ class SettingForm():
         parent.labelColor13.setText("")
         parent.labelColor13.setObjectName("labelColor13")
         parent.verticalLayout_28.addWidget(parent.labelColor13)
-        parent.labelColor14 =ColorLabel(parent.tabChannels)
+        parent.labelColor14 = ColorLabel(parent.tabChannels)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
@@ -3589,49 +4339,8 @@ class SettingForm():
         parent.labelColor14.setObjectName("labelColor14")
         parent.verticalLayout_28.addWidget(parent.labelColor14)
         parent.horizontalLayout_2.addLayout(parent.verticalLayout_28)
-        parent.gridLayout_3.addLayout(parent.horizontalLayout_2, 0, 0, 1, 1)
-        parent.tabWidget.addTab(parent.tabChannels, "")
-        parent.verticalLayout_16.addWidget(parent.tabWidget)
-        parent.gridLayout_8 = QtWidgets.QGridLayout()
-        parent.gridLayout_8.setObjectName("gridLayout_8")
-        spacerItem1 = QtWidgets.QSpacerItem(16777215, 10, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        parent.gridLayout_8.addItem(spacerItem1, 0, 0, 1, 1)
-        parent.buttonCancel = QtWidgets.QPushButton(parent.centralwidget)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(9)
-        font.setBold(False)
-        font.setWeight(50)
-        parent.buttonCancel.setFont(font)
-        parent.buttonCancel.setFocusPolicy(QtCore.Qt.NoFocus)
-        parent.buttonCancel.setAutoFillBackground(False)
-        parent.buttonCancel.setAutoDefault(False)
-        parent.buttonCancel.setDefault(False)
-        parent.buttonCancel.setFlat(False)
-        parent.buttonCancel.setObjectName("buttonCancel")
-        parent.gridLayout_8.addWidget(parent.buttonCancel, 0, 1, 1, 1)
-        parent.buttonSave = QtWidgets.QPushButton(parent.centralwidget)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(9)
-        font.setBold(False)
-        font.setWeight(50)
-        parent.buttonSave.setFont(font)
-        parent.buttonSave.setFocusPolicy(QtCore.Qt.NoFocus)
-        parent.buttonSave.setAutoFillBackground(False)
-        parent.buttonSave.setAutoDefault(False)
-        parent.buttonSave.setDefault(False)
-        parent.buttonSave.setFlat(False)
-        parent.buttonSave.setObjectName("buttonSave")
-        parent.gridLayout_8.addWidget(parent.buttonSave, 0, 2, 1, 1)
-        parent.verticalLayout_16.addLayout(parent.gridLayout_8)
-        parent.gridLayout_2.addLayout(parent.verticalLayout_16, 0, 0, 1, 1)
-        parent.setCentralWidget(parent.centralwidget)
-
         parent.verticalLayout_active = QtWidgets.QVBoxLayout()
         parent.verticalLayout_active.setObjectName("verticalLayout_active")
-        parent.horizontalLayout_2.addLayout(parent.verticalLayout_active)
-
         parent.label_active = QtWidgets.QLabel(parent.tabChannels)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
         sizePolicy.setHorizontalStretch(0)
@@ -3646,17 +4355,16 @@ class SettingForm():
         font.setWeight(50)
         font.setKerning(False)
         parent.label_active.setFont(font)
-        parent.label_active.setAlignment(QtCore.Qt.AlignJustify | QtCore.Qt.AlignVCenter)
+        parent.label_active.setAlignment(QtCore.Qt.AlignJustify|QtCore.Qt.AlignVCenter)
         parent.label_active.setObjectName("label_active")
         parent.verticalLayout_active.addWidget(parent.label_active)
-
         parent.checkActive1 = QtWidgets.QCheckBox(parent.tabChannels)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
         sizePolicy.setHeightForWidth(parent.checkActive1.sizePolicy().hasHeightForWidth())
         parent.checkActive1.setSizePolicy(sizePolicy)
-        parent.checkActive1.setMinimumSize(QtCore.QSize(20,19))
+        parent.checkActive1.setMinimumSize(QtCore.QSize(20, 19))
         parent.checkActive1.setMaximumSize(QtCore.QSize(30, 16777215))
         parent.checkActive1.setLayoutDirection(QtCore.Qt.LeftToRight)
         parent.checkActive1.setStyleSheet("margin-left:7%; margin-right:7%;")
@@ -3664,8 +4372,6 @@ class SettingForm():
         parent.checkActive1.setChecked(True)
         parent.checkActive1.setObjectName("checkActive1")
         parent.verticalLayout_active.addWidget(parent.checkActive1)
-
-
         parent.checkActive2 = QtWidgets.QCheckBox(parent.tabChannels)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
@@ -3680,7 +4386,6 @@ class SettingForm():
         parent.checkActive2.setChecked(True)
         parent.checkActive2.setObjectName("checkActive2")
         parent.verticalLayout_active.addWidget(parent.checkActive2)
-        
         parent.checkActive3 = QtWidgets.QCheckBox(parent.tabChannels)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
@@ -3695,7 +4400,6 @@ class SettingForm():
         parent.checkActive3.setChecked(True)
         parent.checkActive3.setObjectName("checkActive3")
         parent.verticalLayout_active.addWidget(parent.checkActive3)
-
         parent.checkActive4 = QtWidgets.QCheckBox(parent.tabChannels)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
@@ -3710,7 +4414,6 @@ class SettingForm():
         parent.checkActive4.setChecked(True)
         parent.checkActive4.setObjectName("checkActive4")
         parent.verticalLayout_active.addWidget(parent.checkActive4)
-        
         parent.checkActive5 = QtWidgets.QCheckBox(parent.tabChannels)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
@@ -3725,7 +4428,6 @@ class SettingForm():
         parent.checkActive5.setChecked(True)
         parent.checkActive5.setObjectName("checkActive5")
         parent.verticalLayout_active.addWidget(parent.checkActive5)
-        
         parent.checkActive6 = QtWidgets.QCheckBox(parent.tabChannels)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
@@ -3740,7 +4442,6 @@ class SettingForm():
         parent.checkActive6.setChecked(True)
         parent.checkActive6.setObjectName("checkActive6")
         parent.verticalLayout_active.addWidget(parent.checkActive6)
-        
         parent.checkActive7 = QtWidgets.QCheckBox(parent.tabChannels)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
@@ -3755,7 +4456,6 @@ class SettingForm():
         parent.checkActive7.setChecked(True)
         parent.checkActive7.setObjectName("checkActive7")
         parent.verticalLayout_active.addWidget(parent.checkActive7)
-        
         parent.checkActive8 = QtWidgets.QCheckBox(parent.tabChannels)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
@@ -3770,7 +4470,6 @@ class SettingForm():
         parent.checkActive8.setChecked(True)
         parent.checkActive8.setObjectName("checkActive8")
         parent.verticalLayout_active.addWidget(parent.checkActive8)
-        
         parent.checkActive9 = QtWidgets.QCheckBox(parent.tabChannels)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
@@ -3785,7 +4484,6 @@ class SettingForm():
         parent.checkActive9.setChecked(True)
         parent.checkActive9.setObjectName("checkActive9")
         parent.verticalLayout_active.addWidget(parent.checkActive9)
-        
         parent.checkActive10 = QtWidgets.QCheckBox(parent.tabChannels)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
@@ -3800,7 +4498,6 @@ class SettingForm():
         parent.checkActive10.setChecked(True)
         parent.checkActive10.setObjectName("checkActive10")
         parent.verticalLayout_active.addWidget(parent.checkActive10)
-
         parent.checkActive11 = QtWidgets.QCheckBox(parent.tabChannels)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
@@ -3815,8 +4512,6 @@ class SettingForm():
         parent.checkActive11.setChecked(True)
         parent.checkActive11.setObjectName("checkActive11")
         parent.verticalLayout_active.addWidget(parent.checkActive11)
-
-
         parent.checkActive12 = QtWidgets.QCheckBox(parent.tabChannels)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
@@ -3831,7 +4526,6 @@ class SettingForm():
         parent.checkActive12.setChecked(True)
         parent.checkActive12.setObjectName("checkActive12")
         parent.verticalLayout_active.addWidget(parent.checkActive12)
-        
         parent.checkActive13 = QtWidgets.QCheckBox(parent.tabChannels)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
@@ -3846,7 +4540,6 @@ class SettingForm():
         parent.checkActive13.setChecked(True)
         parent.checkActive13.setObjectName("checkActive13")
         parent.verticalLayout_active.addWidget(parent.checkActive13)
-        
         parent.checkActive14 = QtWidgets.QCheckBox(parent.tabChannels)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
@@ -3861,6 +4554,64 @@ class SettingForm():
         parent.checkActive14.setChecked(True)
         parent.checkActive14.setObjectName("checkActive14")
         parent.verticalLayout_active.addWidget(parent.checkActive14)
+        parent.horizontalLayout_2.addLayout(parent.verticalLayout_active)
+        parent.gridLayout_3.addLayout(parent.horizontalLayout_2, 0, 0, 1, 1)
+        parent.horizontalLayout_channel_page = QtWidgets.QHBoxLayout()
+        parent.horizontalLayout_channel_page.setObjectName("horizontalLayout_channel_page")
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        parent.horizontalLayout_channel_page.addItem(spacerItem2)
+        parent.label_channel_page = QtWidgets.QLabel(parent.tabChannels)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(10)
+        parent.label_channel_page.setFont(font)
+        parent.label_channel_page.setObjectName("label_channel_page")
+        parent.horizontalLayout_channel_page.addWidget(parent.label_channel_page)
+        parent.channelPageSpinBox = QtWidgets.QSpinBox(parent.tabChannels)
+        parent.channelPageSpinBox.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.UnitedStates))
+        parent.channelPageSpinBox.setMinimum(1)
+        parent.channelPageSpinBox.setMaximum(1)
+        parent.channelPageSpinBox.setObjectName("channelPageSpinBox")
+        parent.horizontalLayout_channel_page.addWidget(parent.channelPageSpinBox)
+        parent.gridLayout_3.addLayout(parent.horizontalLayout_channel_page, 1, 0, 1, 1)
+        parent.tabWidget.addTab(parent.tabChannels, "")
+        parent.verticalLayout_16.addWidget(parent.tabWidget)
+        parent.gridLayout_8 = QtWidgets.QGridLayout()
+        parent.gridLayout_8.setObjectName("gridLayout_8")
+        spacerItem3 = QtWidgets.QSpacerItem(16777215, 10, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        parent.gridLayout_8.addItem(spacerItem3, 0, 0, 1, 1)
+        parent.buttonCancel = QtWidgets.QPushButton(parent.centralwidget)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.buttonCancel.setFont(font)
+        parent.buttonCancel.setFocusPolicy(QtCore.Qt.NoFocus)
+        parent.buttonCancel.setAutoFillBackground(False)
+        parent.buttonCancel.setAutoDefault(False)
+        parent.buttonCancel.setDefault(False)
+        parent.buttonCancel.setFlat(False)
+        parent.buttonCancel.setObjectName("buttonCancel")
+        parent.gridLayout_8.addWidget(parent.buttonCancel, 0, 1, 1, 1)
+        parent.buttonSave = QtWidgets.QPushButton(parent.centralwidget)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        parent.buttonSave.setFont(font)
+        parent.buttonSave.setFocusPolicy(QtCore.Qt.NoFocus)
+        parent.buttonSave.setAutoFillBackground(False)
+        parent.buttonSave.setAutoDefault(False)
+        parent.buttonSave.setDefault(False)
+        parent.buttonSave.setFlat(False)
+        parent.buttonSave.setObjectName("buttonSave")
+        parent.gridLayout_8.addWidget(parent.buttonSave, 0, 2, 1, 1)
+        parent.verticalLayout_16.addLayout(parent.gridLayout_8)
+        parent.gridLayout_2.addLayout(parent.verticalLayout_16, 0, 0, 1, 1)
+        parent.setCentralWidget(parent.centralwidget)
+
         self.retranslateUi(parent)
         parent.tabWidget.setCurrentIndex(0)
         QtCore.QMetaObject.connectSlotsByName(parent)
@@ -3874,8 +4625,12 @@ class SettingForm():
         parent.label_40.setText(_translate("parent", "Data Bits :"))
         parent.label_41.setText(_translate("parent", "Stop Bits :"))
         parent.label_42.setText(_translate("parent", "Port:"))
+        parent.portLineEdit.setToolTip(_translate("parent", "Serial port, or host[:port] of a Modbus TCP / RTU over TCP gateway."))
         parent.label_con_type.setText(_translate("parent", "Register Read Type:"))
-        parent.portLineEdit.setText("COM3")
+        parent.label_bus_ports.setText(_translate("parent", "Additional Ports:"))
+        parent.busPortsLineEdit.setPlaceholderText(_translate("parent", "COM4: 5, 6; COM5: 7"))
+        parent.busPortsLineEdit.setToolTip(_translate("parent", "Slave addresses (hex) read on other serial ports, polled concurrently with the main port."))
+        parent.label_transport.setText(_translate("parent", "Transport:"))
         parent.groupBox_5.setTitle(_translate("parent", "Plot Setting"))
         parent.label_43.setText(_translate("parent", "Left V Axis Label:"))
         parent.label_44.setText(_translate("parent", "Right V Axis Label:"))
@@ -3883,16 +4638,20 @@ class SettingForm():
         parent.label_46.setText(_translate("parent", "Plot Update Time Interval (s):"))
         parent.label_panelTimeInterval.setText(_translate("parent", "Panel Update Time Interval (s):"))
         parent.label_accurate_data.setText(_translate("parent", "Keep Accurate Data For (s):"))
-        # parent.scaleRangeLabel_2.setText(_translate("parent", "Scale Range:"))
+        parent.label_gui_refresh_rate.setText(_translate("parent", "GUI Refresh Rate (fps):"))
+        parent.label_acquisition_process.setText(_translate("parent", "Read In Separate Process:"))
         parent.CoreTempChannelLabel.setText(_translate("parent", "Core Temperature Channel:"))
         parent.pressureChannelLabel.setText(_translate("parent", "Pressure Channel:"))
-        # parent.pressureDropThresholdLabel_2.setText(_translate("parent", "Pressure Drop Threshold:"))
-        # parent.groupBox_6.setTitle(_translate("parent", "Google Drive"))
-        # parent.signinLabel.setText(_translate("parent", "Signed out."))
-        # parent.signinPushButton.setText(_translate("parent", "Sign in"))
+        parent.channelCountLabel.setText(_translate("parent", "Channel Count:"))
+        parent.compressionMaxGapLabel.setText(_translate("parent", "Compression Max Gap (s):"))
+        parent.compressionMaxGapDoubleSpinBox.setToolTip(_translate("parent", "Longest time between stored points of a compressed channel."))
         parent.filePathLabel.setText(_translate("parent", "Data Storage Folder:"))
-        parent.gdriveUpdateLabel.setText(_translate("parent", "GDrive Update Interval (s):"))
         parent.delimiterLabel.setText(_translate("parent", "CSV Delimiter:"))
+        parent.gdriveUpdateLabel.setText(_translate("parent", "GDrive Update Interval (s):"))
+        parent.csvFlushRowsLabel.setText(_translate("parent", "Cycle Log Flush Every (rows):"))
+        parent.csvFlushIntervalLabel.setText(_translate("parent", "Cycle Log Flush Interval (s):"))
+        parent.cycleDbPathLabel.setText(_translate("parent", "SQLite Cycle Database:"))
+        parent.cycleDbPathLineEdit.setPlaceholderText(_translate("parent", "optional, e.g. /home/pi/cycles.db"))
         parent.tabWidget.setTabText(parent.tabWidget.indexOf(parent.tabGeneral), _translate("parent", "General"))
         parent.label_47.setText(_translate("parent", "Channel"))
         parent.label_48.setText(_translate("parent", "CH 1:"))
@@ -3919,8 +4678,52 @@ class SettingForm():
         parent.label_out_low.setText(_translate("parent", "Out. Low Limit"))
         parent.label_out_high.setText(_translate("parent", "Out. High Limit"))
         parent.label_70.setText(_translate("parent", "Decimal"))
+        parent.label_period.setText(_translate("parent", "Period (s)"))
+        parent.label_compression.setText(_translate("parent", "Compression"))
+        parent.comboCompression1.setItemText(0, _translate("parent", "None"))
+        parent.comboCompression1.setItemText(1, _translate("parent", "Deadband"))
+        parent.comboCompression1.setItemText(2, _translate("parent", "Swinging Door"))
+        parent.comboCompression2.setItemText(0, _translate("parent", "None"))
+        parent.comboCompression2.setItemText(1, _translate("parent", "Deadband"))
+        parent.comboCompression2.setItemText(2, _translate("parent", "Swinging Door"))
+        parent.comboCompression3.setItemText(0, _translate("parent", "None"))
+        parent.comboCompression3.setItemText(1, _translate("parent", "Deadband"))
+        parent.comboCompression3.setItemText(2, _translate("parent", "Swinging Door"))
+        parent.comboCompression4.setItemText(0, _translate("parent", "None"))
+        parent.comboCompression4.setItemText(1, _translate("parent", "Deadband"))
+        parent.comboCompression4.setItemText(2, _translate("parent", "Swinging Door"))
+        parent.comboCompression5.setItemText(0, _translate("parent", "None"))
+        parent.comboCompression5.setItemText(1, _translate("parent", "Deadband"))
+        parent.comboCompression5.setItemText(2, _translate("parent", "Swinging Door"))
+        parent.comboCompression6.setItemText(0, _translate("parent", "None"))
+        parent.comboCompression6.setItemText(1, _translate("parent", "Deadband"))
+        parent.comboCompression6.setItemText(2, _translate("parent", "Swinging Door"))
+        parent.comboCompression7.setItemText(0, _translate("parent", "None"))
+        parent.comboCompression7.setItemText(1, _translate("parent", "Deadband"))
+        parent.comboCompression7.setItemText(2, _translate("parent", "Swinging Door"))
+        parent.comboCompression8.setItemText(0, _translate("parent", "None"))
+        parent.comboCompression8.setItemText(1, _translate("parent", "Deadband"))
+        parent.comboCompression8.setItemText(2, _translate("parent", "Swinging Door"))
+        parent.comboCompression9.setItemText(0, _translate("parent", "None"))
+        parent.comboCompression9.setItemText(1, _translate("parent", "Deadband"))
+        parent.comboCompression9.setItemText(2, _translate("parent", "Swinging Door"))
+        parent.comboCompression10.setItemText(0, _translate("parent", "None"))
+        parent.comboCompression10.setItemText(1, _translate("parent", "Deadband"))
+        parent.comboCompression10.setItemText(2, _translate("parent", "Swinging Door"))
+        parent.comboCompression11.setItemText(0, _translate("parent", "None"))
+        parent.comboCompression11.setItemText(1, _translate("parent", "Deadband"))
+        parent.comboCompression11.setItemText(2, _translate("parent", "Swinging Door"))
+        parent.comboCompression12.setItemText(0, _translate("parent", "None"))
+        parent.comboCompression12.setItemText(1, _translate("parent", "Deadband"))
+        parent.comboCompression12.setItemText(2, _translate("parent", "Swinging Door"))
+        parent.comboCompression13.setItemText(0, _translate("parent", "None"))
+        parent.comboCompression13.setItemText(1, _translate("parent", "Deadband"))
+        parent.comboCompression13.setItemText(2, _translate("parent", "Swinging Door"))
+        parent.comboCompression14.setItemText(0, _translate("parent", "None"))
+        parent.comboCompression14.setItemText(1, _translate("parent", "Deadband"))
+        parent.comboCompression14.setItemText(2, _translate("parent", "Swinging Door"))
+        parent.label_tolerance.setText(_translate("parent", "Tolerance"))
         parent.label_66.setText(_translate("parent", "Scale"))
-        parent.label_active.setText(_translate("parent", "Active"))
         parent.label_71.setText(_translate("parent", "Axis"))
         parent.comboAxis1.setItemText(0, _translate("parent", "L"))
         parent.comboAxis1.setItemText(1, _translate("parent", "R"))
@@ -3951,6 +4754,8 @@ class SettingForm():
         parent.comboAxis14.setItemText(0, _translate("parent", "L"))
         parent.comboAxis14.setItemText(1, _translate("parent", "R"))
         parent.label_72.setText(_translate("parent", "Color"))
+        parent.label_active.setText(_translate("parent", "Active"))
+        parent.label_channel_page.setText(_translate("parent", "Channels Page:"))
         parent.tabWidget.setTabText(parent.tabWidget.indexOf(parent.tabChannels), _translate("parent", "Channels"))
         parent.buttonCancel.setText(_translate("parent", "Cancel"))
         parent.buttonSave.setText(_translate("parent", "Save"))
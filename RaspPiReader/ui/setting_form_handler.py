@@ -9,7 +9,10 @@ from RaspPiReader import pool
 from .color_label import ColorLabel
 from .settingForm import SettingForm
 
-CHANNEL_COUNT = 14
+CHANNEL_COUNT = 14  # channels when no channel count is set, also the number of channel rows in the settings form
+MAX_CHANNEL_COUNT = 256
+# the channel rows' "CH n:" labels are label_48 .. label_61
+CHANNEL_ROW_LABEL_OFFSET = 47
 general_settings = {
     "baudrateComboBox": "baudrate",
     "parityComboBox": "parity",
@@ -17,20 +20,29 @@ general_settings = {
     "stopbitsComboBox": "stopbits",
     "readingaddrLineEdit": "reading_address",
     "conTypeComboBox": "register_read_type",
+    "transportComboBox": "transport",
     "portLineEdit": "port",
+    "busPortsLineEdit": "bus_ports",
     "editLeftVLabel": "left_v_label",
     "editRightVLabel": "right_v_label",
     "editHLabel": "h_label",
     "timeIntervalDoubleSpinBox": "time_interval",
     "panelTimeIntervalDoubleSpinBox": "panel_time_interval",
     "accurateTimeDoubleSpinBox": "accuarate_data_time",
+    "guiRefreshRateSpinBox": "gui_refresh_rate",
+    "acquisitionProcessCheckBox": "acquisition_process",
     "signinStatus": "signin_status",
     "signinEmail": "signin_email",
     "filePathLineEdit": "csv_file_path",
     "delimiterLineEdit": "csv_delimiter",
     "gdriveSpinBox": "gdrive_update_interval",
+    "csvFlushRowsSpinBox": "csv_flush_rows",
+    "csvFlushIntervalDoubleSpinBox": "csv_flush_interval",
+    "cycleDbPathLineEdit": "cycle_db_path",
     "CoreTempChannelSpinBox": "core_temp_channel",
     "pressureChannelSpinBox": "pressure_channel",
+    "channelCountSpinBox": "channel_count",
+    "compressionMaxGapDoubleSpinBox": "compression_max_gap",
 }
 
 channel_settings = {
@@ -42,6 +54,9 @@ channel_settings = {
     "editLimitLow": "limit_low",
     "editLimitHigh": "limit_high",
     "editDecPoint": "decimal_point",
+    "editPeriod": "sample_period",
+    "comboCompression": "compression",
+    "editTolerance": "compression_tolerance",
     "checkScale": "scale",
     "comboAxis": "axis_direction",
     "labelColor": "color",
@@ -53,6 +68,10 @@ channel_settings = {
 READ_INPUT_REGISTERS = "Read Input Registers"
 READ_HOLDING_REGISTERS = "Read Holding Registers"
 
+TRANSPORT_RTU = "RTU (Serial)"
+TRANSPORT_TCP = "Modbus TCP"
+TRANSPORT_RTU_OVER_TCP = "RTU over TCP"
+
 get_value_method_map = {
     QSpinBox: {
         "get": QSpinBox.value,
@@ -91,6 +110,11 @@ class SettingFormHandler(QMainWindow):
         self.form_obj = SettingForm()
         self.form_obj.setupUi(self)
         self.settings = QSettings('RaspPiHandler', 'RaspPiModbusReader')
+        # the channel rows show one page of CHANNEL_COUNT channels; values of the other pages are kept here
+        self.channel_page = None
+        self.channel_values = dict()
+        self.channel_defaults = {obj_name + str(row): self.get_val(obj_name + str(row))
+                                 for obj_name in channel_settings for row in range(1, CHANNEL_COUNT + 1)}
         self.set_connections()
         self.close_prompt = True
         self.setWindowModality(Qt.ApplicationModal)
@@ -100,14 +124,18 @@ class SettingFormHandler(QMainWindow):
     def set_connections(self):
         self.buttonSave.clicked.connect(self.save_and_close)
         self.buttonCancel.clicked.connect(self.close)
+        self.channelCountSpinBox.valueChanged.connect(self.set_channel_count)
+        self.channelPageSpinBox.valueChanged.connect(self.show_channel_page)
 
     def save_settings(self):
         for obj_name, key_name in general_settings.items():
             self.settings.setValue(key_name, self.get_val(obj_name))
 
-        for obj_name, key_name in channel_settings.items():
-            for i in range(1, CHANNEL_COUNT + 1):
-                self.settings.setValue(key_name + str(i), self.get_val(obj_name + str(i)))
+        self.store_channel_page()
+        channel_count = self.get_val('channelCountSpinBox')
+        for (key_name, channel), value in self.channel_values.items():
+            if channel <= channel_count:
+                self.settings.setValue(key_name + str(channel), value)
 
         self.write_to_device()
 
@@ -119,11 +147,47 @@ class SettingFormHandler(QMainWindow):
             if value != None:
                 self.set_val(obj_name, value)
 
-        for obj_name, key_name in channel_settings.items():
-            for i in range(1, CHANNEL_COUNT + 1):
-                value = self.settings.value(key_name + str(i))
-                if value != None:
-                    self.set_val(obj_name + str(i), value)
+        self.channel_page = None
+        self.channel_values = dict()
+        self.set_channel_count(self.get_val('channelCountSpinBox'))
+
+    def set_channel_count(self, channel_count):
+        pages = -(-channel_count // CHANNEL_COUNT)
+        self.channelPageSpinBox.setMaximum(pages)
+        self.channelPageSpinBox.setSuffix(f" / {pages}")
+        self.show_channel_page(self.channelPageSpinBox.value())
+
+    def page_channels(self, page):
+        """(row, channel) of the channel rows when showing page."""
+        return [(row, (page - 1) * CHANNEL_COUNT + row) for row in range(1, CHANNEL_COUNT + 1)]
+
+    def store_channel_page(self):
+        if self.channel_page is None:
+            return
+        for row, channel in self.page_channels(self.channel_page):
+            for obj_name, key_name in channel_settings.items():
+                self.channel_values[(key_name, channel)] = self.get_val(obj_name + str(row))
+
+    def show_channel_page(self, page):
+        self.store_channel_page()
+        self.channel_page = page
+        channel_count = self.get_val('channelCountSpinBox')
+        for row, channel in self.page_channels(page):
+            visible = channel <= channel_count
+            label = getattr(self, 'label_' + str(CHANNEL_ROW_LABEL_OFFSET + row))
+            label.setText(f"CH {channel}:")
+            label.setVisible(visible)
+            for obj_name, key_name in channel_settings.items():
+                getattr(self, obj_name + str(row)).setVisible(visible)
+                self.set_val(obj_name + str(row), self.channel_value(obj_name, key_name, row, channel))
+
+    def channel_value(self, obj_name, key_name, row, channel):
+        value = self.channel_values.get((key_name, channel))
+        if value is None:
+            value = self.settings.value(key_name + str(channel))
+        if value is None:
+            value = self.channel_defaults[obj_name + str(row)]
+        return value
 
     def load_connection_combo_boxes(self):
         self.baudrateComboBox.addItems(['9600', '19200', '38400', '56800', '115200'])
@@ -142,6 +206,10 @@ class SettingFormHandler(QMainWindow):
         self.conTypeComboBox.addItems([READ_HOLDING_REGISTERS,
                                        READ_INPUT_REGISTERS]),
 
+        self.transportComboBox.addItems([TRANSPORT_RTU,
+                                         TRANSPORT_TCP,
+                                         TRANSPORT_RTU_OVER_TCP])
+
 
     def get_val(self, name):
         if hasattr(self, name):
@@ -158,13 +226,14 @@ class SettingFormHandler(QMainWindow):
         return
 
     def write_to_device(self):
+        from RaspPiReader.libs.channel_plan import load_channel_count
         from RaspPiReader.libs.communication import dataReader
         try:
             dataReader.start()
         except Exception as e:
             print("Failed to start data reader or it is already started.\n" + str(e))
 
-        for ch in range(CHANNEL_COUNT):
+        for ch in range(load_channel_count()):
             if not pool.config('active' + str(ch + 1), bool):
                 continue
 
@@ -1,18 +1,24 @@
 import os
-from datetime import datetime, timedelta
-from threading import Thread, Lock
+from datetime import datetime
+from threading import Thread
 from time import sleep
 
-from PyQt5.QtCore import pyqtSignal, Qt, QTimer
+from PyQt5.QtCore import pyqtSignal, Qt
 from PyQt5.QtWidgets import QMainWindow
 
 from RaspPiReader import pool
+from RaspPiReader.libs.acquisition import CycleMetrics, CycleRecorder
+from RaspPiReader.libs.acquisition_process import ProcessAcquisition, acquisition_class
+from RaspPiReader.libs.channel_plan import ChannelPlan
+from RaspPiReader.libs.clock import clock
 from RaspPiReader.libs.communication import dataReader
-from RaspPiReader.libs.demo_data_reader import data as demo_data
-from RaspPiReader.ui.setting_form_handler import CHANNEL_COUNT
+from RaspPiReader.libs.compression import RowCompressor
+from RaspPiReader.libs.csv_writer import cycle_file_name
+from RaspPiReader.libs.sample_bus import SampleBus
 from RaspPiReader.ui.setting_form_handler import SettingFormHandler
 from .startCycleForm import StartCycleForm
 
+# the cycle info fields, by config key (csv_writer.CYCLE_INFO_KEYS)
 cycle_settings = {
     "orderNumberLineEdit": "order_id",
     "cycleIDLineEdit": "cycle_id",
@@ -44,33 +50,44 @@ class StartCycleFormHandler(QMainWindow):
         self.last_update_time = datetime.now()
         self.setWindowModality(Qt.ApplicationModal)
         self.load_cycle_data()
-        self.data_reader_lock = Lock()
+        self.data_reader_lock = dataReader.lock
+        # one acquisition producer feeds the panel preview and the cycle recording
+        self.sample_bus = SampleBus()
+        self.acquisition = None
+        self.read_thread = None
+        self.cycle_subscription = None
+        self.compressor = None
+        self.metrics = CycleMetrics()
+
+    @property
+    def core_temp_above_setpoint_time(self):
+        return self.metrics.core_temp_above_setpoint_time
+
+    @property
+    def pressure_drop_core_temp(self):
+        return self.metrics.pressure_drop_core_temp
 
     def set_connections(self):
         self.startPushButton.clicked.connect(self.start_cycle)
         self.startPushButton.clicked.connect(pool.get('main_form').update_cycle_info_pannel)
         self.cancelPushButton.clicked.connect(self.close)
-        self.data_updated_signal.connect(pool.get('main_form').update_data)
+        self.data_updated_signal.connect(pool.get('main_form').render_scheduler.request)
         self.test_data_updated_signal.connect(pool.get('main_form').update_immediate_test_values_panel)
         self.exit_with_error_signal.connect(pool.get('main_form').show_error_and_stop)
 
     def show(self):
-        try:
-            dataReader.stop()
-        except Exception as e:
-            pass
-        try:
-            dataReader.start()
-        except:
-            self.exit_with_error_signal.emit('Failed to connect to device.')
-            print('Failed to connect to device.')
+        self.cycle_start_time = clock.now()
+        self.running = True
+        self.channel_plan = ChannelPlan.from_config(pool.get('active_channels'))
+        self.subscribe_panel()
+        if not self.start_acquisition():
             return
-        self.run_test_read_thread()
         self.initiate_gdrive_update_thread()
         super().show()
 
     def close(self):
         self.running = False
+        self.stop_acquisition()
         super().close()
 
     def load_cycle_data(self):
@@ -79,195 +96,143 @@ class StartCycleFormHandler(QMainWindow):
             if value != None:
                 SettingFormHandler.set_val(self, obj_name, value)
 
-    def run_test_read_thread(self):
-        self.cycle_start_time = datetime.now()
-        dt = pool.config('panel_time_interval', float)
-        self.running = True
-        self.test_read_thread = Thread(target=StartCycleFormHandler.read_data,
-                                       args=(self, pool.get('test_data_stack'), self.test_data_updated_signal, dt,),
-                                       kwargs={'process_data': False})
-        self.test_read_thread.daemon = True
-        self.test_read_thread.start()
+    def start_acquisition(self):
+        """
+        (Re)start the acquisition producer at the shortest interval the sample bus subscribers ask for.
+        Returns False if the device could not be connected.
+        """
+        self.stop_acquisition(wait=True)
+        acquisition = acquisition_class()
+        if not pool.get('demo') and acquisition is not ProcessAcquisition:
+            try:
+                dataReader.stop()
+            except Exception as e:
+                pass
+            try:
+                dataReader.start()
+            except:
+                self.exit_with_error_signal.emit('Failed to connect to device.')
+                print('Failed to connect to device.')
+                return False
+        self.acquisition = acquisition(self.channel_plan, None,
+                                       self.sample_bus.producer_interval() or pool.config('time_interval', float),
+                                       clock.time(),
+                                       sample_sinks=(self.sample_bus.publish,),
+                                       lock=self.data_reader_lock)
+        self.read_thread = Thread(target=self.acquisition.run)
+        self.read_thread.daemon = True
+        self.read_thread.start()
+        return True
+
+    def stop_acquisition(self, wait=False):
+        if self.acquisition is not None:
+            self.acquisition.stop()
+            if wait:
+                self.read_thread.join()
+
+    def subscribe_panel(self):
+        self.sample_bus.close()
+        self.sample_bus.subscribe(self.show_panel_sample, pool.config('panel_time_interval', float), name='panel')
+
+    def show_panel_sample(self, row):
+        pool.get('test_data_stack').append(row)
+        self.test_data_updated_signal.emit()
 
     def initiate_gdrive_update_thread(self):
         self.gdrive_update_thread = Thread(target=self.gdrive_upload_loop)
         self.gdrive_update_thread.daemon = True
 
     def gdrive_upload_loop(self):
-        last_time = datetime.now()
+        last_time = clock.now()
         while self.running:
-            if (datetime.now()-last_time).total_seconds() >= pool.config('gdrive_update_interval', int):
+            if (clock.now() - last_time).total_seconds() >= pool.config('gdrive_update_interval', int):
                 pool.get('main_form')._sync_gdrive(upload_pdf=False, show_message=False, delete_existing=False)
-                last_time = datetime.now()
+                last_time = clock.now()
             sleep(3)
 
-    def initiate_reader_thread(self):
-        dt = pool.config('time_interval', float)
-        self.read_thread = Thread(target=StartCycleFormHandler.read_data,
-                                  args=(self, pool.get('data_stack'), self.data_updated_signal, dt))
-        self.read_thread.daemon = True
+    def subscribe_cycle_recorder(self, metrics_state=None):
+        self.metrics = CycleMetrics.from_config()
+        if metrics_state:
+            self.metrics.restore(metrics_state)
+        recorder = CycleRecorder(pool.get('data_stack'), self.cycle_start_time.timestamp(),
+                                 metrics=self.metrics,
+                                 sample_sinks=(pool.get('main_form').write_cycle_sample,),
+                                 on_sample=self.data_updated_signal.emit,
+                                 compressor=self.compressor)
+        self.cycle_subscription = self.sample_bus.subscribe(recorder, pool.config('time_interval', float),
+                                                            name='cycle')
+
+    def stop_cycle_recorder(self):
+        if self.cycle_subscription is not None:
+            self.sample_bus.unsubscribe(self.cycle_subscription)
+            # rows still held by the compressor
+            self.cycle_subscription.callback.flush()
+            self.cycle_subscription = None
 
     def save_cycle_data(self):
         for obj_name, key_name in cycle_settings.items():
             pool.set_config(key_name, SettingFormHandler.get_val(self, obj_name))
 
-        self.file_name = pool.config("order_id") \
-                         + self.cycle_start_time.strftime("  %Y.%m.%d  %H.%M.%S")
+        self.file_name = cycle_file_name(pool.config("order_id"), self.cycle_start_time)
         pool.get('main_form').folder_name = self.file_name
         self.folder_path = os.path.join(pool.config('csv_file_path'), self.file_name)
         os.makedirs(self.folder_path)
 
+    def restore_cycle(self, state, start_time):
+        """Take over the cycle info, files and metrics of an interrupted cycle (see cycle_journal)."""
+        for key_name, value in state['cycle_info'].items():
+            pool.set_config(key_name, value)
+        self.load_cycle_data()
+        self.cycle_start_time = datetime.fromtimestamp(start_time)
+        self.folder_path, log_name = os.path.split(state['log_path'])
+        self.file_name = os.path.splitext(log_name)[0]
+        pool.get('main_form').folder_name = self.file_name
+        self.metrics = CycleMetrics.from_config()
+        self.metrics.restore(state['metrics'] or {})
+
     def start_cycle(self):
-        self.cycle_start_time = datetime.now()
+        # a new wall-clock reading per cycle, the time may have been set since the app started
+        clock.anchor()
+        self.cycle_start_time = clock.now()
         self.save_cycle_data()
+        self.prepare_cycle()
+        pool.get('main_form').create_cycle_log()
+        self.run_cycle()
+
+    def resume_cycle(self, state, reader):
+        """Continue recording the interrupted cycle taken over by restore_cycle."""
+        clock.anchor()
+        self.prepare_cycle(reader)
+        pool.get('main_form').resume_cycle_log(state, reader)
+        self.subscribe_panel()
+        self.run_cycle(state['metrics'])
+
+    def prepare_cycle(self, reader=None):
+        """reader: CycleLogReader of a resumed cycle, whose log keeps the compression it was started with."""
+        self.channel_plan = ChannelPlan.from_config(pool.get('active_channels'))
+        if reader is None:
+            self.compressor = RowCompressor.from_config(self.channel_plan)
+        else:
+            self.compressor = RowCompressor.from_modes(reader.header['compression_modes'], reader.active_channels)
         main_form = pool.get('main_form')
         main_form.actionStart.setEnabled(False)
         main_form.actionStop.setEnabled(True)
         main_form.actionPlot_preview.setEnabled(True)
-        main_form.create_csv_file()
+
+    def run_cycle(self, metrics_state=None):
         self.running = True
         self.hide()
-        self.initiate_reader_thread()
+        self.subscribe_cycle_recorder(metrics_state)
+        # restarted for the cycle's channel plan and interval (and from the start of the demo data)
+        if not self.start_acquisition():
+            return
         self.initiate_gdrive_update_thread()
-        main_form.cycle_timer.start(500)
-        self.read_thread.start()
+        pool.get('main_form').cycle_timer.start(500)
         self.gdrive_update_thread.start()
 
     def stop_cycle(self):
-        self.cycle_end_time = datetime.now()
+        self.cycle_end_time = clock.now()
         pool.get('main_form').cycle_timer.stop()
         self.running = False
-
-    def read_data(self, data_stack, updated_signal, dt, process_data=True):
-        active_channels = pool.get('active_channels')
-        core_temp_channel = pool.config('core_temp_channel', int)
-        pressure_channel = pool.config('pressure_channel', int)
-        core_temp_setpoint = pool.config('core_temp_setpoint', int)
-        self.pressure_drop_core_temp = None
-        core_temp_above_setpoint_start_time = None
-        self.core_temp_above_setpoint_time = 0
-        pressure_drop_flag = False
-
-        if pool.get('demo'):
-            read_index = 0
-            n_data = len(demo_data)
-            while self.running and read_index < n_data:
-                iteration_start_time = datetime.now()
-                temp_arr = []
-                for i in range(CHANNEL_COUNT):
-                    if (i + 1) in active_channels:
-                        temp = float(demo_data[read_index][i])
-                    else:
-                        temp = 0.00
-                    temp_arr.append(temp)
-                read_index += 1
-
-                for i in range(CHANNEL_COUNT):
-                    data_stack[i + 1].append(temp_arr[i])
-                if process_data:
-                    data_stack[0].append(round((datetime.now() - self.cycle_start_time).total_seconds() / 60, 2))
-                    data_stack[15].append(datetime.now())
-                    if not core_temp_above_setpoint_start_time and \
-                            data_stack[core_temp_channel][-1] >= core_temp_setpoint:
-                        core_temp_above_setpoint_start_time = datetime.now()
-                    elif core_temp_above_setpoint_start_time and \
-                            data_stack[core_temp_channel][-1] < core_temp_setpoint:
-                        self.core_temp_above_setpoint_time += round((datetime.now() \
-                                                                     - core_temp_above_setpoint_start_time).total_seconds() / 60,
-                                                                    2)
-                        core_temp_above_setpoint_start_time = None
-
-                    if len(data_stack[0]) > 1 and \
-                            (data_stack[pressure_channel][-2] > data_stack[pressure_channel][-1]):
-                        if not pressure_drop_flag:
-                            self.pressure_drop_core_temp = data_stack[core_temp_channel][-2]
-                            pressure_drop_flag = True
-                    else:
-                        pressure_drop_flag = False
-
-                updated_signal.emit()
-                while (datetime.now() - iteration_start_time) < timedelta(seconds=0.001):
-                    sleep(0.0001)
-
-        else:
-            while self.running:
-                iteration_start_time = datetime.now()
-                temp_arr = []
-
-                self.data_reader_lock.acquire()
-                for i in range(CHANNEL_COUNT):
-                    if (i + 1) in active_channels:
-                        try:
-                            temp = dataReader.readData(
-                                int(pool.config('address' + str(i + 1)), 16),
-                                int(pool.config('pv' + str(i + 1)), 16)
-                            )
-                            if temp & 0x8000 > 0:
-                                temp = -((0xFFFF - temp) + 1)
-
-                            dec_point = pool.config('decimal_point' + str(i + 1), int)
-
-                            if dec_point > 0:
-                                temp = temp / pow(10, dec_point)
-
-                            if pool.config('scale' + str(i + 1), bool):
-                                input_low = pool.config('limit_low' + str(i + 1), float)
-                                input_high = pool.config('limit_high' + str(i + 1), float)
-
-                                if input_high >= input_low + 10 and temp >= input_low:
-                                    output_high = pool.config('max_scale_range' + str(i + 1), float)
-                                    output_low = pool.config('min_scale_range' + str(i + 1), float)
-                                    temp = (output_high - output_low) / (input_high - input_low) * (
-                                            temp - input_low) + output_low
-                                    temp = round(temp, dec_point)
-                        except Exception as e:
-                            print(f"Failed to read or process data from channel {i + 1}.\n" + str(e))
-                            try:
-                                print("Restarting data reader")
-                                dataReader.stop()
-                                dataReader.start()
-                                print('Restart successful')
-                            except Exception as e:
-                                print(f"Restart failed {i + 1}.\n" + str(e))
-
-                            temp = -1000.00
-                    else:
-                        temp = 0.00
-
-                    temp_arr.append(temp)
-
-                self.data_reader_lock.release()
-
-                for i in range(CHANNEL_COUNT):
-                    data_stack[i + 1].append(temp_arr[i])
-                if process_data:
-                    data_stack[0].append(round((datetime.now() - self.cycle_start_time).total_seconds() / 60, 2))
-                    data_stack[15].append(datetime.now())
-
-                    # if not self.core_temp_above_setpoint_time:
-                    if not core_temp_above_setpoint_start_time and \
-                            data_stack[core_temp_channel][-1] >= core_temp_setpoint:
-                        core_temp_above_setpoint_start_time = datetime.now()
-                    elif core_temp_above_setpoint_start_time and \
-                            data_stack[core_temp_channel][-1] < core_temp_setpoint:
-                        self.core_temp_above_setpoint_time += round((datetime.now() \
-                                                                     - core_temp_above_setpoint_start_time).total_seconds() / 60,
-                                                                    2)
-                        core_temp_above_setpoint_start_time = None
-
-                    if len(data_stack[0]) > 1 and \
-                            (data_stack[pressure_channel][-2] > data_stack[pressure_channel][-1]):
-                        if not pressure_drop_flag:
-                            self.pressure_drop_core_temp = data_stack[core_temp_channel][-2]
-                            pressure_drop_flag = True
-                    else:
-                        pressure_drop_flag = False
-
-                updated_signal.emit()
-                while (datetime.now() - iteration_start_time) < timedelta(seconds=dt):
-                    sleep(0.001)
-
-        try:
-            dataReader.stop()
-        except:
-            print('unable to stop data reader')
+        self.stop_acquisition(wait=True)
+        self.stop_cycle_recorder()
@@ -1,23 +1,34 @@
 import argparse
 import sys
 
-from PyQt5 import QtWidgets
 from RaspPiReader import pool
-from RaspPiReader.ui.main_form_handler import MainFormHandler
 
 
 def Main():
+    from PyQt5 import QtWidgets
+    from RaspPiReader.ui.main_form_handler import MainFormHandler
+
     app = QtWidgets.QApplication(sys.argv)
     main_form = MainFormHandler()
     app.exec_()
 
 
+def Headless():
+    from RaspPiReader.libs.headless import HeadlessRunner
+
+    HeadlessRunner().run()
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument('--debug', type=bool, default=False)
     parser.add_argument('--demo', type=bool, default=False)
+    parser.add_argument('--headless', action='store_true',
+                        help='run a cycle with the saved settings and cycle info, without the GUI')
     args = parser.parse_args()
     pool.set('debug', args.debug)
     pool.set('demo', args.demo)
-    Main()
-
+    if args.headless:
+        Headless()
+    else:
+        Main()
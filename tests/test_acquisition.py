@@ -0,0 +1,47 @@
+import importlib
+import os
+
+import pytest
+
+from RaspPiReader.libs.communication import DeviceError, ReadGroup
+from RaspPiReader.libs.device_health import DeviceHealth
+
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'RaspPiReader')
+
+
+@pytest.fixture
+def acquisition(monkeypatch):
+    # the demo data is read from the working directory on import
+    monkeypatch.chdir(PACKAGE_DIR)
+    return importlib.import_module('RaspPiReader.libs.acquisition')
+
+
+class Reader:
+    """Slave 2 does not answer."""
+
+    def __init__(self):
+        self.health = DeviceHealth(failure_threshold=2)
+        self.requests = []
+
+    def readGroup(self, group):
+        self.requests.append(group.dev)
+        if group.dev == 2:
+            raise DeviceError(f"Device {group.dev}: no response")
+        return {channel: 1 for channel, _ in group.channels}
+
+
+def group(dev, channel):
+    read_group = ReadGroup(dev, channel)
+    read_group.add(channel, channel)
+    return read_group
+
+
+def test_a_silent_slave_fails_once_per_scan(acquisition):
+    reader = Reader()
+    groups = [group(1, 1), group(2, 2), group(2, 200), group(2, 400), group(3, 3)]
+    assert acquisition.read_groups(reader, groups) == {1: 1, 3: 1}
+    # its other groups are skipped for the scan, and the circuit is not open after one scan
+    assert reader.requests == [1, 2, 3]
+    assert not reader.health.is_open(2)
+    acquisition.read_groups(reader, groups)
+    assert reader.health.is_open(2)
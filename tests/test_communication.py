@@ -0,0 +1,51 @@
+from pymodbus.exceptions import ConnectionException
+
+from RaspPiReader.libs import communication, transport
+from RaspPiReader.ui.setting_form_handler import READ_HOLDING_REGISTERS, TRANSPORT_TCP
+
+CONFIG = {'transport': TRANSPORT_TCP, 'port': '192.0.2.1:502', 'register_read_type': READ_HOLDING_REGISTERS}
+
+
+class Response:
+    registers = [7, 8]
+
+    def isError(self):
+        return False
+
+
+class FakeClient:
+    """A TCP client whose socket is dead when alive is False: every request fails."""
+
+    def __init__(self, alive):
+        self.alive = alive
+        self.closed = False
+
+    def connect(self):
+        return True
+
+    def is_socket_open(self):
+        return not self.closed
+
+    def close(self):
+        self.closed = True
+
+    def read_holding_registers(self, unit, address, count):
+        if not self.alive or self.closed:
+            raise ConnectionException("connection reset by peer")
+        return Response()
+
+
+def test_read_retries_on_a_new_connection(monkeypatch):
+    clients = [FakeClient(alive=False), FakeClient(alive=True)]
+    created = iter(clients)
+    monkeypatch.setattr(transport, 'create_client', lambda transport_, address: next(created))
+    monkeypatch.setattr(communication.pool, 'config', lambda key, return_type=str: CONFIG.get(key))
+    monkeypatch.setattr(transport, 'connection_pool', transport.ConnectionPool())
+    monkeypatch.setattr(communication, 'connection_pool', transport.connection_pool)
+
+    reader = communication.DataReader()
+    reader.start()
+    assert reader.readBlock(1, 0, 2) == [7, 8]
+    # the dead connection was dropped from the pool, the next reader gets the new one
+    assert clients[0].closed and reader.client is clients[1]
+    assert transport.connection_pool.get(TRANSPORT_TCP, CONFIG['port']) is clients[1]
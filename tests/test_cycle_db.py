@@ -0,0 +1,109 @@
+import numpy as np
+
+from RaspPiReader.libs.cycle_db import CycleDatabase, CycleDbWriter
+from RaspPiReader.libs.cycle_journal import FINISHED, RUNNING, state_path, write_state
+from RaspPiReader.libs.cycle_log import VERSION, CycleLogReader, CycleLogWriter
+
+START = 1700000000.0
+SAMPLES = [(START + i, [float(i), 10.0 + i]) for i in range(4)]
+
+
+def header():
+    return {
+        'version': VERSION,
+        'start_time': START,
+        'channel_labels': ['ch1', 'ch2'],
+        'active_channels': None,
+        'compression_modes': None,
+        'decimals': None,
+        'cycle': {'order_id': 'A1', 'cycle_id': '1', 'quantity': '2'},
+    }
+
+
+def write_cycle(tmp_path, status, metrics):
+    log_path = str(tmp_path / 'c.cyclelog')
+    log_header = header()
+    writer = CycleLogWriter(log_path, log_header)
+    writer.start()
+    for epoch, values in SAMPLES:
+        writer.write_sample(epoch, values)
+    writer.stop()
+    write_state(state_path(log_path), {'status': status, 'log_path': log_path, 'cycle_info': log_header['cycle'],
+                                       'metrics': metrics})
+    return log_path, log_header
+
+
+def test_writer_inserts_samples(tmp_path):
+    db_path = str(tmp_path / 'cycles.db')
+    log_header = header()
+    writer = CycleDbWriter.open_cycle(db_path, 'c', log_header, log_header['cycle'], flush_rows=2)
+    for epoch, values in SAMPLES:
+        writer.write_sample(epoch, values)
+    writer.finish(START + 3, {'core_temp_above_setpoint_time': 1.5})
+    database = CycleDatabase(db_path)
+    cycle = database.cycles()[0]
+    assert (cycle['end_time'], cycle['core_temp_above_setpoint_time']) == (START + 3, 1.5)
+    np.testing.assert_array_equal(database.samples(cycle['id'], 2)[1], [10, 11, 12, 13])
+
+
+def test_import_only_fills_in_what_is_missing(tmp_path):
+    db_path = str(tmp_path / 'cycles.db')
+    log_path, log_header = write_cycle(tmp_path, RUNNING, {'core_temp_above_setpoint_time': 9.0})
+    database = CycleDatabase(db_path)
+    cycle_id = database.add_cycle('c', START, log_header['channel_labels'], log_header['cycle'])
+    # the database got the first two samples, with a value the log does not hold, before the crash
+    database.connection.execute("INSERT INTO samples VALUES (?, ?, 1, 0.123456789)", (cycle_id, START))
+    database.connection.execute("INSERT INTO samples VALUES (?, ?, 1, 1)", (cycle_id, START + 1))
+    database.connection.commit()
+
+    database.import_cycle_log(log_path)
+    cycle = database.cycles()[0]
+    # a running cycle has no end yet
+    assert cycle['end_time'] is None and cycle['core_temp_above_setpoint_time'] is None
+    times, values = database.samples(cycle_id, 1)
+    np.testing.assert_array_equal(times, [START, START + 1, START + 2, START + 3])
+    np.testing.assert_array_equal(values, [0.123456789, 1, 2, 3])
+
+    write_state(state_path(log_path), {'status': FINISHED, 'log_path': log_path, 'cycle_info': log_header['cycle'],
+                                       'metrics': {'core_temp_above_setpoint_time': 9.0}})
+    database.connection.execute("UPDATE cycles SET core_temp_above_setpoint_time = 2.5")
+    database.connection.commit()
+    database.import_cycle_log(log_path)
+    cycle = database.cycles()[0]
+    assert (cycle['end_time'], cycle['core_temp_above_setpoint_time']) == (START + 3, 2.5)
+
+
+def test_resumed_cycle_gets_back_the_samples_lost_in_the_crash(tmp_path):
+    db_path = str(tmp_path / 'cycles.db')
+    log_path = str(tmp_path / 'c.cyclelog')
+    log_header = header()
+    cycle_log = CycleLogWriter(log_path, log_header)
+    cycle_db = CycleDbWriter.open_cycle(db_path, 'c', log_header, log_header['cycle'])
+    cycle_log.start()
+    for epoch, values in SAMPLES:
+        cycle_log.write_sample(epoch, values)
+    cycle_db.write_sample(*SAMPLES[0])
+    cycle_log.stop()
+    cycle_db.stop()
+    # crashed before the database got the last batches
+    write_state(state_path(log_path), {'status': RUNNING, 'log_path': log_path, 'cycle_info': log_header['cycle'],
+                                       'metrics': None})
+
+    reader = CycleLogReader(log_path)
+    reader.read()
+    cycle_log = CycleLogWriter(log_path, reader.header, append_at=reader.offset)
+    cycle_db = CycleDbWriter.open_cycle(db_path, 'c', reader.header, log_header['cycle'], log_path=log_path)
+    cycle_log.start()
+    for i in range(4, 6):
+        cycle_log.write_sample(START + i, [float(i), 10.0 + i])
+        cycle_db.write_sample(START + i, [float(i), 10.0 + i])
+    cycle_log.stop()
+    cycle_db.finish(START + 5)
+
+    records = CycleLogReader(log_path).read()
+    database = CycleDatabase(db_path)
+    cycle_id = database.cycles()[0]['id']
+    for channel in (1, 2):
+        times, values = database.samples(cycle_id, channel)
+        np.testing.assert_array_equal(times, records['epoch'])
+        np.testing.assert_array_equal(values, records['values'][:, channel - 1])
@@ -0,0 +1,125 @@
+import csv
+import math
+
+import numpy as np
+import pytest
+
+from RaspPiReader.libs.compression import DEADBAND, NONE, SWINGING_DOOR
+from RaspPiReader.libs.cycle_log import BLOCK, VERSION, CsvExporter, CycleLogReader, CycleLogWriter, MappedCycleLog
+from RaspPiReader.libs.decimation import MinMaxPyramid
+
+START = 1700000000.0
+
+
+def header(modes, decimals=None):
+    return {
+        'version': VERSION,
+        'start_time': START,
+        'channel_labels': [f"ch{i}" for i in range(1, len(modes) + 1)],
+        'active_channels': None,
+        'compression_modes': modes,
+        'decimals': decimals,
+        'cycle': {'order_id': 'A1', 'cycle_id': '1', 'quantity': '2'},
+    }
+
+
+def write_log(path, log_header, samples):
+    writer = CycleLogWriter(str(path), log_header, flush_rows=2)
+    writer.start()
+    for epoch, values in samples:
+        writer.write_sample(epoch, values)
+    writer.stop()
+
+
+def csv_values(path):
+    with open(path, newline='') as f:
+        rows = list(csv.reader(f))
+    start = next(i for i, row in enumerate(rows) if row[:3] == ['Date', 'Time', 'Timer(min)']) + 1
+    return [row[3:] for row in rows[start:]]
+
+
+def test_exported_csv_is_filled(tmp_path):
+    log_path, csv_path = tmp_path / 'c.cyclelog', tmp_path / 'c.csv'
+    nan = math.nan
+    samples = [
+        (START, [1.0, 10.0, 5.0]),
+        (START + 1, [nan, nan, nan]),
+        (START + 2, [2.0, nan, 7.0]),
+        (START + 3, [nan, 13.0, nan]),
+        (START + 4, [nan, nan, 9.0]),
+    ]
+    write_log(log_path, header([DEADBAND, SWINGING_DOOR, NONE]), samples)
+    exporter = CsvExporter(str(log_path), str(csv_path))
+    # rows after the last logged swinging door value wait for the next one
+    assert exporter.update() == 4
+    assert exporter.update(final=True) == 1
+    values = np.array(csv_values(csv_path), dtype=float)
+    np.testing.assert_allclose(values, [[1, 10, 5], [1, 11, 6], [2, 12, 7], [2, 13, 8], [2, 13, 9]])
+
+
+def test_exported_values_keep_their_decimals(tmp_path):
+    log_path, csv_path = tmp_path / 'c.cyclelog', tmp_path / 'c.csv'
+    write_log(log_path, header([NONE, NONE], decimals=[3, 1]), [(START, [123.456, 0.1]), (START + 1, [1e6 + 0.125, 2.5])])
+    CsvExporter(str(log_path), str(csv_path)).update(final=True)
+    assert csv_values(csv_path) == [['123.456', '0.1'], ['1000000.125', '2.5']]
+
+
+def test_logged_values_keep_full_precision(tmp_path):
+    log_path, csv_path = tmp_path / 'c.cyclelog', tmp_path / 'c.csv'
+    write_log(log_path, header([NONE]), [(START, [123456.789]), (START + 1, [0.1])])
+    CsvExporter(str(log_path), str(csv_path)).update(final=True)
+    assert csv_values(csv_path) == [['123456.789'], ['0.1']]
+
+
+def test_reader_rejects_unknown_versions(tmp_path):
+    log_path = tmp_path / 'c.cyclelog'
+    write_log(log_path, dict(header([NONE]), version=VERSION + 1), [(START, [1.0])])
+    with pytest.raises(ValueError):
+        CycleLogReader(str(log_path))
+
+
+def test_each_block_reports_the_state_of_its_last_sample(tmp_path):
+    states = []
+    writer = CycleLogWriter(str(tmp_path / 'c.cyclelog'), header([NONE]), flush_rows=2, on_flush=states.append)
+    writer.start()
+    for i in range(5):
+        writer.write_sample(START + i, [float(i)], {'rows': i + 1})
+    writer.stop()
+    assert states == [{'rows': 2}, {'rows': 4}, {'rows': 5}]
+
+
+def test_mapped_log_checks_blocks_as_they_are_read(tmp_path):
+    log_path = tmp_path / 'c.cyclelog'
+    write_log(log_path, header([NONE]), [(START + i, [float(i)]) for i in range(6)])
+    # corrupt the second of the three two-record blocks
+    reader = CycleLogReader(str(log_path))
+    data = bytearray(log_path.read_bytes())
+    data[reader.offset + 2 * BLOCK.size + 2 * reader.dtype.itemsize - 1] ^= 0xff
+    log_path.write_bytes(bytes(data))
+
+    cycle_log = MappedCycleLog(str(log_path))
+    assert len(cycle_log) == 6 and cycle_log.reader.skipped_blocks == 0
+    assert cycle_log[1][0] == 0.0 and cycle_log.reader.skipped_blocks == 0
+    values = cycle_log[1][:]
+    assert cycle_log.reader.skipped_blocks == 1
+    np.testing.assert_array_equal(values, [0, 1, np.nan, np.nan, 4, 5])
+    # the corrupt rows keep their place, at the time of the row before
+    np.testing.assert_array_equal(cycle_log[-1][:], START + np.array([0, 1, 1, 1, 4, 5]))
+    np.testing.assert_array_equal(cycle_log[1][[5, 0, -2]], [5, 0, 4])
+    assert cycle_log[-1].searchsorted(START + 1) == 1
+    assert cycle_log[-1].searchsorted(START + 1, side='right') == 4
+    assert cycle_log[-1].searchsorted(START + 9) == 6
+    cycle_log.close()
+
+
+def test_mapped_columns_decimate_like_arrays(tmp_path):
+    log_path = tmp_path / 'c.cyclelog'
+    values = np.sin(np.arange(1000) / 7.0)
+    write_log(log_path, header([NONE]), [(START + i, [value]) for i, value in enumerate(values)])
+    cycle_log = MappedCycleLog(str(log_path))
+    mapped, loaded = MinMaxPyramid(), MinMaxPyramid()
+    mapped.update(cycle_log[1])
+    loaded.update(values)
+    np.testing.assert_array_equal(mapped.envelope(10, 990, 50), loaded.envelope(10, 990, 50))
+    np.testing.assert_array_equal(cycle_log.latest(), [999 / 60, values[-1], START + 999])
+    cycle_log.close()
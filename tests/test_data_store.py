@@ -0,0 +1,16 @@
+import numpy as np
+
+from RaspPiReader.libs.data_store import SampleStore
+
+START = 1700000000.0
+
+
+def test_rows_appended_after_clear_get_a_process_time():
+    store = SampleStore(3, start_time=START)
+    for i in range(3):
+        store.append([np.nan, float(i), START + 60 * i])
+    np.testing.assert_array_equal(store[0], [0, 1, 2])
+    store.clear()
+    for i in range(3):
+        store.append([np.nan, float(i), START + 60 * (i + 5)])
+    np.testing.assert_array_equal(store[0], [5, 6, 7])
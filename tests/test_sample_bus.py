@@ -0,0 +1,50 @@
+import math
+
+import pytest
+
+from RaspPiReader.libs.sample_bus import SampleBus
+
+START = 1700000000.0
+
+
+def record(panel_interval, time_interval, duration):
+    """Timestamps delivered to the cycle subscription while the producer runs for duration seconds."""
+    bus = SampleBus()
+    bus.subscribe(lambda row: None, panel_interval, name='panel')
+    recorded = []
+    bus.subscribe(lambda row: recorded.append(row[-1]), time_interval, name='cycle')
+    producer_interval = bus.producer_interval()
+    for tick in range(int(round(duration / producer_interval)) + 1):
+        bus.publish([math.nan, float(tick), START + tick * producer_interval])
+    bus.close()
+    return producer_interval, recorded
+
+
+@pytest.mark.parametrize('panel_interval, time_interval', [(2.0, 5.0), (0.3, 1.0), (1.0, 5.0), (1.0, 1.0)])
+def test_recorded_timestamps_follow_time_interval(panel_interval, time_interval):
+    duration = 600.0
+    producer_interval, recorded = record(panel_interval, time_interval, duration)
+    assert producer_interval == min(panel_interval, time_interval)
+    # one row per time_interval, none skipped or doubled, and no drift from the cycle's grid
+    assert len(recorded) == int(duration / time_interval) + 1
+    for n, timestamp in enumerate(recorded):
+        assert abs(timestamp - (START + n * time_interval)) <= producer_interval / 2 + 1e-6
+
+
+def test_exact_multiple_is_recorded_on_the_grid():
+    _, recorded = record(1.0, 5.0, 60.0)
+    assert recorded == [START + n * 5.0 for n in range(13)]
+
+
+def test_skipped_rows_fill_unsampled_channels():
+    bus = SampleBus()
+    delivered = []
+    bus.subscribe(delivered.append, 2.0)
+    bus.producer_interval()
+    bus.subscribe(lambda row: None, 1.0)
+    bus.producer_interval()
+    bus.publish([math.nan, 1.0, math.nan, START])
+    bus.publish([math.nan, 2.0, 7.0, START + 1])
+    bus.publish([math.nan, 3.0, math.nan, START + 2])
+    bus.close()
+    assert [row[1:] for row in delivered] == [[1.0, math.nan, START], [3.0, 7.0, START + 2]]
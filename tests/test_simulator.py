@@ -0,0 +1,119 @@
+import socket
+import struct
+from threading import Thread
+
+from RaspPiReader.libs.simulator import (ILLEGAL_DATA_ADDRESS, ILLEGAL_DATA_VALUE, ILLEGAL_FUNCTION,
+                                         READ_HOLDING_REGISTERS, READ_INPUT_REGISTERS, SLAVE_DEVICE_FAILURE,
+                                         WRITE_REGISTER, Profile, RtuStream, Simulator, TcpServer, VirtualSlave,
+                                         crc16)
+
+SLAVE = 1
+# every register reads 12.3 with one implied decimal place
+PROFILE = Profile('constant', base=12.3, decimals=1)
+
+
+def rtu_request(unit, function, *words):
+    body = struct.pack('>BB%dH' % len(words), unit, function, *words)
+    return body + crc16(body)
+
+
+def simulator(**faults):
+    return Simulator([VirtualSlave(SLAVE, PROFILE, **faults)])
+
+
+def test_crc16_matches_the_modbus_reference():
+    assert rtu_request(1, READ_HOLDING_REGISTERS, 0, 10)[-2:] == bytes([0xC5, 0xCD])
+
+
+def test_read_registers():
+    sim = simulator()
+    for function in (READ_HOLDING_REGISTERS, READ_INPUT_REGISTERS):
+        response = sim.handle_rtu(rtu_request(SLAVE, function, 0x10, 3))
+        assert crc16(response[:-2]) == response[-2:]
+        assert response[:-2] == struct.pack('>BBB3H', SLAVE, function, 6, 123, 123, 123)
+    assert sim.stats() == {SLAVE: 2}
+
+
+def test_written_registers_keep_their_value():
+    sim = simulator()
+    request = rtu_request(SLAVE, WRITE_REGISTER, 0x10, 500)
+    assert sim.handle_rtu(request) == request
+    response = sim.handle_rtu(rtu_request(SLAVE, READ_HOLDING_REGISTERS, 0x0F, 2))
+    assert struct.unpack('>2H', response[3:-2]) == (123, 500)
+
+
+def test_exception_responses():
+    sim = simulator()
+    cases = [
+        (rtu_request(SLAVE, READ_HOLDING_REGISTERS, 0, 0), READ_HOLDING_REGISTERS, ILLEGAL_DATA_VALUE),
+        (rtu_request(SLAVE, READ_INPUT_REGISTERS, 0xFFFF, 2), READ_INPUT_REGISTERS, ILLEGAL_DATA_ADDRESS),
+        (rtu_request(SLAVE, 0x2B, 0, 1), 0x2B, ILLEGAL_FUNCTION),
+    ]
+    for request, function, code in cases:
+        assert sim.handle_rtu(request)[1:-2] == bytes([function | 0x80, code])
+
+
+def test_unanswered_requests():
+    sim = simulator()
+    request = rtu_request(SLAVE, READ_HOLDING_REGISTERS, 0, 1)
+    # a garbled request and an unknown address get no answer, as on a real line
+    assert sim.handle_rtu(request[:-1] + bytes([request[-1] ^ 0xFF])) is None
+    assert sim.handle_rtu(rtu_request(SLAVE + 1, READ_HOLDING_REGISTERS, 0, 1)) is None
+    assert sim.stats() == {SLAVE: 0}
+
+
+def test_injected_faults():
+    request = rtu_request(SLAVE, READ_HOLDING_REGISTERS, 0, 1)
+    silent = simulator(timeout_rate=1.0)
+    assert silent.handle_rtu(request) is None and silent.stats() == {SLAVE: 1}
+    response = simulator(crc_error_rate=1.0).handle_rtu(request)
+    assert response[:-2] == struct.pack('>BBBH', SLAVE, READ_HOLDING_REGISTERS, 2, 123)
+    assert crc16(response[:-2]) != response[-2:]
+    response = simulator(exception_rate=1.0).handle_rtu(request)
+    assert response[1:-2] == bytes([READ_HOLDING_REGISTERS | 0x80, SLAVE_DEVICE_FAILURE])
+
+
+def test_rtu_stream_splits_frames_and_drops_garbage():
+    stream = RtuStream()
+    request = rtu_request(SLAVE, READ_HOLDING_REGISTERS, 0, 1)
+    assert stream.feed(request[:3]) == []
+    assert stream.feed(request[3:] + request) == [request, request]
+    # an unknown function code cannot be framed, the buffer starts over
+    assert stream.feed(bytes([SLAVE, 0x2B, 0])) == []
+    assert stream.feed(request) == [request]
+
+
+def serve(sim, rtu=False):
+    server = TcpServer(sim, ('127.0.0.1', 0), rtu)
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_modbus_tcp():
+    server = serve(simulator())
+    try:
+        with socket.create_connection(server.server_address, timeout=5) as connection:
+            connection.sendall(struct.pack('>HHHBBHH', 7, 0, 6, SLAVE, READ_HOLDING_REGISTERS, 0, 2))
+            assert connection.recv(1024) == struct.pack('>HHHBBB2H', 7, 0, 7, SLAVE, READ_HOLDING_REGISTERS, 4,
+                                                        123, 123)
+        # a corrupted answer is sent truncated, Modbus TCP has no CRC
+        server.simulator.slaves[SLAVE].crc_error_rate = 1.0
+        with socket.create_connection(server.server_address, timeout=5) as connection:
+            connection.sendall(struct.pack('>HHHBBHH', 8, 0, 6, SLAVE, READ_HOLDING_REGISTERS, 0, 2))
+            assert connection.recv(1024) == struct.pack('>HHHBBB', 8, 0, 3, SLAVE, READ_HOLDING_REGISTERS, 4)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_rtu_over_tcp():
+    server = serve(simulator(), rtu=True)
+    try:
+        with socket.create_connection(server.server_address, timeout=5) as connection:
+            connection.sendall(rtu_request(SLAVE, READ_INPUT_REGISTERS, 0, 1))
+            response = connection.recv(1024)
+        assert response[:-2] == struct.pack('>BBBH', SLAVE, READ_INPUT_REGISTERS, 2, 123)
+        assert crc16(response[:-2]) == response[-2:]
+    finally:
+        server.shutdown()
+        server.server_close()